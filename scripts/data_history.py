@@ -0,0 +1,113 @@
+#!/bin/env python3
+#-----------------------------------------------------------------------------
+# Project : KeyV
+# File    : data_history.py
+# Author  : Mickael Fiorentino <mickael.fiorentino@polymtl.ca>
+# Lab     : GRM - Polytechnique Montreal
+# Date    : <2026-10-17 Sat>
+# Brief   : Archive csv summaries, plot trends & check for regressions
+#-----------------------------------------------------------------------------
+# [tcsh]% source setup.csh
+# [tcsh]% ./scripts/data_history.py ingest [--rev REV] [--time EPOCH]
+# [tcsh]% ./scripts/data_history.py trend METRIC [--bench B] [--processors P ...]
+# [tcsh]% ./scripts/data_history.py check METRIC [--bench B] [--days N] [--threshold PCT]
+#
+# Results are archived in $KEYV_DATA/history.db (see kvlib/history.py). For
+# example, the DMIPS/mW regressions of more than 3% vs. last week:
+#   ./scripts/data_history.py check SCORE-MW --bench dhrystone --days 7 --threshold 3
+# check exits with status 1 if any processor regressed.
+#-----------------------------------------------------------------------------
+import os
+import sys
+import time
+import argparse
+import numpy as np
+import data_plots as dp
+from kvlib import history
+
+def PlotTrend (db_f, figname, metric, bench, processors):
+    """Plot <metric> of <processors> (all if empty) over the archived runs"""
+
+    dp.InitPlots()
+    plt = dp.plt
+    import matplotlib.dates as mdates
+
+    with history.History(db_f) as hist:
+        procs  = processors or hist.processors(metric, bench)
+        trends = [(p,) + hist.trend(p, metric, bench) for p in procs]
+
+    fig = plt.figure(figsize=(dp.config.fig_size[0] * 2, dp.config.fig_size[1]))
+    ax  = plt.subplot(111)
+    ax.set_title('{}{}'.format(metric, ' ({})'.format(bench) if bench else ''),
+                 fontdict={'fontsize':dp.config.font_size_title})
+    ax.tick_params(axis='both', labelsize=dp.config.font_size_label)
+    ax.grid(True, color='lightgrey', ls=':', zorder=0)
+
+    colors = dp.cmap_civ(np.linspace(0.1, 0.9, max(len(trends), 1)))
+    for (proc, ts, val, revs), color in zip(trends, colors):
+        dates = ts.astype('datetime64[s]')
+        ax.plot(dates, val, marker='o', ms=3, color=color, alpha=dp.config.alpha_dark, label=proc, zorder=3)
+
+    ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(ax.xaxis.get_major_locator()))
+    ax.legend(loc='best', fontsize=dp.config.font_size_label)
+    dp.SaveFig(figname)
+
+#-----------------------------------------------------------------------------
+#
+#                                  MAIN
+#
+#-----------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    # Verify the environment
+    try: os.environ['KEYV_HOME']
+    except KeyError:
+        print("Setup the environment with setup.csh prior to running this script")
+        raise
+
+    parser = argparse.ArgumentParser(description='Archive csv summaries, plot trends & check for regressions')
+    sub    = parser.add_subparsers(dest='command', required=True)
+
+    p = sub.add_parser('ingest', help='Archive the current csv summaries')
+    p.add_argument('--rev', help='Git revision (default: HEAD of $KEYV_HOME)')
+    p.add_argument('--time', type=float, help='Run timestamp, seconds since epoch (default: summaries mtime)')
+
+    p = sub.add_parser('trend', help='Plot a metric over the archived runs')
+    p.add_argument('metric', help='Metric (csv column, SCORE, SCORE-MW, SLACK-SETUP-MIN...)')
+    p.add_argument('--bench', default='', help='Benchmark (none for area & STA metrics)')
+    p.add_argument('--processors', nargs='*', default=[], help='Processors (default: all)')
+
+    p = sub.add_parser('check', help='Report processors whose metric regressed')
+    p.add_argument('metric', help='Metric (csv column, SCORE, SCORE-MW, SLACK-SETUP-MIN...)')
+    p.add_argument('--bench', default='', help='Benchmark (none for area & STA metrics)')
+    p.add_argument('--days', type=float, default=7, help='Compare with the last run N days before (default: 7)')
+    p.add_argument('--threshold', type=float, default=3, help='Regression threshold in %% (default: 3)')
+    p.add_argument('--lower-is-better', action='store_true', help='e.g. power or area metrics')
+    args = parser.parse_args()
+
+    data = os.getenv('KEYV_DATA')
+    db_f = os.path.join(data, history.DB_NAME)
+
+    if args.command == 'ingest':
+        with history.History(db_f) as hist:
+            run = hist.ingest(data, args.time, args.rev)
+            print("Archived run {} ({} runs)".format(run, len(hist)) if run else "Nothing new to archive")
+
+    elif args.command == 'trend':
+        name    = 'trend_{}{}.{}'.format(args.metric, '_' + args.bench if args.bench else '', dp.config.fig_ext)
+        figname = os.path.join(data, name)
+        PlotTrend(db_f, figname, args.metric, args.bench, args.processors)
+        print("Updated: {}".format(figname))
+
+    elif args.command == 'check':
+        with history.History(db_f) as hist:
+            regs = hist.regressions(args.metric, args.bench, args.days * 24 * 3600,
+                                    args.threshold / 100, not args.lower_is_better)
+        for proc, change, last, ref in regs:
+            print("Regression: {} {} {:+.2f}% ({:.4g} @ {} {} vs. {:.4g} @ {} {})".format(
+                proc, args.metric, 100 * change,
+                last[1], time.strftime('%Y-%m-%d', time.localtime(last[0])), last[2][:8],
+                ref[1], time.strftime('%Y-%m-%d', time.localtime(ref[0])), ref[2][:8]))
+        if regs:
+            sys.exit(1)
+        print("No regression of {}".format(args.metric))
@@ -0,0 +1,51 @@
+#!/bin/env python3
+#-----------------------------------------------------------------------------
+# Project : KeyV
+# File    : data_parse.py
+# Author  : Mickael Fiorentino <mickael.fiorentino@polymtl.ca>
+# Lab     : GRM - Polytechnique Montreal
+# Date    : <2026-10-17 Sat>
+# Brief   : Converts post-synthesis + simulation results into csv tables
+#           (Python replacement of data_parse.tcl)
+#-----------------------------------------------------------------------------
+# [tcsh]% source setup.csh
+# [tcsh]% ./scripts/data_parse.py [--jobs N] [--check DIR] [core ...]
+#
+# --check compares the csv outputs with those of data_parse.tcl in DIR.
+#-----------------------------------------------------------------------------
+import os
+import sys
+import argparse
+from kvlib.parse import cores
+
+#-----------------------------------------------------------------------------
+#
+#                                  MAIN
+#
+#-----------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    # Verify the environment
+    try: os.environ['KEYV_HOME']
+    except KeyError:
+        print("Setup the environment with setup.csh prior to running this script")
+        raise
+
+    parser = argparse.ArgumentParser(description='Parse area, power, timing & simulation reports')
+    parser.add_argument('cores', nargs='*', default=cores.CORES,
+                        help='Processors to parse (default: {})'.format(' '.join(cores.CORES)))
+    parser.add_argument('-j', '--jobs', type=int, default=0,
+                        help='Number of parsing processes (0: one per cpu)')
+    parser.add_argument('--check', metavar='DIR',
+                        help='Compare the csv outputs with those of data_parse.tcl in DIR')
+    args = parser.parse_args()
+
+    cores.parse_all(args.cores, os.environ['KEYV_DATA'], args.jobs)
+
+    if args.check:
+        diffs = cores.compare(args.cores, os.environ['KEYV_DATA'], args.check)
+        for d in diffs:
+            print("Mismatch: {}".format(d))
+        if diffs:
+            sys.exit(1)
+        print("Outputs match {}".format(args.check))
@@ -0,0 +1,171 @@
+#!/bin/env python3
+#-----------------------------------------------------------------------------
+# Project : KeyV
+# File    : data_paths.py
+# Author  : Mickael Fiorentino <mickael.fiorentino@polymtl.ca>
+# Lab     : GRM - Polytechnique Montreal
+# Date    : <2026-10-17 Sat>
+# Brief   : Path-level timing of the KeyRing: worst paths, histograms & heatmaps
+#-----------------------------------------------------------------------------
+# [tcsh]% source setup.csh
+# [tcsh]% ./scripts/data_paths.py index [CORE ...]
+# [tcsh]% ./scripts/data_paths.py worst CORE [-n N] [--click F0] [--kind setup|hold]
+# [tcsh]% ./scripts/data_paths.py plot [CORE ...] [--bins N]
+#
+# Every path of $KEYV_DATA/<core>/<core>.timing.rpt is indexed by capture
+# click (see kvlib/paths.py), once: the index is cached next to the report.
+# plot renders, for each core, the slack histograms of each click in
+# $KEYV_DATA/<core>.slack_hist.<ext> and the worst setup & hold slack of each
+# click on the KeyRing torus (stages around, EUs outwards) in
+# $KEYV_DATA/<core>.slack_torus.<ext>.
+#-----------------------------------------------------------------------------
+import os
+import time
+import argparse
+import numpy as np
+import data_plots as dp
+from kvlib import paths
+from kvlib import render
+from kvlib.parse import cores
+
+def LoadPaths (data, core):
+    """Returns the PathIndex of the timing report of <core>"""
+
+    return paths.load_paths(cores.core_path(data, cores.STA_RPT, core), cores.KEYRINGS[core])
+
+def PlotHistograms (data, core, bins=40):
+    """Plot the setup & hold slack histograms of each click of <core>"""
+
+    dp.InitPlots()
+    plt   = dp.plt
+    index = LoadPaths(data, core)
+    hists = [index.histogram(bins, kind) for kind in (paths.SETUP, paths.HOLD)]
+
+    fig, axes = plt.subplots(index.E, index.S, sharex=True, sharey=True, squeeze=False,
+                             figsize=(2 * index.S + 1, 1.5 * index.E + 1))
+    fig.suptitle('{}: slack per click ({} paths)'.format(core, len(index)), fontsize=dp.config.font_size_title)
+    for (count, edges), color, label in zip(hists, [dp.cmap_civ(0.2), dp.cmap_vir(0.6)], ['Setup', 'Hold']):
+        for e in range(index.E):
+            for s in range(index.S):
+                ax = axes[e][s]
+                ax.stairs(count[e, s], edges, color=color, fill=True, alpha=dp.config.alpha_light,
+                          label=label if (e, s) == (0, 0) else None)
+                ax.set_title(index.labels[e, s], fontsize=dp.config.font_size_label - 2)
+                ax.axvline(0, color='grey', ls=':', lw=0.8)
+                ax.tick_params(axis='both', labelsize=dp.config.font_size_label - 4)
+
+    for ax in axes[-1]:
+        ax.set_xlabel('slack (ns)', fontsize=dp.config.font_size_label - 2)
+    fig.legend(loc='upper right', fontsize=dp.config.font_size_label)
+    fig.tight_layout(rect=(0, 0, 1, 0.95))
+    dp.SaveFig(os.path.join(data, '{}.slack_hist.{}'.format(core, dp.config.fig_ext)))
+
+def PlotTorus (data, core):
+    """Plot the worst setup & hold slack of each click of <core> on the KeyRing torus"""
+
+    dp.InitPlots()
+    plt   = dp.plt
+    from matplotlib.colors import TwoSlopeNorm
+    index = LoadPaths(data, core)
+    worst = [index.worst(paths.SETUP), index.worst(paths.HOLD)]
+
+    # Stages are sectors (the ring wraps around), EUs are rings (the torus wraps outwards).
+    # Sectors are split so that the mesh follows the circles
+    sub   = 16
+    theta = np.linspace(0, 2 * np.pi, index.S * sub + 1)
+    r     = np.arange(index.E + 1) + 1
+    lim   = max(np.nanmax(np.abs(w)) for w in worst if np.isfinite(w).any())
+    norm  = TwoSlopeNorm(0, -lim, lim)
+
+    fig = plt.figure(figsize=(2 * dp.config.fig_size[0], dp.config.fig_size[1]))
+    fig.suptitle('{}: worst slack per click (ns)'.format(core), fontsize=dp.config.font_size_title)
+    for i, (w, title) in enumerate(zip(worst, ['Setup', 'Hold'])):
+        ax = plt.subplot(1, 2, i + 1, projection='polar')
+        ax.set_title(title, fontdict={'fontsize':dp.config.font_size_title})
+        mesh = ax.pcolormesh(theta, r, np.ma.masked_invalid(np.repeat(w, sub, axis=1)), cmap='RdYlGn', norm=norm)
+        ax.vlines(theta[::sub], 1, index.E + 1, color='white', lw=1)
+        ax.set_rgrids(r, labels=[])
+        ax.grid(True, axis='y', color='white', lw=1)
+        for e in range(index.E):
+            for s in range(index.S):
+                ax.text(theta[s * sub + sub // 2], e + 1.5,
+                        '{}\n{:.2f}'.format(index.labels[e, s], w[e, s]) if np.isfinite(w[e, s])
+                        else index.labels[e, s], ha='center', va='center',
+                        fontsize=dp.config.font_size_label - 4)
+        ax.set_xticks([])
+        ax.set_ylim(0, index.E + 1)
+        ax.spines['polar'].set_visible(False)
+
+    fig.colorbar(mesh, ax=fig.axes, shrink=0.7)
+    dp.SaveFig(os.path.join(data, '{}.slack_torus.{}'.format(core, dp.config.fig_ext)))
+
+#-----------------------------------------------------------------------------
+#
+#                                  MAIN
+#
+#-----------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    # Verify the environment
+    try: os.environ['KEYV_HOME']
+    except KeyError:
+        print("Setup the environment with setup.csh prior to running this script")
+        raise
+
+    keyv   = list(cores.KEYRINGS)
+    parser = argparse.ArgumentParser(description='Path-level timing of the KeyRing')
+    sub    = parser.add_subparsers(dest='command', required=True)
+
+    p = sub.add_parser('index', help='Index (or load) the timing paths of the cores')
+    p.add_argument('cores', nargs='*', help='Cores among {} (default: all)'.format(', '.join(keyv)))
+
+    p = sub.add_parser('worst', help='Print the paths of least slack')
+    p.add_argument('core', choices=keyv, help='Core')
+    p.add_argument('-n', type=int, default=10, help='Number of paths (default: 10)')
+    p.add_argument('--click', help='Capture click only (e.g. F0)')
+    p.add_argument('--kind', choices=paths.KINDS, help='Setup or hold paths only (default: both)')
+
+    p = sub.add_parser('plot', help='Slack histograms per click & worst slack on the KeyRing torus')
+    p.add_argument('cores', nargs='*', help='Cores among {} (default: all)'.format(', '.join(keyv)))
+    p.add_argument('--bins', type=int, default=40, help='Histogram bins (default: 40)')
+    p.add_argument('-j', '--jobs', type=int, default=1, help='Number of rendering processes (0: one per cpu)')
+    args = parser.parse_args()
+
+    data = os.getenv('KEYV_DATA')
+
+    for core in getattr(args, 'cores', None) or []:
+        if core not in keyv:
+            parser.error("{} is not a KeyV core ({})".format(core, ', '.join(keyv)))
+
+    if args.command == 'index':
+        for core in args.cores or keyv:
+            t0    = time.perf_counter()
+            index = LoadPaths(data, core)
+            print("{}: {} paths, {}x{} clicks ({:.2f} s)".format(core, len(index), index.E, index.S,
+                                                              time.perf_counter() - t0))
+
+    elif args.command == 'worst':
+        index = LoadPaths(data, args.core)
+        kind  = paths.KINDS.index(args.kind) if args.kind else None
+        click = None
+        if args.click:
+            pos = np.argwhere(index.labels == args.click)
+            if not len(pos):
+                parser.error("unknown click {} (e.g. {})".format(args.click, index.labels[0, 0]))
+            click = tuple(pos[0])
+        rows = index.critical(args.n, kind, *(click or (None, None)))
+        print('{:>8s} {:>8s} {:<6s} {:<6s} {:<7s} {:<6s} {}'.format(
+            'SLACK', 'ARRIVAL', 'LAUNCH', 'CAPT', 'KIND', 'DIR', 'START -> END'))
+        for i in rows:
+            p = index.describe(i)
+            print('{slack:8.3f} {arrival:8.3f} {launch:<6s} {capture:<6s} {kind:<7s} {dir:<6s} '
+                  '{start} -> {end}'.format(**p))
+
+    elif args.command == 'plot':
+        jobs = []
+        for core in args.cores or keyv:
+            jobs += [(core + '.slack_hist', PlotHistograms, (data, core, args.bins)),
+                     (core + '.slack_torus', PlotTorus, (data, core))]
+        render.render(jobs, args.jobs)
+        for name, _, _ in jobs:
+            print("Updated: {}".format(os.path.join(data, name + '.' + dp.config.fig_ext)))
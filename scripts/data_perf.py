@@ -0,0 +1,255 @@
+#!/bin/env python3
+#-----------------------------------------------------------------------------
+# Project : KeyV
+# File    : data_perf.py
+# Author  : Mickael Fiorentino <mickael.fiorentino@polymtl.ca>
+# Lab     : GRM - Polytechnique Montreal
+# Date    : <2026-10-17 Sat>
+# Brief   : Performance benchmarks of the parsing & plotting pipeline
+#-----------------------------------------------------------------------------
+# [tcsh]% source setup.csh
+# [tcsh]% ./scripts/data_perf.py [-n N] [-m M] [-k K] [--repeat R] [--save] [--threshold PCT]
+#
+# Synthetic reports & summaries of N processors, M benchmarks and K clicks
+# (see kvlib/synth.py) are written to a temporary directory (or --dir), then
+# each stage of the pipeline is timed on its own (best of R runs):
+#   parse   : kvlib.parse on the reports (data_parse.py, one process) & the
+#             timing path scanner (data_paths.py)
+#   load    : csv summaries -> Table/Benchmarks/StaSummary, without cache
+#   cached  : same, from the binary cache
+#   compute : scores, power breakdowns, energy metrics & STA statistics
+#   render  : figures of data_plots.py (tables in cache)
+#
+# Timings are compared with the baseline stored in
+# $KEYV_DATA/.cache/perf_baseline.json (--save to update it) for the same
+# parameters. The script exits with status 1 if a stage is slower than the
+# baseline by more than --threshold percent.
+#-----------------------------------------------------------------------------
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import platform
+import numpy as np
+import data_plots as dp
+from kvlib import table
+from kvlib import synth
+from kvlib import timing
+from kvlib import energy
+from kvlib import benchmarks
+from kvlib.parse import cores
+from kvlib.parse.area import parse_area
+from kvlib.parse.bench import parse_benchmarks, BENCHMARKS
+from kvlib.parse.sta import parse_sta
+from kvlib.parse.paths import scan_paths
+
+BASELINE = 'perf_baseline.json'
+
+# Stages slower by less than this (s) are never regressions (timer noise)
+MIN_DELTA = 2e-3
+
+def Time (func, repeat):
+    """Returns the best time (s) of <repeat> calls of <func>"""
+
+    best = float('inf')
+    for _ in range(repeat):
+        t0   = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+#-----------------------------------------------------------------------------
+# STAGES
+#-----------------------------------------------------------------------------
+def ParseStages (data, procs, benches):
+    """Returns the parsing stages (name, func) of the reports in <data>"""
+
+    out    = os.path.join(data, 'parsed')
+    benchs = [b for b in benches if b in BENCHMARKS]
+
+    def area():
+        for p in procs:
+            parse_area(cores.core_path(data, cores.AREA_RPT, p), os.path.join(out, p + '.area.csv'),
+                       cores.MODULES[synth.base_core(p)], verbose=False)
+
+    def bench():
+        for p in procs:
+            parse_benchmarks(cores.core_path(data, cores.SIM_RPT, p), cores.core_path(data, cores.PWR_RPT, p),
+                             os.path.join(out, p + '.benchmarks.csv'), cores.MODULES[synth.base_core(p)],
+                             benchs, verbose=False)
+
+    def sta():
+        for p in procs:
+            if synth.base_core(p) in cores.KEYRINGS:
+                parse_sta(cores.core_path(data, cores.STA_RPT, p), os.path.join(out, p + '.timing.csv'),
+                          cores.KEYRINGS[synth.base_core(p)], verbose=False)
+
+    def paths():
+        for p in procs:
+            if synth.base_core(p) in cores.KEYRINGS:
+                scan_paths(cores.core_path(data, cores.STA_RPT, p))
+
+    return [('parse-area', area), ('parse-bench', bench), ('parse-sta', sta), ('parse-paths', paths)]
+
+def LoadStages (data):
+    """Returns the loading stages (name, func) of the summaries in <data>"""
+
+    area_f  = os.path.join(data, 'area_summary.csv')
+    bench_f = os.path.join(data, 'benchmarks_summary.csv')
+    sta_f   = os.path.join(data, 'sta_summary.csv')
+
+    return [
+        ('load-area',    lambda: table.load_table(area_f, labels=['PROCESSOR'], cache=False)),
+        ('load-bench',   lambda: benchmarks.load_benchmarks(bench_f, cache=False)),
+        ('load-sta',     lambda: timing.load_sta(sta_f, cache=False)),
+        ('cached-area',  lambda: table.load_table(area_f, labels=['PROCESSOR'])),
+        ('cached-bench', lambda: benchmarks.load_benchmarks(bench_f)),
+        ('cached-sta',   lambda: timing.load_sta(sta_f)),
+    ]
+
+def ComputeStages (data):
+    """Returns the computation stages (name, func) of the figures of data_plots.py"""
+
+    bench = benchmarks.load_benchmarks(os.path.join(data, 'benchmarks_summary.csv'))
+    sta   = timing.load_sta(os.path.join(data, 'sta_summary.csv'))
+
+    def bench_stats():
+        bench.score()
+        bench.score_pwr()
+        for spec, other in [(benchmarks.PWR_GROUPS, False), (benchmarks.PWR_CATEGORIES, False),
+                            (benchmarks.PWR_HIER, True)]:
+            bench.breakdown(spec, other)
+
+    def energy_stats():
+        en = energy.Energy(bench)
+        for m in energy.COMPARE:
+            en.normalized(m, en.processors[0])
+        en.breakdown()
+
+    def sta_stats():
+        sta.mean()
+        sta.std()
+        sta.percentile([5, 50, 95])
+
+    return [('compute-bench', bench_stats), ('compute-energy', energy_stats), ('compute-sta', sta_stats)]
+
+def RenderStages ():
+    """Returns the rendering stages (name, func) of data_plots.py"""
+
+    return [('render-area', dp.PlotArea), ('render-bench', dp.PlotBenchmarks), ('render-sta', dp.PlotSta)]
+
+#-----------------------------------------------------------------------------
+# BASELINE
+#-----------------------------------------------------------------------------
+def LoadBaseline (fname, params):
+    """Returns the baseline timings {stage: s} of <params> ({} if none)"""
+
+    try:
+        with open(fname) as f:
+            runs = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return runs.get(json.dumps(params, sort_keys=True), {}).get('times', {})
+
+def SaveBaseline (fname, params, times):
+    """Store <times> as the baseline of <params> in <fname>"""
+
+    try:
+        with open(fname) as f:
+            runs = json.load(f)
+    except (OSError, ValueError):
+        runs = {}
+    runs[json.dumps(params, sort_keys=True)] = {
+        'date': time.strftime('%Y-%m-%d %H:%M:%S'), 'host': platform.node(),
+        'python': platform.python_version(), 'numpy': np.__version__, 'times': times}
+
+    os.makedirs(os.path.dirname(fname), exist_ok=True)
+    with open(fname, 'w') as f:
+        json.dump(runs, f, indent=1, sort_keys=True)
+
+#-----------------------------------------------------------------------------
+#
+#                                  MAIN
+#
+#-----------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    # Verify the environment
+    try: os.environ['KEYV_HOME']
+    except KeyError:
+        print("Setup the environment with setup.csh prior to running this script")
+        raise
+
+    parser = argparse.ArgumentParser(description='Performance benchmarks of the parsing & plotting pipeline')
+    parser.add_argument('-n', '--processors', type=int, default=16, help='Number of processors (default: 16)')
+    parser.add_argument('-m', '--benchmarks', type=int, default=4, help='Number of benchmarks (default: 4)')
+    parser.add_argument('-k', '--clicks', type=int, default=144, help='Number of KeyRing clicks (default: 144)')
+    parser.add_argument('--paths', type=int, default=1, help='STA paths per click & direction, in the summary & the reports (default: 1)')
+    parser.add_argument('--detail', type=int, default=50, help='Filler lines per module/path in reports (default: 50)')
+    parser.add_argument('-r', '--repeat', type=int, default=3, help='Runs per stage, the best is kept (default: 3)')
+    parser.add_argument('-s', '--stages', nargs='*', default=['parse', 'load', 'cached', 'compute', 'render'],
+                        help='Stages to run (default: all)')
+    parser.add_argument('--dir', help='Keep the synthetic data in DIR (default: temporary directory)')
+    parser.add_argument('--save', action='store_true', help='Store the timings as the new baseline')
+    parser.add_argument('--threshold', type=float, default=20, help='Regression threshold in %% (default: 20)')
+    args = parser.parse_args()
+
+    baseline_f = os.path.join(os.getenv('KEYV_DATA'), table.CACHE_DIR, BASELINE)
+    params     = {'n': args.processors, 'm': args.benchmarks, 'k': args.clicks,
+                  'paths': args.paths, 'detail': args.detail}
+
+    #------------------------------------------------------------------------
+    # Synthetic data: data_plots.py reads $KEYV_DATA
+    #------------------------------------------------------------------------
+    data = args.dir or tempfile.mkdtemp(prefix='keyv_perf_')
+    os.environ['KEYV_DATA'] = data
+    try:
+        t0 = time.perf_counter()
+        procs, benches = synth.generate(data, args.processors, args.benchmarks, args.clicks,
+                                        args.paths, 'parse' in args.stages, args.detail)
+        print("Generated {} processors x {} benchmarks, {} clicks in {} ({:.2f} s)".format(
+            len(procs), len(benches), args.clicks, data, time.perf_counter() - t0))
+
+        stages = []
+        if 'parse' in args.stages:
+            stages += ParseStages(data, procs, benches)
+        if 'load' in args.stages or 'cached' in args.stages:
+            stages += [s for s in LoadStages(data) if s[0].split('-')[0] in args.stages]
+        if 'compute' in args.stages:
+            stages += ComputeStages(data)
+        if 'render' in args.stages:
+            dp.InitPlots()
+            stages += RenderStages()
+
+        times = {}
+        for name, func in stages:
+            times[name] = Time(func, args.repeat)
+    finally:
+        if not args.dir:
+            shutil.rmtree(data, ignore_errors=True)
+
+    #------------------------------------------------------------------------
+    # Report
+    #------------------------------------------------------------------------
+    base = LoadBaseline(baseline_f, params)
+    regs = []
+    print("{:<14s} {:>10s} {:>10s} {:>8s}".format('STAGE', 'TIME (ms)', 'BASE (ms)', 'CHANGE'))
+    for name, t in times.items():
+        if name in base:
+            change = (t - base[name]) / base[name]
+            if change > args.threshold / 100 and t - base[name] > MIN_DELTA:
+                regs.append(name)
+            print("{:<14s} {:10.2f} {:10.2f} {:+7.1f}%{}".format(
+                name, 1e3 * t, 1e3 * base[name], 100 * change, ' <-' if name in regs else ''))
+        else:
+            print("{:<14s} {:10.2f} {:>10s} {:>8s}".format(name, 1e3 * t, '-', '-'))
+
+    if args.save:
+        SaveBaseline(baseline_f, params, times)
+        print("Baseline saved in {}".format(baseline_f))
+    elif regs:
+        print("Regression (> {}%): {}".format(args.threshold, ' '.join(regs)))
+        sys.exit(1)
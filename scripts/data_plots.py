@@ -8,14 +8,108 @@
 # Brief   : Script to plot data from csv summary
 #-----------------------------------------------------------------------------
 # [tcsh]% source setup.csh
-# [tcsh]% ./scripts/data_plots.py
+# [tcsh]% ./scripts/data_plots.py [all|area|bench|sta] [--jobs N] [--force] [--no-history]
+#                                   [--profile TRACE] [--cprofile FILE] [--watch]
+#                                   [--format png|svg|pdf|html] [--facet N]
+# [tcsh]% ./scripts/data_plots.py scores|energy|export
+#
+# The figures of one summary only are rendered with area, bench or sta (all
+# by default). scores prints the benchmark scores & scores per mW, energy
+# the CPI, energy, EPI & EDP relative to synv (see kvlib/energy.py), export
+# writes them in $KEYV_DATA/scores_summary.csv, energy_summary.csv &
+# energy_normalized.csv: none of them loads matplotlib.
+#
+# The module is also a library (import data_plots): figure parameters are
+# held by a PlotConfig (data_plots.config), plot & score functions take the
+# data directory as argument ($KEYV_DATA by default), and matplotlib is only
+# imported by InitPlots, when a figure is actually rendered.
+#
+# --watch keeps running: when the reports of $KEYV_DATA/<core>/ change, the
+# core is parsed again (kvlib/parse), when the summaries change, the figures
+# they feed are rendered again, in the same (warm) process. The state of the
+# figures is kept in $KEYV_DATA/.cache/plots_status.json (see Watch).
+#
+# Only figures whose inputs (csv summaries, this script) or parameters
+# changed since the last run are rendered again (see kvlib/build.py).
+# The csv summaries are archived in $KEYV_DATA/history.db (see
+# kvlib/history.py & data_history.py) unless --no-history is given.
+#
+# Large sweeps: figures with one bar per processor are split into pages of
+# --facet processors (<name>-2.<ext>..., outputs of the figure too: stale
+# if missing, removed when the sweep gets smaller), and axes with many bars draw them
+# & their values as collections (see Bars). --format html writes the pages
+# as inline SVG in one <name>.html.
+#
+# --profile records the wall time, CPU time & peak memory of each stage of
+# each figure (init, load, derive, layout, annotate, save) in a json TRACE
+# (see kvlib/perf.py), --cprofile dumps the cProfile stats of the figures.
 #-----------------------------------------------------------------------------
 import os
+import re
 import sys
+import signal
+import argparse
 import numpy as np
-import statistics as stats
-import matplotlib.pyplot as plt
-import matplotlib.ticker as ticker
+from kvlib import table
+from kvlib import benchmarks
+from kvlib import energy
+from kvlib import timing
+from kvlib import render
+from kvlib import build
+from kvlib import history
+from kvlib import perf
+from kvlib import watch
+from kvlib.parse.scan import write_csv
+
+#-----------------------------------------------------------------------------
+# Configuration
+#
+#   Rendering jobs get the configuration as argument (see RenderFigure), so
+#   that worker processes use the same one as the caller
+#-----------------------------------------------------------------------------
+class PlotConfig:
+    """Parameters of the rendered figures (keyword arguments override the defaults)"""
+
+    def __init__(self, **params):
+
+        self.fig_size        = (7,7)
+        self.fig_size_half   = (4,7)
+        self.fig_dpi         = 200
+        self.fig_ext         = 'png'
+        self.font_size_label = 12
+        self.font_size_title = 14
+        self.alpha_dark      = 0.85
+        self.alpha_light     = 0.55
+        self.bar_width       = 0.7
+        self.bar_align       = 'edge'
+        self.cmap_names      = {'civ': ('cividis', 64), 'vir': ('viridis', 64)}
+
+        # Bars per axes drawn as collections (None: never), processors per page (None: one page)
+        self.bulk_min        = 64
+        self.facet_size      = 16
+
+        # Bars per axes above which the value & tick labels are vertical
+        self.dense_min       = 9
+
+        # Benchmark styles, in turn: (colormap, score color, score/mW color, stacked range)
+        self.bench_styles    = [('civ', 0.1, 0.3, (0.1, 0.9)), ('vir', 0.5, 0.7, (0.2, 0.8))]
+
+        for k, v in params.items():
+            if k not in vars(self):
+                raise KeyError("PlotConfig:: unknown parameter {}".format(k))
+            setattr(self, k, v)
+
+    def params(self):
+        """Returns the parameters as a dict"""
+
+        return dict(vars(self))
+
+config = PlotConfig()
+
+# Loaded by InitPlots (only when a figure is actually rendered)
+plt             = None
+cmap_civ        = None
+cmap_vir        = None
 
 #-----------------------------------------------------------------------------
 #
@@ -23,464 +117,854 @@ import matplotlib.ticker as ticker
 #
 #-----------------------------------------------------------------------------
 
-def Bars(ax, title, x, data, color, val_format='{}'):
-    """Basic bar plot"""
+@perf.staged('init')
+def InitPlots():
+    """Load matplotlib (Agg backend) & colormaps"""
 
-    ax.set_title(title, fontdict={'fontsize':font_size_title})
-    ax.tick_params(axis='both', labelsize=font_size_title)
-    ax.set_ylim(top=max(data) * 1.1)
+    global plt, cmap_civ, cmap_vir
+    if plt is not None:
+        return
 
-    bars = ax.bar(x=x, height=data, width=bar_width, color=color, alpha=alpha_dark, linestyle='solid')
+    render.use_agg()
+    import matplotlib.pyplot as plt
+    cmap_civ = plt.get_cmap(*config.cmap_names['civ'])
+    cmap_vir = plt.get_cmap(*config.cmap_names['vir'])
 
-    # Add labels on top
-    for bar in bars:
-        height = bar.get_height()
-        ax.annotate(val_format.format(height),
-                    xy=(bar.get_x() + bar.get_width() / 2, height),
-                    xytext=(0, 3),
-                    textcoords="offset points",
-                    ha='center', va='bottom',
-                    fontsize=font_size_label)
+def Configure(cfg):
+    """Use PlotConfig <cfg> for the next figures (colormaps are loaded again)"""
 
-def BarStacked(ax, title, x, data_list, color_list, label_list, val_format='{}'):
-    """Stacked bar plot"""
+    global config, cmap_civ, cmap_vir
+    if cfg is config:
+        return
+    config = cfg
+    if plt is not None:
+        cmap_civ = plt.get_cmap(*config.cmap_names['civ'])
+        cmap_vir = plt.get_cmap(*config.cmap_names['vir'])
+
+#------------------------------------------------------------------------
+# Bar plots
+#
+#   Up to config.bulk_min bars per axes, each bar is a Rectangle & each value
+#   an annotation. Above, the bars of an axes are a single PolyCollection &
+#   the values a single PathCollection of text outlines (see BulkBars &
+#   BulkLabels): the artist count, which dominates the rendering time of
+#   large sweeps, no longer depends on the number of bars.
+#------------------------------------------------------------------------
+_text_paths = {}
+
+def Bulk(n):
+    """True if <n> bars of an axes are drawn as collections"""
+
+    return config.bulk_min is not None and n >= config.bulk_min
+
+def LabelStyle(n):
+    """Returns the (font size, rotation) of the value labels of <n> bars"""
+
+    if n < config.dense_min:
+        return config.font_size_label, 0
+    return config.font_size_label - 4, 90
 
-    ax.set_title(title, fontdict={'fontsize':font_size_title})
-    ax.tick_params(axis='both', labelsize=font_size_title)
+def TickRoom(n):
+    """Returns the bottom margin of a figure with <n> (processor) ticks"""
 
-    bars_list = []
-    offset = np.zeros(len(data_list[0]))
+    return 0.1 if n < config.dense_min else 0.25
 
-    for data, color, label in zip(data_list, color_list, label_list):
-        bars_list.append(ax.bar(x=x, height=data, bottom=offset, color=color, ec='white', label=label,
-                                width=bar_width, alpha=alpha_dark, linestyle='solid', linewidth=0.1))
-        offset += data
+def Positions(ax, x):
+    """Returns the numeric positions of bars <x> (labels become the x ticks)"""
 
-    ax.set_ylim(top=max(offset) * 1.1)
+    x = np.asarray(x)
+    if x.dtype.kind in 'iuf':
+        return x.astype(float)
+    pos = np.arange(len(x), dtype=float)
+    ax.set_xticks(pos)
+    ax.set_xticklabels(x)
+    return pos
+
+def BulkBars(ax, x, bottom, height, colors, labels=None, width=None):
+    """Draw (layer x bar) bars as one PolyCollection, returns the legend handles of the layers"""
+
+    from matplotlib.collections import PolyCollection
+    from matplotlib.colors import to_rgba_array
+    from matplotlib.patches import Patch
+
+    width  = config.bar_width if width is None else width
+    x0     = np.broadcast_to(x - width / 2, height.shape)
+    y0, y1 = bottom, bottom + height
+    verts  = np.stack([np.stack(c, axis=-1) for c in [(x0, y0), (x0 + width, y0), (x0 + width, y1), (x0, y1)]],
+                      axis=-2)
+    rgba   = to_rgba_array(colors)
+    faces  = np.broadcast_to(rgba[:, None], height.shape + (4,))
+    ok     = np.isfinite(y0) & np.isfinite(y1)
+
+    ax.add_collection(PolyCollection(verts[ok], facecolors=faces[ok], edgecolors='white', linewidths=0.1,
+                                     alpha=config.alpha_dark), autolim=False)
+    ax.update_datalim(verts[ok].reshape(-1, 2))
+    ax.autoscale_view()
+    return [Patch(facecolor=c, alpha=config.alpha_dark, label=l) for c, l in zip(rgba, labels or [])]
+
+def TextOutline(text, size, rotation=0):
+    """Returns the outline of <text> (points), centered above (0, 3)"""
+
+    from matplotlib.textpath import TextPath
+    from matplotlib.transforms import Affine2D
+
+    key = (text, size, rotation)
+    if key not in _text_paths:
+        path = Affine2D().rotate_deg(rotation).transform_path(TextPath((0, 0), text, size=size))
+        ext  = path.get_extents()
+        _text_paths[key] = Affine2D().translate(-(ext.x0 + ext.x1) / 2, 3 - ext.y0).transform_path(path)
+    return _text_paths[key]
+
+def BulkLabels(ax, x, y, texts, size, rotation=0):
+    """Draw <texts> above the points (x, y) as one PathCollection"""
+
+    from matplotlib.collections import PathCollection
+    from matplotlib.transforms import Affine2D
+
+    ok = np.isfinite(x) & np.isfinite(y)
+    ax.add_collection(PathCollection([TextOutline(t, size, rotation) for t, k in zip(texts, ok) if k],
+                                     offsets=np.column_stack([x[ok], y[ok]]), offset_transform=ax.transData,
+                                     transform=Affine2D().scale(1 / 72) + ax.figure.dpi_scale_trans,
+                                     facecolors='black', edgecolors='none'), autolim=False)
+
+def Bars(ax, title, x, data, color, val_format='{}'):
+    """Basic bar plot (missing values are NaN)"""
+
+    data = np.asarray(data, dtype=float)
+    bulk = Bulk(len(data))
+    size, rot = LabelStyle(len(data))
+
+    with perf.stage('layout'):
+        ax.set_title(title, fontdict={'fontsize':config.font_size_title})
+        ax.tick_params(axis='both', labelsize=config.font_size_title)
+        ax.set_ylim(top=np.nanmax(data) * (1.1 if rot == 0 else 1.25))
+
+        if bulk:
+            x = Positions(ax, x)
+            BulkBars(ax, x[None], np.zeros((1, len(data))), data[None], [color])
+        else:
+            bars = ax.bar(x=x, height=data, width=config.bar_width, color=color, alpha=config.alpha_dark,
+                          linestyle='solid')
+
+    # Add labels on top
+    with perf.stage('annotate'):
+        if bulk:
+            BulkLabels(ax, x, data, [val_format.format(v) for v in data], size, rot)
+            return
+        for bar in bars:
+            height = bar.get_height()
+            if np.isnan(height):
+                continue
+            ax.annotate(val_format.format(height),
+                        xy=(bar.get_x() + bar.get_width() / 2, height),
+                        xytext=(0, 3),
+                        textcoords="offset points",
+                        ha='center', va='bottom', rotation=rot,
+                        fontsize=size)
+
+def BarStacked(ax, title, x, data_list, color_list, label_list, val_format='{}'):
+    """Stacked bar plot (missing values are NaN)"""
+
+    data   = np.asarray(data_list, dtype=float)
+    tops   = np.cumsum(data, axis=0)
+    offset = tops[-1]
+    bulk   = Bulk(data.size)
+    size, rot = LabelStyle(len(offset))
+
+    with perf.stage('layout'):
+        ax.set_title(title, fontdict={'fontsize':config.font_size_title})
+        ax.tick_params(axis='both', labelsize=config.font_size_title)
+
+        if bulk:
+            x       = Positions(ax, x)
+            handles = BulkBars(ax, x[None], tops - data, data, color_list, label_list)
+        else:
+            bars_list = []
+            for d, bottom, color, label in zip(data, tops - data, color_list, label_list):
+                bars_list.append(ax.bar(x=x, height=d, bottom=bottom, color=color, ec='white', label=label,
+                                        width=config.bar_width, alpha=config.alpha_dark, linestyle='solid',
+                                        linewidth=0.1))
+
+        ax.set_ylim(top=np.nanmax(offset) * (1.5 if bulk else 1.1 if rot == 0 else 1.25))
 
     # Add labels on top of last bar
-    for bar, val in zip(bars_list[-1], offset):
-        ax.annotate(val_format.format(val),
-                    xy=(bar.get_x() + bar.get_width() / 2, val),
-                    xytext=(0, 3),
-                    textcoords="offset points",
-                    ha='center', va='bottom',
-                    fontsize=font_size_label)
+    with perf.stage('annotate'):
+        if bulk:
+            BulkLabels(ax, x, offset, [val_format.format(v) for v in offset], size, rot)
+        else:
+            for bar, val in zip(bars_list[-1], offset):
+                if np.isnan(val):
+                    continue
+                ax.annotate(val_format.format(val),
+                            xy=(bar.get_x() + bar.get_width() / 2, val),
+                            xytext=(0, 3),
+                            textcoords="offset points",
+                            ha='center', va='bottom', rotation=rot,
+                            fontsize=size)
+
+    # The 'best' location searches all the vertices: bulk legends go in the headroom
+    with perf.stage('layout'):
+        if bulk:
+            ax.legend(handles=handles, loc='upper left', ncol=3, fontsize=config.font_size_label - 4,
+                      handlelength=1, columnspacing=0.8)
+        else:
+            ax.legend(loc='best', fontsize=config.font_size_label)
+
+def BarGrouped(ax, title, x, data_list, color_list, label_list, val_format='{}'):
+    """Grouped bar plot: one bar per data of <data_list> at each x (missing values are NaN)"""
+
+    data  = np.asarray(data_list, dtype=float)
+    bulk  = Bulk(data.size)
+    width = config.bar_width / len(data)
+    shift = (np.arange(len(data)) - (len(data) - 1) / 2) * width
+
+    with perf.stage('layout'):
+        ax.set_title(title, fontdict={'fontsize':config.font_size_title})
+        ax.tick_params(axis='both', labelsize=config.font_size_title)
+        ax.set_ylim(top=np.nanmax(data) * 1.4)
+
+        xs = (Positions(ax, x) if bulk else np.asarray(x, dtype=float))[None] + shift[:, None]
+        if bulk:
+            handles = BulkBars(ax, xs, np.zeros(data.shape), data, color_list, label_list, width)
+        else:
+            bars_list = [ax.bar(x=xi, height=d, width=width, color=color, label=label, alpha=config.alpha_dark,
+                                linestyle='solid')
+                         for xi, d, color, label in zip(xs, data, color_list, label_list)]
+
+    # Add (vertical) labels on top of each bar
+    with perf.stage('annotate'):
+        if bulk:
+            BulkLabels(ax, xs.ravel(), data.ravel(), [val_format.format(v) for v in data.ravel()],
+                       config.font_size_label - 4, 90)
+        else:
+            for bars in bars_list:
+                for bar in bars:
+                    height = bar.get_height()
+                    if np.isnan(height):
+                        continue
+                    ax.annotate(val_format.format(height),
+                                xy=(bar.get_x() + bar.get_width() / 2, height),
+                                xytext=(0, 3),
+                                textcoords="offset points",
+                                ha='center', va='bottom', rotation=90,
+                                fontsize=config.font_size_label - 4)
+
+    # Legend in the headroom above the bars
+    with perf.stage('layout'):
+        ax.legend(handles=handles if bulk else None, loc='upper center', ncol=(len(label_list) + 1) // 2,
+                  fontsize=config.font_size_label)
 
-    ax.legend(loc='best', fontsize=font_size_label)
+#------------------------------------------------------------------------
+# Pages & outputs
+#
+#   Figures with one bar per processor are split into pages of at most
+#   config.facet_size processors: <name>.<ext>, <name>-2.<ext>... With the
+#   html extension, the pages are inline SVG images of a single <name>.html.
+#------------------------------------------------------------------------
+HTML_HEAD = '<!DOCTYPE html>\n<html><head><meta charset="utf-8"><title>{}</title></head><body>\n'
+HTML_TAIL = '</body></html>\n'
+
+def Pages(n):
+    """Returns the indexes of the processors of each page"""
+
+    size = config.facet_size or max(n, 1)
+    return np.array_split(np.arange(n), max(-(-n // size), 1))
+
+def PageName(figname, page=0):
+    """Returns the file of page <page> of figure <figname>"""
+
+    if page == 0 or config.fig_ext == 'html':
+        return figname
+    base, ext = os.path.splitext(figname)
+    return '{}-{}{}'.format(base, page + 1, ext)
+
+def RemovePages(figname, n):
+    """Remove the pages of figure <figname> after the first <n> ones (left by a larger sweep)"""
+
+    base, ext = os.path.splitext(figname)
+    page_re   = re.compile(re.escape(os.path.basename(base)) + r'-([0-9]+)' + re.escape(ext) + '$')
+    for f in os.listdir(os.path.dirname(figname) or '.'):
+        m = page_re.match(f)
+        if m and int(m.group(1)) > n:
+            os.remove(os.path.join(os.path.dirname(figname), f))
+
+# Files written by SaveFig since the last RenderFigure
+_saved = []
+
+@perf.staged('save')
+def SaveFig(figname, page=0):
+    """Save the current figure as page <page> of <figname> and close it"""
+
+    if config.fig_ext == 'html':
+        import io
+        buf = io.StringIO()
+        plt.savefig(buf, format='svg')
+        plt.close()
+        svg = buf.getvalue()
+        svg = svg[svg.index('<svg'):]
+
+        # Pages are appended to the page of the first one
+        body = ''
+        if page > 0 and os.path.exists(figname):
+            with open(figname) as f:
+                body = f.read()
+            body = body[:-len(HTML_TAIL)] if body.endswith(HTML_TAIL) else body
+        else:
+            body = HTML_HEAD.format(os.path.splitext(os.path.basename(figname))[0])
+        with open(figname, 'w') as f:
+            f.write(body + '<div>' + svg + '</div>\n' + HTML_TAIL)
+        return
+
+    # Paper type only applies to PostScript outputs
+    opts = {'papertype': 'letter'} if config.fig_ext in ('ps', 'eps') else {}
+    _saved.append(PageName(figname, page))
+    plt.savefig(PageName(figname, page), dpi=config.fig_dpi, format=config.fig_ext, orientation='landscape',
+                **opts)
+    plt.close()
 
 #------------------------------------------------------------------------
 #
 #                                   AREA
 #
 #------------------------------------------------------------------------
-def PlotArea ():
+def PlotArea (data=None):
     """Plot area information from area_summary.csv"""
 
-    csv_f    = os.getenv('KEYV_DATA') + "/area_summary.csv"
-    figname  = os.getenv('KEYV_DATA') + "/area." + fig_ext
-
-    csv_head = list(np.loadtxt(csv_f, delimiter=',', unpack=True, max_rows=1, dtype=np.str))
-    head     = [x for x in csv_head if ( x != 'PROCESSOR' )]
-    dat_c    = [csv_head.index(x) for x in csv_head if ( x != 'PROCESSOR' )]
-    id_c     = [csv_head.index(x) for x in csv_head if ( x == 'PROCESSOR' )]
-    csv_id   = np.loadtxt(csv_f, delimiter=',',unpack=True,skiprows=1,usecols=id_c, dtype=np.str)
-    csv_dat  = np.loadtxt(csv_f, delimiter=',', unpack=True, skiprows=1, usecols=dat_c)
-
-    cmb     = csv_dat[head.index('CMB')] + csv_dat[head.index('BUF')]
-    seq     = csv_dat[head.index('SEQ')]
-    tot     = csv_dat[head.index('TOTAL')]
-    grp     = [cmb, seq]
-    decode  = csv_dat[head.index('AR-IDECODE')]
-    pc      = csv_dat[head.index('AR-PC')]
-    rf      = csv_dat[head.index('AR-RF')]
-    alu     = csv_dat[head.index('AR-ALU')]
-    lsu     = csv_dat[head.index('AR-LSU')]
-    sys     = csv_dat[head.index('AR-SYS')]
-    perf    = csv_dat[head.index('AR-PERF')]
-    rst_s   = csv_dat[head.index('AR-RST-SYNC')]
-    perf_s  = csv_dat[head.index('AR-PERF-SYNC')]
-    keyring = csv_dat[head.index('AR-KEYRING')]
-    xbs     = csv_dat[head.index('AR-XBS')]
-    xu0     = csv_dat[head.index('AR-XU0')]
-    xu1     = csv_dat[head.index('AR-XU1')]
-    xu2     = csv_dat[head.index('AR-XU2')]
-    xu3     = csv_dat[head.index('AR-XU3')]
-    xu4     = csv_dat[head.index('AR-XU4')]
-    xu5     = csv_dat[head.index('AR-XU5')]
-    modules = (decode + pc + rf + alu + lsu + sys + perf)
-    oth     = cmb + seq - modules
-    hier    = [rf, alu, decode, sys, perf, pc, lsu, oth]
-
-    fig         = plt.figure(figsize=fig_size)
-    fmt         = '{:.0f}'
-    grp_labels  = ['CMB', 'SEQ']
-    hier_labels = ['RF', 'ALU', 'DECODE', 'SYS', 'PERF', 'PC', 'LSU', 'OTHER']
-    lbl_x       = csv_id
-    lbl         = np.arange(len(lbl_x))
-    grp_colors  = cmap_vir(np.linspace(0.3, 0.6, len(grp_labels)))
-    hier_colors = cmap_civ(np.linspace(0.1, 0.9, len(hier_labels)))
-
-    grp_ax = plt.subplot(121)
-    grp_ax.set_xticks(lbl)
-    grp_ax.set_xticklabels(lbl_x)
-    hier_ax = plt.subplot(122, sharex=grp_ax)
-    plt.subplots_adjust(left=0.15, right=0.99, bottom=0.1, top=0.9, hspace=0.3, wspace=0.4)
-
-    BarStacked(grp_ax, 'Area (um2)', lbl, grp, grp_colors, grp_labels, fmt)
-    BarStacked(hier_ax, 'Area (um2)', lbl, hier, hier_colors, hier_labels, fmt)
-
-    plt.savefig(figname, dpi=fig_dpi, format=fig_ext, papertype='letter', orientation='landscape')
-    plt.close()
+    InitPlots()
+    data     = data or os.getenv('KEYV_DATA')
+    csv_f    = os.path.join(data, "area_summary.csv")
+    figname  = os.path.join(data, "area." + config.fig_ext)
+
+    with perf.stage('load'):
+        tab  = table.load_table(csv_f, labels=['PROCESSOR'])
+
+    with perf.stage('derive'):
+        cmb     = tab['CMB'] + tab['BUF']
+        seq     = tab['SEQ']
+        tot     = tab['TOTAL']
+        grp     = [cmb, seq]
+        decode  = tab['AR-IDECODE']
+        pc      = tab['AR-PC']
+        rf      = tab['AR-RF']
+        alu     = tab['AR-ALU']
+        lsu     = tab['AR-LSU']
+        sys     = tab['AR-SYS']
+        prf     = tab['AR-PERF']
+        rst_s   = tab['AR-RST-SYNC']
+        perf_s  = tab['AR-PERF-SYNC']
+        keyring = tab['AR-KEYRING']
+        xbs     = tab['AR-XBS']
+        xu0     = tab['AR-XU0']
+        xu1     = tab['AR-XU1']
+        xu2     = tab['AR-XU2']
+        xu3     = tab['AR-XU3']
+        xu4     = tab['AR-XU4']
+        xu5     = tab['AR-XU5']
+        modules = (decode + pc + rf + alu + lsu + sys + prf)
+        oth     = cmb + seq - modules
+        hier    = [rf, alu, decode, sys, prf, pc, lsu, oth]
+
+    for page, idx in enumerate(Pages(len(tab))):
+        with perf.stage('layout'):
+            fig         = plt.figure(figsize=config.fig_size)
+            fmt         = '{:.0f}'
+            grp_labels  = ['CMB', 'SEQ']
+            hier_labels = ['RF', 'ALU', 'DECODE', 'SYS', 'PERF', 'PC', 'LSU', 'OTHER']
+            lbl_x       = tab['PROCESSOR'][idx]
+            lbl         = np.arange(len(lbl_x))
+            grp_colors  = cmap_vir(np.linspace(0.3, 0.6, len(grp_labels)))
+            hier_colors = cmap_civ(np.linspace(0.1, 0.9, len(hier_labels)))
+
+            grp_ax = plt.subplot(121)
+            grp_ax.set_xticks(lbl)
+            grp_ax.set_xticklabels(lbl_x)
+            hier_ax = plt.subplot(122, sharex=grp_ax)
+            for ax in (grp_ax, hier_ax):
+                ax.tick_params(axis='x', labelrotation=LabelStyle(len(idx))[1])
+            plt.subplots_adjust(left=0.15, right=0.99, bottom=TickRoom(len(idx)), top=0.9, hspace=0.3, wspace=0.4)
+
+        BarStacked(grp_ax, 'Area (um2)', lbl, [g[idx] for g in grp], grp_colors, grp_labels, fmt)
+        BarStacked(hier_ax, 'Area (um2)', lbl, [h[idx] for h in hier], hier_colors, hier_labels, fmt)
+
+        SaveFig(figname, page)
 
 #-----------------------------------------------------------------------------
 #
 #                                BENCHMARKS
 #
 #-----------------------------------------------------------------------------
-def PlotBenchmarks ():
+@perf.staged('load')
+def LoadBenchmarks (data=None):
+    """Load benchmark scores & power analysis from benchmarks_summary.csv"""
+
+    csv_f = os.path.join(data or os.getenv('KEYV_DATA'), "benchmarks_summary.csv")
+    return benchmarks.load_benchmarks(csv_f)
+
+def BenchStyle (i):
+    """Returns (colormap, score color, score/mW color, stacked range) of the i-th benchmark"""
+
+    cmap, score, score_pwr, stacked = config.bench_styles[i % len(config.bench_styles)]
+    return {'civ': cmap_civ, 'vir': cmap_vir}[cmap], score, score_pwr, stacked
+
+def BenchAxes (bench, rows, idx=None):
+    """Returns the axes of a figure with one column per benchmark (<rows> per column)
+
+    Only the processors <idx> (all by default) are on the x axis. Vertical
+    tick labels are only on the last row."""
+
+    idx  = np.arange(len(bench.processors)) if idx is None else idx
+    lbl  = np.arange(len(idx))
+    rot  = LabelStyle(len(idx))[1]
+    cols = len(bench.benchmarks)
+    axes = [[None] * cols for _ in range(rows)]
+    for r in range(rows):
+        for c in range(cols):
+            first = axes[0][0]
+            axes[r][c] = plt.subplot(rows, cols, r * cols + c + 1, sharex=first)
+            if first is None:
+                axes[r][c].set_xticks(lbl)
+                axes[r][c].set_xticklabels(np.asarray(bench.processors)[idx])
+            axes[r][c].tick_params(axis='x', labelrotation=rot, labelbottom=not rot or r == rows - 1)
+    return lbl, axes
+
+#------------------------------------------------------------------------
+# Scores + Score/Power
+#------------------------------------------------------------------------
+def PlotPowerScore (data=None):
+    """Plot benchmark scores & scores per mW"""
+
+    InitPlots()
+    data       = data or os.getenv('KEYV_DATA')
+    ps_figname = os.path.join(data, "power_score." + config.fig_ext)
+    bench      = LoadBenchmarks(data)
+
+    with perf.stage('derive'):
+        score      = bench.score()
+        score_pwr  = bench.score_pwr()
+
+    for page, idx in enumerate(Pages(len(bench.processors))):
+        with perf.stage('layout'):
+            ps_fig     = plt.figure(figsize=config.fig_size)
+            ps_format  = '{:.2f}'
+            lbl, axes  = BenchAxes(bench, 2, idx)
+            plt.subplots_adjust(left=0.1, right=0.99, bottom=TickRoom(len(idx)), top=0.9, hspace=0.3)
+
+        for b, name in enumerate(bench.benchmarks):
+            title, unit, _ = benchmarks.score_info(name)
+            cmap, s_color, p_color, _ = BenchStyle(b)
+            Bars(axes[0][b], '{} ({})'.format(title, unit), lbl, score[b][idx], cmap(s_color), ps_format)
+            Bars(axes[1][b], '{} ({}/mW)'.format(title, unit), lbl, score_pwr[b][idx], cmap(p_color), ps_format)
+
+        SaveFig(ps_figname, page)
+
+#------------------------------------------------------------------------
+# Power breakdowns (one stacked bar chart per benchmark)
+#------------------------------------------------------------------------
+def PlotPowerBreakdown (name, spec, other=False, data=None):
+    """Plot the power breakdown <spec> (see kvlib/benchmarks.py) of each benchmark in figure <name>"""
+
+    InitPlots()
+    data      = data or os.getenv('KEYV_DATA')
+    figname   = os.path.join(data, name + "." + config.fig_ext)
+    bench     = LoadBenchmarks(data)
+
+    with perf.stage('derive'):
+        power     = bench.breakdown(spec, other)
+        labels    = bench.labels(spec, other)
+
+    for page, idx in enumerate(Pages(len(bench.processors))):
+        with perf.stage('layout'):
+            fig       = plt.figure(figsize=config.fig_size)
+            fmt       = '{:.2f}'
+            lbl, axes = BenchAxes(bench, 1, idx)
+            plt.subplots_adjust(left=0.05, right=0.99, bottom=TickRoom(len(idx)), top=0.9, hspace=0.3)
+
+        for b, bname in enumerate(bench.benchmarks):
+            title, _, _ = benchmarks.score_info(bname)
+            cmap, _, _, stacked = BenchStyle(b)
+            colors = cmap(np.linspace(*stacked, len(labels)))
+            BarStacked(axes[0][b], '{} (mW)'.format(title), lbl, list(power[b][idx].T), colors, labels, fmt)
+
+        SaveFig(figname, page)
+
+def PlotPowerGroups (data=None):
+    """Plot benchmark power by groups (clock tree, sequential, combinational)"""
+
+    PlotPowerBreakdown("power_groups", benchmarks.PWR_GROUPS, data=data)
+
+def PlotPowerCategories (data=None):
+    """Plot benchmark power by categories (internal, leakage, switching)"""
+
+    PlotPowerBreakdown("power_categories", benchmarks.PWR_CATEGORIES, data=data)
+
+def PlotPowerHier (data=None):
+    """Plot benchmark power by hierarchy (modules)"""
+
+    PlotPowerBreakdown("power_hier", benchmarks.PWR_HIER, other=True, data=data)
+
+def PlotBenchmarks (data=None):
     """Plot benchmark scores & power analysis from benchmarks_summary.csv"""
 
-    csv_f      = os.getenv('KEYV_DATA') + "/benchmarks_summary.csv"
-    ps_figname = os.getenv('KEYV_DATA') + "/power_score." + fig_ext
-    pg_figname = os.getenv('KEYV_DATA') + "/power_groups." + fig_ext
-    pc_figname = os.getenv('KEYV_DATA') + "/power_categories." + fig_ext
-    ph_figname = os.getenv('KEYV_DATA') + "/power_hier." + fig_ext
-
-    csv_head = list(np.loadtxt(csv_f, delimiter=',', unpack=True, max_rows=1, dtype=np.str))
-    head     = [x for x in csv_head if ( x != 'PROCESSOR' and x != 'BENCHMARK' )]
-    dat_c    = [csv_head.index(x) for x in csv_head if ( x != 'PROCESSOR' and x != 'BENCHMARK' )]
-    id_c     = [csv_head.index(x) for x in csv_head if ( x == 'PROCESSOR' or x == 'BENCHMARK' )]
-    csv_id   = np.loadtxt(csv_f, delimiter=',', unpack=True, skiprows=1, usecols=id_c, dtype=np.str)
-    csv_dat  = np.loadtxt(csv_f, delimiter=',', unpack=True, skiprows=1, usecols=dat_c)
-    dat_dh   = csv_dat[:, csv_id[1] == 'dhrystone']
-    dat_cm   = csv_dat[:, csv_id[1] == 'coremark']
-    lbl_dh   = csv_id[0, csv_id[1]  == 'dhrystone']
-    lbl_cm   = csv_id[0, csv_id[1]  == 'coremark']
-    lbl_x    = lbl_dh
-    lbl      = np.arange(len(lbl_x))
+    PlotPowerScore(data)
+    PlotPowerGroups(data)
+    PlotPowerCategories(data)
+    PlotPowerHier(data)
+    PlotEnergy(data)
+    PlotEnergyHier(data)
 
-    #------------------------------------------------------------------------
-    # Dhrystone
-    #------------------------------------------------------------------------
-    dh_exec      = dat_dh[head.index('PERIOD')] * dat_dh[head.index('CYCLES')]
-    dh_tot       = dat_dh[head.index('PWR-TOT')] * 1e3
-    dh_score     = 1 / (dh_exec * 1757)
-    dh_score_pwr = dh_score / dh_tot
-    dh_seq       = (dat_dh[head.index('PWR-SEQ')] + dat_dh[head.index('PWR-REG')]) * 1e3
-    dh_ct        = dat_dh[head.index('PWR-CT')] * 1e3
-    dh_cmb       = dat_dh[head.index('PWR-CMB')] * 1e3
-    dh_grp       = [dh_ct, dh_seq, dh_cmb]
-    dh_int       = dat_dh[head.index('PWR-INT')] * 1e3
-    dh_sw        = dat_dh[head.index('PWR-SWITCH')] * 1e3
-    dh_lk        = dat_dh[head.index('PWR-LEAK')] * 1e3
-    dh_cat       = [dh_int, dh_lk, dh_sw]
-    dh_decode    = dat_dh[head.index('PWR-IDECODE')] * 1e3
-    dh_pc        = dat_dh[head.index('PWR-PC')] * 1e3
-    dh_rf        = dat_dh[head.index('PWR-RF')] * 1e3
-    dh_alu       = dat_dh[head.index('PWR-ALU')] * 1e3
-    dh_lsu       = dat_dh[head.index('PWR-LSU')] * 1e3
-    dh_sys       = dat_dh[head.index('PWR-SYS')] * 1e3
-    dh_perf      = dat_dh[head.index('PWR-PERF')] * 1e3
-    dh_rst_s     = dat_dh[head.index('PWR-RST-SYNC')] * 1e3
-    dh_perf_s    = dat_dh[head.index('PWR-PERF-SYNC')] * 1e3
-    dh_keyring   = dat_dh[head.index('PWR-KEYRING')] * 1e3
-    dh_xbs       = dat_dh[head.index('PWR-XBS')] * 1e3
-    dh_xu0       = dat_dh[head.index('PWR-XU0')] * 1e3
-    dh_xu1       = dat_dh[head.index('PWR-XU1')] * 1e3
-    dh_xu2       = dat_dh[head.index('PWR-XU2')] * 1e3
-    dh_xu3       = dat_dh[head.index('PWR-XU3')] * 1e3
-    dh_xu4       = dat_dh[head.index('PWR-XU4')] * 1e3
-    dh_xu5       = dat_dh[head.index('PWR-XU5')] * 1e3
-    dh_modules   = (dh_decode + dh_pc + dh_rf + dh_alu + dh_lsu + dh_sys + dh_perf)
-    dh_oth       = dh_tot - dh_modules
-    dh_hier      = [dh_rf, dh_alu, dh_decode, dh_sys, dh_perf, dh_pc, dh_lsu, dh_oth]
+#------------------------------------------------------------------------
+# Energy, relative to the baseline processor (synv if there is one)
+#------------------------------------------------------------------------
+def EnergyBaseline (en):
+    """Returns the baseline processor of Energy model <en>"""
+
+    return energy.BASELINE if energy.BASELINE in list(en.processors) else str(en.processors[0])
+
+def PlotEnergy (data=None):
+    """Plot the CPI, EPI, energy, EDP & ED2P of each benchmark, relative to the baseline"""
+
+    InitPlots()
+    data      = data or os.getenv('KEYV_DATA')
+    figname   = os.path.join(data, "energy." + config.fig_ext)
+    bench     = LoadBenchmarks(data)
+
+    with perf.stage('derive'):
+        en        = energy.Energy(bench)
+        base      = EnergyBaseline(en)
+        norm      = [en.normalized(m, base) for m in energy.COMPARE]
+
+    for page, idx in enumerate(Pages(len(bench.processors))):
+        with perf.stage('layout'):
+            fig       = plt.figure(figsize=(2 * config.fig_size[0], config.fig_size[1]))
+            fmt       = '{:.2f}'
+            lbl, axes = BenchAxes(bench, 1, idx)
+            plt.subplots_adjust(left=0.05, right=0.99, bottom=TickRoom(len(idx)), top=0.9, hspace=0.3)
+
+        for b, name in enumerate(bench.benchmarks):
+            title, _, _ = benchmarks.score_info(name)
+            cmap, _, _, stacked = BenchStyle(b)
+            colors = cmap(np.linspace(*stacked, len(norm)))
+            BarGrouped(axes[0][b], '{} (vs. {})'.format(title, base), lbl, [n[b][idx] for n in norm], colors,
+                       energy.COMPARE, fmt)
+            axes[0][b].axhline(1, color='grey', ls='--', lw=0.8)
+
+        SaveFig(figname, page)
+
+def PlotEnergyHier (data=None):
+    """Plot the energy of each module per benchmark, relative to the baseline energy"""
+
+    InitPlots()
+    data      = data or os.getenv('KEYV_DATA')
+    figname   = os.path.join(data, "energy_hier." + config.fig_ext)
+    bench     = LoadBenchmarks(data)
+
+    with perf.stage('derive'):
+        en        = energy.Energy(bench)
+        base      = EnergyBaseline(en)
+        rel       = en.breakdown() / en['ENERGY'][:, en.baseline(base), None, None]
+        labels    = en.labels()
+
+    for page, idx in enumerate(Pages(len(bench.processors))):
+        with perf.stage('layout'):
+            fig       = plt.figure(figsize=(2 * config.fig_size[0], config.fig_size[1]))
+            fmt       = '{:.2f}'
+            lbl, axes = BenchAxes(bench, 1, idx)
+            plt.subplots_adjust(left=0.05, right=0.99, bottom=TickRoom(len(idx)), top=0.9, hspace=0.3)
+
+        for b, name in enumerate(bench.benchmarks):
+            title, _, _ = benchmarks.score_info(name)
+            cmap, _, _, stacked = BenchStyle(b)
+            colors = cmap(np.linspace(*stacked, len(labels)))
+            BarStacked(axes[0][b], '{} energy (vs. {})'.format(title, base), lbl, list(rel[b][idx].T), colors,
+                       labels, fmt)
+
+        SaveFig(figname, page)
 
-    #------------------------------------------------------------------------
-    # CoreMark
-    #------------------------------------------------------------------------
-    cm_exec      = dat_cm[head.index('PERIOD')] * dat_cm[head.index('CYCLES')]
-    cm_tot       = dat_cm[head.index('PWR-TOT')] * 1e3
-    cm_score     = 1 / cm_exec
-    cm_score_pwr = cm_score / cm_tot
-    cm_seq       = (dat_cm[head.index('PWR-SEQ')] + dat_cm[head.index('PWR-REG')]) * 1e3
-    cm_ct        = dat_cm[head.index('PWR-CT')] * 1e3
-    cm_cmb       = dat_cm[head.index('PWR-CMB')] * 1e3
-    cm_grp       = [cm_ct, cm_seq, cm_cmb]
-    cm_int       = dat_cm[head.index('PWR-INT')] * 1e3
-    cm_sw        = dat_cm[head.index('PWR-SWITCH')] * 1e3
-    cm_lk        = dat_cm[head.index('PWR-LEAK')] * 1e3
-    cm_cat       = [cm_int, cm_lk, cm_sw]
-    cm_decode    = dat_cm[head.index('PWR-IDECODE')] * 1e3
-    cm_pc        = dat_cm[head.index('PWR-PC')] * 1e3
-    cm_rf        = dat_cm[head.index('PWR-RF')] * 1e3
-    cm_alu       = dat_cm[head.index('PWR-ALU')] * 1e3
-    cm_lsu       = dat_cm[head.index('PWR-LSU')] * 1e3
-    cm_sys       = dat_cm[head.index('PWR-SYS')] * 1e3
-    cm_perf      = dat_cm[head.index('PWR-SYS')] * 1e3
-    cm_rst_s     = dat_cm[head.index('PWR-RST-SYNC')] * 1e3
-    cm_perf_s    = dat_cm[head.index('PWR-PERF-SYNC')] * 1e3
-    cm_keyring   = dat_cm[head.index('PWR-KEYRING')] * 1e3
-    cm_xbs       = dat_cm[head.index('PWR-XBS')] * 1e3
-    cm_xu0       = dat_cm[head.index('PWR-XU0')] * 1e3
-    cm_xu1       = dat_cm[head.index('PWR-XU1')] * 1e3
-    cm_xu2       = dat_cm[head.index('PWR-XU2')] * 1e3
-    cm_xu3       = dat_cm[head.index('PWR-XU3')] * 1e3
-    cm_xu4       = dat_cm[head.index('PWR-XU4')] * 1e3
-    cm_xu5       = dat_cm[head.index('PWR-XU5')] * 1e3
-    cm_modules   = (cm_decode + cm_pc + cm_rf + cm_alu + cm_lsu + cm_sys + cm_perf)
-    cm_oth       = cm_tot - cm_modules
-    cm_hier      = [cm_rf, cm_alu, cm_decode, cm_sys, cm_perf, cm_pc, cm_lsu, cm_oth]
+#------------------------------------------------------------------------
+# Scores (data only: no matplotlib)
+#------------------------------------------------------------------------
+SCORES_HEADER = ['PROCESSOR', 'BENCHMARK', 'UNIT', 'SCORE', 'SCORE-MW', 'POWER-MW', 'EXEC-TIME']
 
-    #------------------------------------------------------------------------
-    # Scores + Score/Power
-    #------------------------------------------------------------------------
-    ps_fig      = plt.figure(figsize=fig_size)
-    ps_format   = '{:.2f}'
-    ps_s_dh_color = cmap_civ(np.linspace(0.1, 0.2, 1))
-    ps_s_cm_color = cmap_vir(np.linspace(0.5, 0.6, 1))
-    ps_dh_color = cmap_civ(np.linspace(0.3, 0.4, 1))
-    ps_cm_color = cmap_vir(np.linspace(0.7, 0.8, 1))
-
-    ps_s_dh_ax = plt.subplot(221)
-    ps_s_dh_ax.set_xticks(lbl)
-    ps_s_dh_ax.set_xticklabels(lbl_x)
-    ps_s_cm_ax = plt.subplot(222, sharex=ps_s_dh_ax)
-    ps_dh_ax = plt.subplot(223, sharex=ps_s_dh_ax)
-    ps_cm_ax = plt.subplot(224, sharex=ps_s_dh_ax)
-    plt.subplots_adjust(left=0.1, right=0.99, bottom=0.1, top=0.9, hspace=0.3)
-
-    Bars(ps_s_dh_ax, 'Dhrystone (DMIPS)', lbl, dh_score, ps_s_dh_color, ps_format)
-    Bars(ps_s_cm_ax, 'Coremark (CM)', lbl, cm_score, ps_s_cm_color, ps_format)
-    Bars(ps_dh_ax, 'Dhrystone (DMIPS/mW)', lbl, dh_score_pwr, ps_dh_color, ps_format)
-    Bars(ps_cm_ax, 'Coremark (CM/mW)', lbl, cm_score_pwr, ps_cm_color, ps_format)
-
-    plt.savefig(ps_figname, dpi=fig_dpi, format=fig_ext, papertype='letter', orientation='landscape')
-    plt.close()
+def Scores (data=None):
+    """Returns [(processor, benchmark, unit, score, score/mW, power (mW), exec time (s))]
 
-    #------------------------------------------------------------------------
-    # Power Groups
-    #------------------------------------------------------------------------
-    pg_fig       = plt.figure(figsize=fig_size)
-    pg_labels    = ['CT', 'SEQ', 'CMB']
-    pg_format    = '{:.2f}'
-    pg_dh_colors = cmap_civ(np.linspace(0.1, 0.9, len(pg_labels)))
-    pg_cm_colors = cmap_vir(np.linspace(0.2, 0.8, len(pg_labels)))
-
-    pg_dh_ax = plt.subplot(121)
-    pg_dh_ax.set_xticks(lbl)
-    pg_dh_ax.set_xticklabels(lbl_x)
-    pg_cm_ax = plt.subplot(122, sharex=pg_dh_ax)
-    plt.subplots_adjust(left=0.05, right=0.99, bottom=0.1, top=0.9, hspace=0.3)
-
-    BarStacked(pg_dh_ax, 'Dhrystone (mW)', lbl, dh_grp, pg_dh_colors, pg_labels, pg_format)
-    BarStacked(pg_cm_ax, 'Coremark (mW)', lbl, cm_grp, pg_cm_colors, pg_labels, pg_format)
-
-    plt.savefig(pg_figname, dpi=fig_dpi, format=fig_ext, papertype='letter', orientation='landscape')
-    plt.close()
+    Pairs missing from benchmarks_summary.csv are left out."""
 
-    #------------------------------------------------------------------------
-    # Power Categories
-    #------------------------------------------------------------------------
-    pc_fig       = plt.figure(figsize=fig_size)
-    pc_labels    = ['INTERNAL', 'LEAKAGE', 'SWITCH']
-    pc_format    = '{:.2f}'
-    pc_dh_colors = cmap_civ(np.linspace(0.1, 0.9, len(pc_labels)))
-    pc_cm_colors = cmap_vir(np.linspace(0.2, 0.8, len(pc_labels)))
-
-    pc_dh_ax = plt.subplot(121)
-    pc_dh_ax.set_xticks(lbl)
-    pc_dh_ax.set_xticklabels(lbl_x)
-    pc_cm_ax = plt.subplot(122, sharex=pc_dh_ax)
-    plt.subplots_adjust(left=0.05, right=0.99, bottom=0.1, top=0.9)
-
-    BarStacked(pc_dh_ax, 'Dhrystone (mW)', lbl, dh_cat, pc_dh_colors, pc_labels, pc_format)
-    BarStacked(pc_cm_ax, 'Coremark (mW)', lbl, cm_cat, pc_cm_colors, pc_labels, pc_format)
-
-    plt.savefig(pc_figname, dpi=fig_dpi, format=fig_ext, papertype='letter', orientation='landscape')
-    plt.close()
+    bench = LoadBenchmarks(data)
+    cols  = [bench.score(), bench.score_pwr(), bench.power(), bench.exec_time()]
+    rows  = []
+    for b, name in enumerate(bench.benchmarks):
+        unit = benchmarks.score_info(name)[1]
+        for p, proc in enumerate(bench.processors):
+            vals = [float(c[b, p]) for c in cols]
+            if not np.isnan(vals[0]):
+                rows.append((str(proc), str(name), unit, *vals))
+    return rows
 
-    #------------------------------------------------------------------------
-    # Power Hierarchy
-    #------------------------------------------------------------------------
-    ph_fig       = plt.figure(figsize=fig_size)
-    ph_labels    = ['RF', 'ALU', 'DECODE', 'SYS', 'PERF', 'PC', 'LSU', 'OTHER']
-    ph_format    = '{:.2f}'
-    ph_dh_colors = cmap_civ(np.linspace(0.1, 0.9, len(ph_labels)))
-    ph_cm_colors = cmap_vir(np.linspace(0.2, 0.8, len(ph_labels)))
-
-    ph_dh_ax = plt.subplot(121)
-    ph_dh_ax.set_xticks(lbl)
-    ph_dh_ax.set_xticklabels(lbl_x)
-    ph_cm_ax = plt.subplot(122, sharex=ph_dh_ax)
-    plt.subplots_adjust(left=0.05, right=0.99, bottom=0.1, top=0.9)
-
-    BarStacked(ph_dh_ax, 'Dhrystone (mW)', lbl, dh_hier, ph_dh_colors, ph_labels, ph_format)
-    BarStacked(ph_cm_ax, 'Coremark (mW)', lbl, cm_hier, ph_cm_colors, ph_labels, ph_format)
-
-    plt.savefig(ph_figname, dpi=fig_dpi, format=fig_ext, papertype='letter', orientation='landscape')
-    plt.close()
+def ExportScores (data=None, csv_f=None):
+    """Write Scores() in <csv_f> ($KEYV_DATA/scores_summary.csv by default)"""
+
+    data  = data or os.getenv('KEYV_DATA')
+    csv_f = csv_f or os.path.join(data, 'scores_summary.csv')
+    lines = [','.join(SCORES_HEADER)]
+    lines += ['{},{},{},{:.6e},{:.6e},{:.6e},{:.6e}'.format(*r) for r in Scores(data)]
+    write_csv(csv_f, lines, verbose=False)
+    return csv_f
+
+def EnergyModel (data=None):
+    """Returns the Energy model of benchmarks_summary.csv & its baseline processor"""
+
+    en = energy.Energy(LoadBenchmarks(data))
+    return en, EnergyBaseline(en)
 
+def ExportEnergy (data=None):
+    """Write the energy metrics in $KEYV_DATA (see kvlib/energy.py), returns the csv files
+
+    energy_summary.csv holds absolute values (SI units), energy_normalized.csv
+    values relative to the baseline processor."""
+
+    data     = data or os.getenv('KEYV_DATA')
+    en, base = EnergyModel(data)
+    return [energy.write_energy(en, os.path.join(data, 'energy_summary.csv')),
+            energy.write_energy(en, os.path.join(data, 'energy_normalized.csv'), base)]
 
 #-----------------------------------------------------------------------------
 #
 #                                   STA
 #
 #-----------------------------------------------------------------------------
-def PlotSta ():
+def StaChart (figname, stages, arrival, slack, err, err_label=None):
+    """Gantt-like setup & hold chart of the (stage x direction) data arrival time & slack
+
+    <err> is the (stage x direction) or (2 x stage x direction) error bar at
+    the end of each slack bar."""
+
+    err = np.asarray(err)
+    with perf.stage('layout'):
+        fig = plt.figure(figsize=(15,10))
+        fig.subplots_adjust(top=0.9,bottom=0.1,left=0.1,right=0.9)
+
+        labels = stages
+        x = np.arange(len(labels))
+        b = config.bar_width / 2
+
+        setup_ax = plt.subplot(211)
+        hold_ax  = plt.subplot(212, sharex=setup_ax)
+
+        for ax, title, color, dirs in [(setup_ax, 'Setup', 'steelblue', timing.SETUP),
+                                       (hold_ax,  'Hold',  'seagreen',  timing.HOLD)]:
+            ax.set_title(title, fontdict={'fontsize':config.font_size_title})
+            ax.set_xticks(x)
+            ax.set_xticklabels(labels)
+            ax.tick_params(axis='both', labelsize=config.font_size_label)
+            ax.grid(True, axis='y', color='lightgrey', ls=':', zorder=0)
+
+            # One pair of bars per direction: data arrival time + slack
+            for i, (d, offset) in enumerate(zip(dirs, [-1.1*b, 0.1*b])):
+                ax.bar(x=x+offset, height=arrival[:, d], bottom=0, width=b,
+                       label='Data Arrival Time' if i == 0 else None,
+                       align='edge', color=color, alpha=config.alpha_dark, zorder=3)
+                ax.bar(x=x+offset, height=slack[:, d], bottom=arrival[:, d], width=b,
+                       label=('Slack' + (' ({})'.format(err_label) if err_label else '')) if i == 0 else None,
+                       align='edge', color=color, alpha=config.alpha_light, zorder=3,
+                       yerr=err[..., d], capsize=2)
+
+            start, end = ax.get_ylim()
+            ax.set_yticks(np.arange(start, end, 0.5))
+            ax.legend(loc='best', fontsize=config.font_size_label)
+            ax.set_ylabel('ns')
+
+    SaveFig(figname)
+
+def PlotSta (data=None):
     """Plot a gantt-like chart showing KeyV STA results for each clock"""
 
-    csv_f   = os.getenv('KEYV_DATA') + "/sta_summary.csv"
-    figname = os.getenv('KEYV_DATA') + "/sta_avg." + fig_ext
-
-    csv_head = list(np.loadtxt(csv_f, delimiter=',', unpack=True, max_rows=1, dtype=np.str))
-    head     = [x for x in csv_head if ( x != 'LAUNCH' and x != 'CAPTURE' )]
-    dat_c    = [csv_head.index(x) for x in csv_head if ( x != 'LAUNCH' and x != 'CAPTURE' )]
-    id_c     = [csv_head.index(x) for x in csv_head if ( x == 'LAUNCH' or x == 'CAPTURE' )]
-    csv_id   = np.loadtxt(csv_f, delimiter=',', unpack=True, skiprows=1, usecols=id_c, dtype=np.str)
-    csv_dat  = np.loadtxt(csv_f, delimiter=',', unpack=True, skiprows=1, usecols=dat_c)
-
-    setup_delay_dat = csv_dat[head.index('SETUP DELAY')]
-    setup_slack_dat = csv_dat[head.index('SETUP SLACK')]
-    hold_delay_dat  = csv_dat[head.index('HOLD DELAY')]
-    hold_slack_dat  = csv_dat[head.index('HOLD SLACK')]
-    lbl_launch      = csv_id[0, :]
-    lbl_capture     = csv_id[1, :]
-
-    mask_left  = [i for i in range(0, len(lbl_launch)-3, 4)]
-    mask_up    = [i for i in range(1, len(lbl_launch)-2, 4)]
-    mask_right = [i for i in range(2, len(lbl_launch)-1, 4)]
-    mask_down  = [i for i in range(3, len(lbl_launch)-0, 4)]
-
-    setup_dleft           = setup_delay_dat[mask_left]
-    setup_dup             = setup_delay_dat[mask_up]
-    hold_dright           = hold_delay_dat[mask_right]
-    hold_ddown            = hold_delay_dat[mask_down]
-    setup_sleft           = setup_slack_dat[mask_left]
-    setup_sup             = setup_slack_dat[mask_up]
-    hold_sright           = hold_slack_dat[mask_right]
-    hold_sdown            = hold_slack_dat[mask_down]
-    setup_lbl_capture     = lbl_capture[mask_left]
-    setup_lbl_launch_left = lbl_launch[mask_left]
-    setup_lbl_launch_up   = lbl_launch[mask_up]
-    hold_lbl_capture      = lbl_launch[mask_right]
-    hold_lbl_launch_right = lbl_launch[mask_right]
-    hold_lbl_launch_down  = lbl_launch[mask_down]
-
-    setup_dl = [setup_dleft[i]-setup_sleft[i] if setup_dleft[i] > 0 else 0
-                for i in range(len(setup_dleft))]
-
-    setup_sl = [setup_sleft[i] if setup_dleft[i] > 0 else 0 for i in range(len(setup_sleft))]
-
-    setup_du = [setup_dup[i]-setup_sup[i] if setup_dup[i] > 0 else 0
-                for i in range(len(setup_dup))]
-
-    setup_su = [setup_sup[i] if setup_dup[i] > 0 else 0 for i in range(len(setup_sup))]
-
-    hold_dr = [hold_dright[i]-hold_sright[i] if hold_dright[i] > 0 else 0
-                for i in range(len(hold_dright))]
-
-    hold_sr = [hold_sright[i] if hold_dright[i] > 0 else 0 for i in range(len(hold_sright))]
-
-    hold_dd = [hold_ddown[i]-hold_sdown[i] if hold_ddown[i] > 0 else 0
-                for i in range(len(hold_ddown))]
-
-    hold_sd = [hold_sdown[i] if hold_ddown[i] > 0 else 0 for i in range(len(hold_sdown))]
-
-    setup_del_left = np.array([setup_dl[0:6], setup_dl[6:12], setup_dl[12:18]])
-    setup_del_up   = np.array([setup_du[0:6], setup_du[6:12], setup_du[12:18]])
-    hold_del_right = np.array([hold_dr[0:6], hold_dr[6:12], hold_dr[12:18]])
-    hold_del_down  = np.array([hold_dd[0:6], hold_dd[6:12], hold_dd[12:18]])
-    setup_sla_left = np.array([setup_sl[0:6], setup_sl[6:12], setup_sl[12:18]])
-    setup_sla_up   = np.array([setup_su[0:6], setup_su[6:12], setup_su[12:18]])
-    hold_sla_right = np.array([hold_sr[0:6], hold_sr[6:12], hold_sr[12:18]])
-    hold_sla_down  = np.array([hold_sd[0:6], hold_sd[6:12], hold_sd[12:18]])
-
-    mean_setup_dl = np.mean(setup_del_left, axis=0)
-    mean_setup_du = np.mean(setup_del_up, axis=0)
-    mean_hold_dr  = np.mean(hold_del_right, axis=0)
-    mean_hold_dd  = np.mean(hold_del_down, axis=0)
-    mean_setup_sl = np.mean(setup_sla_left, axis=0)
-    mean_setup_su = np.mean(setup_sla_up, axis=0)
-    mean_hold_sr  = np.mean(hold_sla_right, axis=0)
-    mean_hold_sd  = np.mean(hold_sla_down, axis=0)
-
-    std_setup_l = np.std(setup_del_left + setup_sla_left, axis=0)
-    std_setup_u = np.std(setup_del_up + setup_sla_up, axis=0)
-    std_hold_r  = np.std(hold_del_right + hold_sla_right, axis=0)
-    std_hold_d  = np.std(hold_del_down + hold_sla_down, axis=0)
-
-    fig = plt.figure(figsize=(15,10))
-    fig.subplots_adjust(top=0.9,bottom=0.1,left=0.1,right=0.9)
-
-    labels = ['F', 'D', 'R', 'E', 'M', 'W']
-    x = np.arange(len(labels))
-    b = bar_width / 2
-
-    setup_ax = plt.subplot(211)
-    setup_ax.set_title('Setup', fontdict={'fontsize':font_size_title})
-    setup_ax.set_xticks(x)
-    setup_ax.set_xticklabels(labels)
-    setup_ax.tick_params(axis='both', labelsize=font_size_label)
-    setup_ax.grid(True, axis='y', color='lightgrey', ls=':', zorder=0)
-
-    setup_bars = [
-        setup_ax.bar(x=x-1.1*b, height=mean_setup_dl, bottom=0, width=b, label='Data Arrival Time',
-                     align='edge', color='steelblue', alpha=alpha_dark, zorder=3),
-
-        setup_ax.bar(x=x-1.1*b, height=mean_setup_sl, bottom=mean_setup_dl, width=b, label='Slack',
-                     align='edge', color='steelblue', alpha=alpha_light, zorder=3,
-                     yerr=std_setup_l, capsize=2),
-
-        setup_ax.bar(x=x+0.1*b, height=mean_setup_du, bottom=0, width=b,
-                     align='edge', color='steelblue', alpha=alpha_dark, zorder=3),
-
-        setup_ax.bar(x=x+0.1*b, height=mean_setup_su, bottom=mean_setup_du, width=b,
-                     align='edge', color='steelblue', alpha=alpha_light, zorder=3,
-                     yerr=std_setup_u, capsize=2)
-        ]
-
-    hold_ax = plt.subplot(212, sharex=setup_ax)
-    hold_ax.set_title('Hold', fontdict={'fontsize':font_size_title})
-    hold_ax.set_xticks(x)
-    hold_ax.set_xticklabels(labels)
-    hold_ax.tick_params(axis='both', labelsize=font_size_label)
-    hold_ax.grid(True, axis='y', color='lightgrey', ls=':', zorder=0)
-
-    hold_bars = [
-        hold_ax.bar(x=x-1.1*b, height=mean_hold_dr, bottom=0, width=b, label='Data Arrival Time',
-                    align='edge', color='seagreen', alpha=alpha_dark, zorder=3),
-
-        hold_ax.bar(x=x-1.1*b, height=mean_hold_sr, bottom=mean_hold_dr, width=b, label='Slack',
-                    align='edge', color='seagreen', alpha=alpha_light, zorder=3,
-                    yerr=std_hold_r, capsize=2),
-
-        hold_ax.bar(x=x+0.1*b, height=mean_hold_dd, bottom=0, width=b,
-                    align='edge', color='seagreen', alpha=alpha_dark, zorder=3),
-
-        hold_ax.bar(x=x+0.1*b, height=mean_hold_sd, bottom=mean_hold_dd, width=b,
-                    align='edge', color='seagreen', alpha=alpha_light, zorder=3,
-                    yerr=std_hold_d, capsize=2)
-    ]
-
-    setup_start, setup_end = setup_ax.get_ylim()
-    setup_ax.set_yticks(np.arange(setup_start, setup_end, 0.5))
-    setup_ax.legend(loc='best', fontsize=font_size_label)
-    setup_ax.set_ylabel('ns')
-
-    hold_start, hold_end = hold_ax.get_ylim()
-    hold_ax.set_yticks(np.arange(hold_start, hold_end, 0.5))
-    hold_ax.legend(loc='best', fontsize=font_size_label)
-    hold_ax.set_ylabel('ns')
-
-    plt.savefig(figname, dpi=fig_dpi, format=fig_ext, papertype='letter', orientation='landscape')
-    plt.close()
+    InitPlots()
+    data    = data or os.getenv('KEYV_DATA')
+    csv_f   = os.path.join(data, "sta_summary.csv")
+    figname = os.path.join(data, "sta_avg." + config.fig_ext)
+
+    with perf.stage('load'):
+        sta             = timing.load_sta(csv_f)
+
+    with perf.stage('derive'):
+        arrival, slack  = sta.mean()
+        std             = sta.std()
+
+    StaChart(figname, sta.stages, arrival, slack, std)
+
+def PlotStaStats (stats, figname, q=(1, 99)):
+    """Plot the mean data arrival time & slack of StaStats <stats>, slack percentiles <q> as error bars"""
+
+    InitPlots()
+    with perf.stage('derive'):
+        used           = stats.count.sum(axis=1) > 0
+        arrival, slack = (m[used] for m in stats.mean())
+        lo, hi         = stats.percentile(q)[:, used]
+
+        # Error bars from the low to the high percentile of the slack
+        err = np.maximum(np.nan_to_num(np.stack([slack - lo, hi - slack])), 0)
+
+    StaChart(figname, np.asarray(stats.stages)[used], arrival, slack, err,
+             'p{:g}-p{:g}, {} runs'.format(q[0], q[1], stats.files))
 
 #-----------------------------------------------------------------------------
 #
 #                                  MAIN
 #
 #-----------------------------------------------------------------------------
+
+# Each figure is an independent rendering job: (name, function, csv inputs)
+FIGURES = [
+    ('area',             PlotArea,            ['area_summary.csv']),
+    ('power_score',      PlotPowerScore,      ['benchmarks_summary.csv']),
+    ('power_groups',     PlotPowerGroups,     ['benchmarks_summary.csv']),
+    ('power_categories', PlotPowerCategories, ['benchmarks_summary.csv']),
+    ('power_hier',       PlotPowerHier,       ['benchmarks_summary.csv']),
+    ('energy',           PlotEnergy,          ['benchmarks_summary.csv']),
+    ('energy_hier',      PlotEnergyHier,      ['benchmarks_summary.csv']),
+    ('sta_avg',          PlotSta,             ['sta_summary.csv']),
+]
+
+# Rendering commands: figures of one summary (or all)
+COMMANDS = {
+    'area':  'area_summary.csv',
+    'bench': 'benchmarks_summary.csv',
+    'sta':   'sta_summary.csv',
+    'all':   None,
+}
+
+def Figures(command='all'):
+    """Returns the names of the FIGURES of <command>"""
+
+    return [name for name, func, inputs in FIGURES if COMMANDS[command] in [None] + inputs]
+
+def RenderFigure(name, data, cfg):
+    """Render figure <name> of FIGURES from the summaries of <data>, with PlotConfig <cfg>
+
+    Returns the files of its pages after the first one, whose stale pages are removed."""
+
+    Configure(cfg)
+    del _saved[:]
+    {n: func for n, func, inputs in FIGURES}[name](data)
+
+    figname = os.path.join(data, name + '.' + config.fig_ext)
+    pages   = sorted(set(_saved) - {figname})
+    RemovePages(figname, len(pages) + 1)
+    return pages
+
+def FigureTargets(data, names=None):
+    """Returns the build targets of FIGURES (or <names>) in the <data> directory"""
+
+    params  = config.params()
+    sources = [os.path.abspath(m.__file__) for m in (sys.modules[__name__], table, benchmarks, energy, timing)]
+    return [build.Target(name, os.path.join(data, name + '.' + config.fig_ext),
+                         [os.path.join(data, i) for i in inputs] + sources,
+                         params)
+            for name, func, inputs in FIGURES if names is None or name in names]
+
+def Update(data, names, n_jobs=1, force=False, prof=None, cprof_f=None):
+    """Render the stale figures <names> of <data>, returns the rendered targets"""
+
+    with perf.stage('targets'):
+        manifest = build.Manifest(os.path.join(data, table.CACHE_DIR, 'plots.json'))
+        targets  = build.stale_targets(FigureTargets(data, names), manifest, force)
+
+    if targets:
+        pages = render.render([(t.name, RenderFigure, (t.name, data, config)) for t in targets],
+                              n_jobs, prof, cprof_f)
+        for t, p in zip(targets, pages):
+            manifest.record(t, p)
+    manifest.save()
+    return targets
+
+def Archive(data):
+    """Archive the summaries of <data> in the results history (if they changed)"""
+
+    with perf.stage('history'):
+        with history.open_history(data) as hist:
+            run = hist.ingest(data)
+    if run:
+        print("Archived run {} in {}".format(run, os.path.join(data, history.DB_NAME)))
+
+#------------------------------------------------------------------------
+# Watch mode
+#------------------------------------------------------------------------
+STATUS = 'plots_status.json'
+
+def FigureStatus(data, names):
+    """Returns {figure: {output, rendered, fresh}} of figures <names>"""
+
+    manifest = build.Manifest(os.path.join(data, table.CACHE_DIR, 'plots.json'))
+    status   = {}
+    for t in FigureTargets(data, names):
+        exists = os.path.exists(t.output)
+        status[t.name] = {'output': t.output, 'rendered': os.path.getmtime(t.output) if exists else None,
+                          'fresh': not manifest.stale(t)}
+    return status
+
+def Watch(data, names, n_jobs=1, interval=1.0, debounce=2.0, archive=True, status_f=None):
+    """Parse the reports & render the figures <names> of <data> again when they change
+
+    Runs until interrupted. The status file (state: idle, parsing, rendering
+    or stopped; figures: see FigureStatus; errors of the last update) is
+    updated at each step."""
+
+    from kvlib.parse import cores
+
+    status_f  = status_f or os.path.join(data, table.CACHE_DIR, STATUS)
+    summaries = sorted({os.path.join(data, i) for n, f, inputs in FIGURES if n in names for i in inputs})
+    reports   = [os.path.join(data, c, '*.rpt') for c in cores.CORES]
+    watcher   = watch.Watcher(summaries + reports, interval, debounce)
+    errors    = []
+
+    def Status(state, **extra):
+        watch.write_status(status_f, dict(extra, state=state, errors=errors,
+                                          figures=FigureStatus(data, names)))
+
+    def Render():
+        try:
+            Status('rendering')
+            for t in Update(data, names, n_jobs):
+                print("Updated: {}".format(t.output))
+            if archive:
+                Archive(data)
+        except Exception as err:
+            errors.append('render: {}'.format(err))
+
+    # A kill (SIGTERM) stops the loop as Ctrl-C does: the status says so
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    InitPlots()
+    Render()
+    Status('idle')
+    print("Watching {} summaries & {}/<core>/*.rpt (status: {})".format(len(summaries), data, status_f))
+
+    try:
+        while True:
+            changed = watcher.wait()
+            errors  = []
+
+            # Reports: parse the cores again (their csv files are not summaries)
+            parse = sorted({os.path.basename(os.path.dirname(f)) for f in changed if f.endswith('.rpt')})
+            if parse:
+                Status('parsing', cores=parse)
+                for core in parse:
+                    try:
+                        cores.parse_all([core], data, 1)
+                    except Exception as err:
+                        errors.append('parse {}: {}'.format(core, err))
+
+            if any(f in summaries for f in changed):
+                Render()
+            Status('idle', changed=sorted(changed))
+            for e in errors:
+                print("Error: {}".format(e))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        Status('stopped')
+
 if __name__ == '__main__':
 
     # Verify the environment
@@ -489,25 +973,90 @@ if __name__ == '__main__':
         print("Setup the environment with setup.csh prior to running this script")
         raise
 
+    parser = argparse.ArgumentParser(description='Plot data from csv summaries')
+    parser.add_argument('command', nargs='?', default='all', choices=list(COMMANDS) + ['scores', 'energy', 'export'],
+                        help='Figures to render (default: all), or data only commands: print the benchmark '
+                             'scores (scores) or energy metrics (energy), write both (export)')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='Number of rendering processes (0: one per cpu)')
+    parser.add_argument('-f', '--force', action='store_true',
+                        help='Render all figures, even if they are up-to-date')
+    parser.add_argument('--no-history', action='store_true',
+                        help='Do not archive the csv summaries in the results history')
+    parser.add_argument('--profile', metavar='TRACE',
+                        help='Time the stages of each figure, write the json trace in TRACE')
+    parser.add_argument('--no-memory', action='store_true',
+                        help='With --profile, do not trace the peak memory (tracemalloc slows rendering down)')
+    parser.add_argument('--cprofile', metavar='FILE',
+                        help='Dump the cProfile stats of the rendered figures in FILE (see pstats)')
+    parser.add_argument('--format', default=config.fig_ext,
+                        help='Figure format: png (default), svg, pdf... or html (inline SVG pages)')
+    parser.add_argument('--facet', type=int, default=config.facet_size,
+                        help='Processors per page (default: {}, 0: all on one page)'.format(config.facet_size))
+    parser.add_argument('-w', '--watch', action='store_true',
+                        help='Keep running: parse & render again when reports or summaries change')
+    parser.add_argument('--interval', type=float, default=1.0,
+                        help='With --watch, polling interval in seconds (default: 1)')
+    parser.add_argument('--debounce', type=float, default=2.0,
+                        help='With --watch, wait for N seconds without writes before updating (default: 2)')
+    args = parser.parse_args()
+
+    data = os.getenv('KEYV_DATA')
+    Configure(PlotConfig(fig_ext=args.format, facet_size=args.facet or None))
+
+    #------------------------------------------------------------------------
+    # Data only commands
+    #------------------------------------------------------------------------
+    if args.command == 'scores':
+        print('{:<12s} {:<12s} {:>10s} {:>12s} {:>10s}'.format(
+            'PROCESSOR', 'BENCHMARK', 'SCORE', 'SCORE/mW', 'POWER mW'))
+        for proc, bench, unit, score, score_pwr, pwr, t in Scores(data):
+            print('{:<12s} {:<12s} {:>10.2f} {:>12.4f} {:>10.4f}  {}'.format(
+                proc, bench, score, score_pwr, pwr, unit))
+        sys.exit(0)
+
+    if args.command == 'energy':
+        en, base = EnergyModel(data)
+        norm     = {m: en.normalized(m, base) for m in ['ENERGY', 'EDP', 'ED2P']}
+        print('{:<12s} {:<12s} {:>6s} {:>10s} {:>8s} {:>8s} {:>8s} {:>8s}'.format(
+            'PROCESSOR', 'BENCHMARK', 'CPI', 'ENERGY uJ', 'EPI pJ', 'ENERGY', 'EDP', 'ED2P'))
+        for b, bench in enumerate(en.benchmarks):
+            for p, proc in enumerate(en.processors):
+                if np.isnan(en['ENERGY'][b, p]):
+                    continue
+                print('{:<12s} {:<12s} {:>6.3f} {:>10.3f} {:>8.2f} {:>8.3f} {:>8.3f} {:>8.3f}'.format(
+                    proc, bench, en['CPI'][b, p], 1e6 * en['ENERGY'][b, p], 1e12 * en['EPI'][b, p],
+                    *[norm[m][b, p] for m in norm]))
+        print('(ENERGY, EDP & ED2P relative to {})'.format(base))
+        sys.exit(0)
+
+    if args.command == 'export':
+        print(ExportScores(data))
+        print('\n'.join(ExportEnergy(data)))
+        sys.exit(0)
+
+    if args.watch:
+        Watch(data, Figures(args.command), args.jobs, args.interval, args.debounce, not args.no_history)
+        sys.exit(0)
+
+    prof = perf.enable(not args.no_memory) if args.profile else None
+
+    #------------------------------------------------------------------------
+    # Plots (stale figures only)
+    #------------------------------------------------------------------------
+    targets = Update(data, Figures(args.command), args.jobs, args.force, prof, args.cprofile)
+
     #------------------------------------------------------------------------
-    # Global Parameters
+    # History (unchanged summaries are not archived twice)
     #------------------------------------------------------------------------
-    fig_size        = (7,7)
-    fig_size_half   = (4,7)
-    fig_dpi         = 200
-    fig_ext         = 'png'
-    font_size_label = 12
-    font_size_title = 14
-    alpha_dark      = 0.85
-    alpha_light     = 0.55
-    bar_width       = 0.7
-    bar_align       = 'edge'
-    cmap_civ        = plt.cm.get_cmap('cividis', 64)
-    cmap_vir        = plt.cm.get_cmap('viridis', 64)
+    if not args.no_history:
+        Archive(data)
 
     #------------------------------------------------------------------------
-    # Plots
+    # Profile
     #------------------------------------------------------------------------
-    PlotArea()
-    PlotBenchmarks()
-    PlotSta()
+    if prof is not None:
+        perf.disable()
+        prof.write(args.profile, jobs=args.jobs, figures=[t.name for t in targets])
+        print('\n'.join(prof.report()))
+        print("Trace: {}".format(args.profile))
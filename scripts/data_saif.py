@@ -0,0 +1,119 @@
+#!/bin/env python3
+#-----------------------------------------------------------------------------
+# Project : KeyV
+# File    : data_saif.py
+# Author  : Mickael Fiorentino <mickael.fiorentino@polymtl.ca>
+# Lab     : GRM - Polytechnique Montreal
+# Date    : <2026-10-17 Sat>
+# Brief   : Per module switching activity of SAIF files (make saif)
+#-----------------------------------------------------------------------------
+# [tcsh]% source setup.csh
+# [tcsh]% ./scripts/data_saif.py [--dut PATH] [--ports] [--jobs N] saif [saif ...]
+#
+# For each <name>.saif, the activity of the children of the DUT is written to
+# $KEYV_DATA/<name>.activity.csv and plotted in <name>.activity.<ext>. With
+# several files, the toggles of each run are compared in saif_compare.<ext>.
+#-----------------------------------------------------------------------------
+import os
+import argparse
+import numpy as np
+import data_plots as dp
+from kvlib import table
+from kvlib import render
+from kvlib.parse import saif
+
+def RunName (saif_f):
+    """Returns the name of a SAIF file (<design>.<step>.<bench>)"""
+
+    name = os.path.basename(saif_f)
+    return name[:-len('.saif')] if name.endswith('.saif') else name
+
+def ModuleNames (tab):
+    """Returns the module labels of an activity table (without u_)"""
+
+    return [m[2:] if m.startswith('u_') else m for m in tab['MODULE']]
+
+def PlotActivity (saif_f, csv_f, figname, dut, ports):
+    """Parse <saif_f> into <csv_f>, plot toggles per net & duty cycles per module"""
+
+    saif.write_activity(saif.parse_saif(saif_f, ports), csv_f, dut)
+
+    dp.InitPlots()
+    plt = dp.plt
+    tab = table.load_table(csv_f, labels=['MODULE'], cache=False)
+    x   = ModuleNames(tab)
+
+    # Time at 1 / X, as a share of the recorded time of all nets
+    time = np.maximum(tab['T0'] + tab['T1'] + tab['TX'], 1)
+
+    fig = plt.figure(figsize=(dp.config.fig_size[0] * 2, dp.config.fig_size[1]))
+    fig.suptitle(RunName(saif_f), fontsize=dp.config.font_size_title)
+
+    ax = plt.subplot(211)
+    dp.Bars(ax, 'Toggles per net (TC)', x, tab['TC-NET'], dp.cmap_civ(0.3), '{:.0f}')
+    ax.tick_params(axis='x', labelrotation=45)
+
+    ax = plt.subplot(212)
+    dp.BarStacked(ax, 'Duty cycle (%)', x, [100 * tab['T1'] / time, 100 * tab['TX'] / time],
+                  [dp.cmap_vir(0.5), dp.cmap_vir(0.8)], ['T1', 'TX'], '{:.0f}')
+    ax.tick_params(axis='x', labelrotation=45)
+
+    plt.tight_layout()
+    dp.SaveFig(figname)
+
+def PlotCompare (csv_list, names, figname):
+    """Compare the toggles (TC) of several runs, stacked by module"""
+
+    dp.InitPlots()
+    plt  = dp.plt
+    tabs = [table.load_table(f, labels=['MODULE'], cache=False) for f in csv_list]
+
+    # Union of the modules of all runs (e.g. synv vs. keyv)
+    mods = sorted({m for t in tabs for m in ModuleNames(t)}, key=lambda m: (m != '.', m))
+    data = np.zeros((len(mods), len(tabs)))
+    for j, t in enumerate(tabs):
+        for m, tc in zip(ModuleNames(t), t['TC']):
+            data[mods.index(m), j] = tc / 1e6
+
+    fig = plt.figure(figsize=(max(dp.config.fig_size[0], 1.5 * len(names)), dp.config.fig_size[1]))
+    ax  = plt.subplot(111)
+    dp.BarStacked(ax, 'Toggles (millions)', names, list(data),
+                  [dp.cmap_civ(c) for c in np.linspace(0.1, 0.9, len(mods))], mods, '{:.1f}')
+    ax.tick_params(axis='x', labelrotation=20)
+    ax.legend(loc='upper left', bbox_to_anchor=(1, 1), fontsize=dp.config.font_size_label)
+
+    plt.tight_layout()
+    dp.SaveFig(figname)
+
+#-----------------------------------------------------------------------------
+#
+#                                  MAIN
+#
+#-----------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    # Verify the environment
+    try: os.environ['KEYV_HOME']
+    except KeyError:
+        print("Setup the environment with setup.csh prior to running this script")
+        raise
+
+    parser = argparse.ArgumentParser(description='Per module switching activity of SAIF files')
+    parser.add_argument('saif', nargs='+', help='SAIF files')
+    parser.add_argument('--dut', default=saif.DUT, help='DUT instance (default: {})'.format(saif.DUT))
+    parser.add_argument('--ports', action='store_true', help='Include instance ports')
+    parser.add_argument('-j', '--jobs', type=int, default=0,
+                        help='Number of parsing processes (0: one per cpu)')
+    args = parser.parse_args()
+
+    data  = os.getenv('KEYV_DATA')
+    names = [RunName(f) for f in args.saif]
+    csvs  = [os.path.join(data, n + '.activity.csv') for n in names]
+
+    render.render([(n, PlotActivity, (f, c, os.path.join(data, n + '.activity.' + dp.config.fig_ext),
+                                      args.dut, args.ports))
+                   for n, f, c in zip(names, args.saif, csvs)], args.jobs)
+
+    if len(csvs) > 1:
+        render.render([('saif_compare', PlotCompare,
+                        (csvs, names, os.path.join(data, 'saif_compare.' + dp.config.fig_ext)))])
@@ -0,0 +1,60 @@
+#!/bin/env python3
+#-----------------------------------------------------------------------------
+# Project : KeyV
+# File    : data_sim.py
+# Author  : Mickael Fiorentino <mickael.fiorentino@polymtl.ca>
+# Lab     : GRM - Polytechnique Montreal
+# Date    : <2026-10-17 Sat>
+# Brief   : Run benchmarks on the RV32IM ISS (no HDL simulator needed)
+#-----------------------------------------------------------------------------
+# [tcsh]% source setup.csh
+# [tcsh]% ./scripts/data_sim.py [--core NAME] [--hex FILE] [bench ...]
+#
+# Benchmarks are read from $KEYV_SW_BENCH/<bench>/<bench>_mem.hex (see
+# software/Makefile). The IOPAD memory is dumped as run.do does, into
+# $KEYV_DATA/<core>/<core>.sim.<bench>.rpt, where data_parse.py reads the
+# cycles & instructions counters. Cycles are an estimate (see kvlib/iss.py).
+#-----------------------------------------------------------------------------
+import os
+import time
+import argparse
+from kvlib import iss
+from kvlib.parse import cores
+from kvlib.parse.bench import BENCHMARKS
+
+#-----------------------------------------------------------------------------
+#
+#                                  MAIN
+#
+#-----------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    # Verify the environment
+    try: os.environ['KEYV_HOME']
+    except KeyError:
+        print("Setup the environment with setup.csh prior to running this script")
+        raise
+
+    parser = argparse.ArgumentParser(description='Run benchmarks on the RV32IM ISS')
+    parser.add_argument('benchmarks', nargs='*', default=BENCHMARKS,
+                        help='Benchmarks to run (default: {})'.format(' '.join(BENCHMARKS)))
+    parser.add_argument('--core', default='iss', help='Processor name of the reports (default: iss)')
+    parser.add_argument('--hex', help='Memory image (single benchmark only)')
+    parser.add_argument('--max-insts', type=int, default=iss.MAX_INSTS,
+                        help='Maximum number of instructions per benchmark')
+    parser.add_argument('--branch-penalty', type=int, default=iss.BRANCH_PENALTY,
+                        help='Cycles per taken branch or jump (default: {})'.format(iss.BRANCH_PENALTY))
+    args = parser.parse_args()
+
+    if args.hex and len(args.benchmarks) != 1:
+        parser.error("--hex requires a single benchmark")
+
+    for bench in args.benchmarks:
+        hex_f = args.hex or os.path.join(os.environ['KEYV_SW_BENCH'], bench, bench + '_mem.hex')
+        rpt   = cores.core_path(os.environ['KEYV_DATA'], cores.SIM_RPT, args.core).replace('<B>', bench)
+
+        start = time.perf_counter()
+        sim   = iss.simulate(hex_f, rpt, args.max_insts, args.branch_penalty)
+        t     = time.perf_counter() - start
+        print("{}: {} instructions, {} cycles, exit code {} ({:.1f}s, {:.2f} MIPS)".format(
+            bench, sim.insts, sim.cycles, sim.pad()[0], t, sim.insts / t / 1e6))
@@ -0,0 +1,95 @@
+#!/bin/env python3
+#-----------------------------------------------------------------------------
+# Project : KeyV
+# File    : data_sta.py
+# Author  : Mickael Fiorentino <mickael.fiorentino@polymtl.ca>
+# Lab     : GRM - Polytechnique Montreal
+# Date    : <2026-10-17 Sat>
+# Brief   : STA statistics across PVT corners & Monte-Carlo runs
+#-----------------------------------------------------------------------------
+# [tcsh]% source setup.csh
+# [tcsh]% ./scripts/data_sta.py [CSV|DIR ...] [--jobs N] [-q 1 50 99] [--no-plot] [--no-cache]
+#
+# Every timing csv given, or found under the directories given (*.timing.csv,
+# $KEYV_DATA by default), is folded into per (stage, direction) statistics
+# of the arrival time & slack in one streaming pass (see kvlib/stats.py).
+# With --jobs, the files are split between processes whose statistics are
+# merged. The statistics are printed & written in $KEYV_DATA/sta_stats.csv,
+# and the setup & hold chart of sta_avg is drawn in $KEYV_DATA/sta_corners.<ext>,
+# with the p1-p99 slack range of each bar.
+#-----------------------------------------------------------------------------
+import os
+import glob
+import time
+import argparse
+import data_plots as dp
+from kvlib import stats
+from kvlib.timing import DIRECTIONS, SETUP
+
+def TimingFiles (paths):
+    """Returns the timing csvs <paths> & the *.timing.csv under the directories of <paths>"""
+
+    files = []
+    for p in paths:
+        if os.path.isdir(p):
+            files += sorted(glob.glob(os.path.join(p, '**', '*.timing.csv'), recursive=True))
+        elif os.path.isfile(p):
+            files.append(p)
+        else:
+            raise FileNotFoundError("file {} does not exist".format(p))
+    return files
+
+def PrintStats (st, q):
+    """Print the (stage, direction) statistics of StaStats <st>"""
+
+    arr, slk = st.mean()
+    _, std   = st.std()
+    pct      = st.percentile(q)
+    print('{:<5s} {:<5s} {:<5s} {:>8s} {:>8s} {:>8s} {:>8s} '.format(
+        'STAGE', 'DIR', 'CHECK', 'PATHS', 'ARRIVAL', 'SLACK', 'STD') +
+        ' '.join('{:>8s}'.format('P{:g}'.format(p)) for p in q))
+    for s, stage in enumerate(st.stages):
+        for d, dr in enumerate(DIRECTIONS):
+            if st.count[s, d] == 0:
+                continue
+            print('{:<5s} {:<5s} {:<5s} {:8d} {:8.3f} {:8.3f} {:8.3f} '.format(
+                stage, dr, 'setup' if d in SETUP else 'hold', st.count[s, d], arr[s, d], slk[s, d], std[s, d]) +
+                ' '.join('{:8.3f}'.format(v) for v in pct[:, s, d]))
+
+#-----------------------------------------------------------------------------
+#
+#                                  MAIN
+#
+#-----------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    # Verify the environment
+    try: os.environ['KEYV_HOME']
+    except KeyError:
+        print("Setup the environment with setup.csh prior to running this script")
+        raise
+
+    parser = argparse.ArgumentParser(description='STA statistics across PVT corners & Monte-Carlo runs')
+    parser.add_argument('paths', nargs='*', help='Timing csvs, or directories of *.timing.csv (default: $KEYV_DATA)')
+    parser.add_argument('-j', '--jobs', type=int, default=1, help='Number of processes (0: one per cpu)')
+    parser.add_argument('-q', '--quantiles', type=float, nargs='+', default=stats.QUANTILES,
+                        help='Slack percentiles (default: {})'.format(' '.join(map(str, stats.QUANTILES))))
+    parser.add_argument('--no-plot', action='store_true', help='Do not draw the setup & hold chart')
+    parser.add_argument('--no-cache', action='store_true', help='Do not cache the parsed csvs')
+    args = parser.parse_args()
+
+    data  = os.getenv('KEYV_DATA')
+    files = TimingFiles(args.paths or [data])
+    if not files:
+        parser.error("no *.timing.csv in {}".format(', '.join(args.paths or [data])))
+
+    t0 = time.perf_counter()
+    st = stats.fold_files(files, n_jobs=args.jobs, cache=not args.no_cache)
+    print("{} timing csvs folded ({:.2f} s)".format(st.files, time.perf_counter() - t0))
+    PrintStats(st, args.quantiles)
+
+    stats.write_stats(st, os.path.join(data, 'sta_stats.csv'), args.quantiles, verbose=True)
+    if not args.no_plot:
+        figname = os.path.join(data, 'sta_corners.' + dp.config.fig_ext)
+        dp.PlotStaStats(st, figname, (min(args.quantiles), max(args.quantiles)))
+        print("Updated: {}".format(figname))
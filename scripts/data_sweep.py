@@ -0,0 +1,89 @@
+#!/bin/env python3
+#-----------------------------------------------------------------------------
+# Project : KeyV
+# File    : data_sweep.py
+# Author  : Mickael Fiorentino <mickael.fiorentino@polymtl.ca>
+# Lab     : GRM - Polytechnique Montreal
+# Date    : <2026-10-17 Sat>
+# Brief   : Sweep KeyRing (E, S, D) configurations & plot Pareto fronts
+#-----------------------------------------------------------------------------
+# [tcsh]% source setup.csh
+# [tcsh]% ./scripts/data_sweep.py [--max-eu E] [--max-stages S] [--jobs N]
+#
+# Results are written to $KEYV_DATA/sweep_summary.csv (see kvlib/sweep.py),
+# then plotted against the area of the synthesized configurations.
+#-----------------------------------------------------------------------------
+import os
+import argparse
+import numpy as np
+import data_plots as dp
+from kvlib import table
+from kvlib import render
+from kvlib import sweep
+
+def PlotPareto (csv_f, figname, col, ylabel):
+    """Plot <col> vs. area of all sweep points, with the Pareto front"""
+
+    dp.InitPlots()
+    plt = dp.plt
+    tab = table.load_table(csv_f, labels=['PROCESSOR'])
+
+    x, y  = tab['AREA'], tab[col]
+    front = sweep.pareto(x, y)
+    order = np.argsort(x[front])
+
+    fig = plt.figure(figsize=dp.config.fig_size)
+    ax  = plt.subplot(111)
+    ax.set_title('{} vs. Area'.format(ylabel), fontdict={'fontsize':dp.config.font_size_title})
+    ax.tick_params(axis='both', labelsize=dp.config.font_size_label)
+    ax.grid(True, color='lightgrey', ls=':', zorder=0)
+    ax.set_xlabel('Area (um2)', fontsize=dp.config.font_size_label)
+    ax.set_ylabel(ylabel, fontsize=dp.config.font_size_label)
+
+    # A single collection for all points, whatever their number
+    ax.scatter(x, y, s=12, color=dp.cmap_civ(0.3), alpha=dp.config.alpha_light, zorder=2, label='Sweep')
+    ax.step(x[front][order], y[front][order], where='post', color=dp.cmap_vir(0.7),
+            alpha=dp.config.alpha_dark, zorder=3, label='Pareto front')
+    for xi, yi, name in zip(x[front], y[front], tab['PROCESSOR'][front]):
+        ax.annotate(name, xy=(xi, yi), xytext=(3, 3), textcoords="offset points",
+                    fontsize=dp.config.font_size_label)
+
+    ax.legend(loc='best', fontsize=dp.config.font_size_label)
+    dp.SaveFig(figname)
+
+#-----------------------------------------------------------------------------
+#
+#                                  MAIN
+#
+#-----------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    # Verify the environment
+    try: os.environ['KEYV_HOME']
+    except KeyError:
+        print("Setup the environment with setup.csh prior to running this script")
+        raise
+
+    parser = argparse.ArgumentParser(description='Sweep KeyRing configurations')
+    parser.add_argument('--max-eu', type=int, default=8, help='Maximum number of EUs')
+    parser.add_argument('--max-stages', type=int, default=16, help='Maximum number of stages')
+    parser.add_argument('--lengths', type=int, nargs='+', default=sweep.LENGTHS,
+                        help='Delay element lengths (default: {})'.format(sweep.LENGTHS))
+    parser.add_argument('-j', '--jobs', type=int, default=0,
+                        help='Number of evaluation processes (0: one per cpu)')
+    args = parser.parse_args()
+
+    data  = os.getenv('KEYV_DATA')
+    csv_f = os.path.join(data, 'sweep_summary.csv')
+    pts   = sweep.points(args.max_eu, args.max_stages, args.lengths)
+
+    print("Sweep: {} points".format(len(pts)))
+    sweep.run(pts, csv_f, sweep.measured(data), args.jobs)
+    print("Updated: {}".format(csv_f))
+
+    render.render([
+        ('sweep_throughput', PlotPareto,
+         (csv_f, os.path.join(data, 'sweep_throughput.' + dp.config.fig_ext), 'THROUGHPUT', 'Throughput (MIPS)')),
+        ('sweep_efficiency', PlotPareto,
+         (csv_f, os.path.join(data, 'sweep_efficiency.' + dp.config.fig_ext), 'DMIPS-MW', 'Dhrystone (DMIPS/mW)')),
+    ], args.jobs)
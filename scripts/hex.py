@@ -0,0 +1,75 @@
+#!/bin/env python3
+#-----------------------------------------------------------------------------
+# Project : KeyV
+# File    : hex.py
+# Author  : Mickael Fiorentino <mickael.fiorentino@polymtl.ca>
+# Lab     : GRM - Polytechnique Montreal
+# Date    : <2026-10-17 Sat>
+# Brief   : Converts Verilog memory hex format to VHDL memory hex format
+#-----------------------------------------------------------------------------
+# [tcsh]% source setup.csh
+# [tcsh]% ./scripts/hex.py <ver>.hex <vhd>.hex [--bin <image>.bin]
+# [tcsh]% ./scripts/hex.py --bench [bench ...] [--jobs N] [--bin]
+#
+# Drop-in replacement of hex.tcl (same output, see kvlib/image.py). With
+# --bench, the images of the benchmarks ($KEYV_SW_BENCH/<bench>/<bench>.hex,
+# from objcopy -O verilog) are converted in parallel into <bench>_mem.hex,
+# read by dpm.vhd (see software/Makefile), and <bench>_mem.bin with --bin.
+# Conversions are cached by content in <bench dir>/.cache/ (--no-cache).
+#-----------------------------------------------------------------------------
+import os
+import time
+import argparse
+from kvlib import image
+
+def BenchTasks (benchmarks, flat=False, cache=True):
+    """Returns the conversion tasks of <benchmarks> (see image.convert_file)"""
+
+    tasks = []
+    for bench in benchmarks:
+        base = os.path.join(os.environ['KEYV_SW_BENCH'], bench, bench)
+        tasks.append((base + '.hex', base + '_mem.hex', base + '_mem.bin' if flat else None, cache, True))
+    return tasks
+
+#-----------------------------------------------------------------------------
+#
+#                                  MAIN
+#
+#-----------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    # Verify the environment
+    try: os.environ['KEYV_HOME']
+    except KeyError:
+        print("Setup the environment with setup.csh prior to running this script")
+        raise
+
+    parser = argparse.ArgumentParser(description='Convert Verilog memory hex to VHDL memory hex')
+    parser.add_argument('files', nargs='*', help='<ver>.hex <vhd>.hex')
+    parser.add_argument('--bench', nargs='*', help='Convert the images of benchmarks (default: {})'.format(
+        ' '.join(image.BENCHMARKS)))
+    parser.add_argument('--bin', nargs='?', const=True, help='Also write the flat binary image')
+    parser.add_argument('-j', '--jobs', type=int, default=0, help='Number of processes (0: one per cpu)')
+    parser.add_argument('--no-cache', action='store_true', help='Do not use the conversion cache')
+    args = parser.parse_args()
+
+    if args.bench is None:
+        if len(args.files) != 2:
+            parser.error("Wrong number of arguments ({}) - should be 2.".format(len(args.files)))
+        if args.bin is True:
+            parser.error("--bin requires the binary image file")
+        image.convert_file(args.files[0], args.files[1], args.bin, not args.no_cache)
+
+    else:
+        if args.files:
+            parser.error("files and --bench are exclusive")
+        if isinstance(args.bin, str):
+            parser.error("--bench writes <bench>_mem.bin: --bin takes no file")
+        for bench in args.bench:
+            if bench not in image.BENCHMARKS:
+                parser.error("{} is not a benchmark ({})".format(bench, ', '.join(image.BENCHMARKS)))
+
+        t0    = time.perf_counter()
+        tasks = BenchTasks(args.bench or image.BENCHMARKS, bool(args.bin), not args.no_cache)
+        hits  = image.convert_all(tasks, args.jobs)
+        print("{} images converted, {} cached ({:.2f} s)".format(len(hits), sum(hits), time.perf_counter() - t0))
@@ -0,0 +1,29 @@
+#-----------------------------------------------------------------------------
+# Project : KeyV
+# File    : __init__.py
+# Author  : Mickael Fiorentino <mickael.fiorentino@polymtl.ca>
+# Lab     : GRM - Polytechnique Montreal
+# Date    : <2026-10-17 Sat>
+# Brief   : Python library for the KeyV results pipeline
+#-----------------------------------------------------------------------------
+# Modules are imported explicitly (e.g. 'from kvlib import table') so that
+# importing the package itself stays cheap.
+#
+#   table      : Typed csv summaries with an on-disk binary cache
+#   render     : Headless rendering of independent figure jobs in a process pool
+#   parse      : Streaming parsers for DC/PrimeTime & simulation reports
+#   build      : Dependency tracking of generated outputs (figures, tables...)
+#   benchmarks : Benchmark x processor x metric model of benchmarks_summary.csv
+#   energy     : CPI, energy, EPI, EDP & ED2P of benchmarks, relative to synv
+#   timing     : Aggregation of KeyRing STA summaries (eu x stage x direction)
+#   paths      : Index of every timing path of a KeyRing, by capture click
+#   stats      : Streaming STA statistics (moments, quantile sketch) across corners & runs
+#   keyring    : NumPy model of the KeyRing timing graph (see KeyRing.tcl)
+#   sweep      : Design-space sweep of KeyRing (E, S, D) configurations
+#   iss        : RV32IM instruction-set simulator of the KeyV memory map
+#   image      : Memory images: Verilog hex to dpm.vhd hex & flat binary, cached by content
+#   history    : Append-only SQLite store of results, trends & regression checks
+#   synth      : Synthetic csv summaries & DC/PrimeTime reports of any size
+#   perf       : Stage timing instrumentation: wall & CPU time, peak memory
+#   watch      : File watcher (debounced polling) & status file of long-running jobs
+#-----------------------------------------------------------------------------
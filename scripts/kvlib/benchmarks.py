@@ -0,0 +1,153 @@
+#-----------------------------------------------------------------------------
+# Project : KeyV
+# File    : benchmarks.py
+# Author  : Mickael Fiorentino <mickael.fiorentino@polymtl.ca>
+# Lab     : GRM - Polytechnique Montreal
+# Date    : <2026-10-17 Sat>
+# Brief   : Benchmark x processor x metric model of benchmarks_summary.csv
+#-----------------------------------------------------------------------------
+# The csv rows (PROCESSOR, BENCHMARK, metrics...) are folded into a dense
+# (benchmark x processor x metric) array. Missing pairs are NaN.
+#
+# Derived metrics are declared in tables below, and computed for every
+# benchmark & processor at once:
+#   - Power breakdowns are lists of (label, [csv columns summed]) turned into
+#     a (label x metric) weight matrix, applied with a single product.
+#   - Scores are 1 / (PERIOD * CYCLES * scale), the scale being specific to
+#     each benchmark (e.g. 1757 Dhrystones/s for 1 DMIPS).
+#-----------------------------------------------------------------------------
+import numpy as np
+from . import table
+
+#-----------------------------------------------------------------------------
+# Metric tables
+#-----------------------------------------------------------------------------
+
+# Benchmark: (title, score unit, score scale)
+SCORES = {
+    'dhrystone': ('Dhrystone', 'DMIPS', 1757),
+    'coremark':  ('Coremark',  'CM',    1),
+}
+
+# Power breakdowns: (label, [columns]), reported in mW
+PWR_GROUPS = [
+    ('CT',  ['PWR-CT']),
+    ('SEQ', ['PWR-SEQ', 'PWR-REG']),
+    ('CMB', ['PWR-CMB']),
+]
+PWR_CATEGORIES = [
+    ('INTERNAL', ['PWR-INT']),
+    ('LEAKAGE',  ['PWR-LEAK']),
+    ('SWITCH',   ['PWR-SWITCH']),
+]
+PWR_HIER = [
+    ('RF',     ['PWR-RF']),
+    ('ALU',    ['PWR-ALU']),
+    ('DECODE', ['PWR-IDECODE']),
+    ('SYS',    ['PWR-SYS']),
+    ('PERF',   ['PWR-PERF']),
+    ('PC',     ['PWR-PC']),
+    ('LSU',    ['PWR-LSU']),
+]
+
+# Residual of a breakdown w.r.t. the total power
+PWR_TOTAL = 'PWR-TOT'
+PWR_OTHER = 'OTHER'
+
+def score_info(bench):
+    """Returns (title, score unit, score scale) of <bench>"""
+
+    return SCORES.get(bench, (bench.capitalize(), 'Runs/s', 1))
+
+def levels(labels):
+    """Returns (unique <labels> in order of appearance, index of each label)"""
+
+    uniq, first, inv = np.unique(labels, return_index=True, return_inverse=True)
+    order = np.argsort(first)
+    rank  = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    return uniq[order], rank[inv.reshape(-1)]
+
+#-----------------------------------------------------------------------------
+# MODEL
+#-----------------------------------------------------------------------------
+class Benchmarks:
+    """benchmarks_summary.csv as a (benchmark x processor x metric) array"""
+
+    def __init__(self, tab):
+
+        self.benchmarks, bi = levels(tab['BENCHMARK'])
+        self.processors, pi = levels(tab['PROCESSOR'])
+        self.metrics = list(tab.names)
+        self.index   = {m: i for i, m in enumerate(self.metrics)}
+
+        self.data = np.full((len(self.benchmarks), len(self.processors), len(self.metrics)), np.nan)
+        self.data[bi, pi] = tab.data.T
+
+    def bench(self, name):
+        """Returns the index of benchmark <name>"""
+
+        return list(self.benchmarks).index(name)
+
+    def metric(self, name):
+        """Returns the (benchmark x processor) array of csv column <name>"""
+
+        try:
+            return self.data[..., self.index[name]]
+        except KeyError:
+            raise KeyError("Benchmarks:: metric {} not found".format(name)) from None
+
+    def columns(self, spec):
+        """Returns the metric indexes of each label of breakdown <spec>"""
+
+        idx = []
+        for label, cols in spec:
+            for c in cols:
+                if c not in self.index:
+                    raise KeyError("Benchmarks:: metric {} not found".format(c))
+            idx.append([self.index[c] for c in cols])
+        return idx
+
+    def breakdown(self, spec, other=False, scale=1e3):
+        """Returns the (benchmark x processor x label) array of breakdown <spec>
+
+        Only the metrics of each label are summed: NaN in other columns (e.g.
+        modules a processor does not have) do not propagate. With <other>,
+        the residual w.r.t. the total power is appended."""
+
+        out = np.stack([self.data[..., i].sum(axis=-1) for i in self.columns(spec)], axis=-1) * scale
+        if other:
+            oth = self.metric(PWR_TOTAL) * scale - out.sum(axis=-1)
+            out = np.concatenate([out, oth[..., None]], axis=-1)
+        return out
+
+    def labels(self, spec, other=False):
+        """Returns the labels of breakdown <spec>"""
+
+        return [l for l, _ in spec] + ([PWR_OTHER] if other else [])
+
+    def exec_time(self):
+        """Execution time (s): PERIOD x CYCLES"""
+
+        return self.metric('PERIOD') * self.metric('CYCLES')
+
+    def power(self):
+        """Total power (mW)"""
+
+        return self.metric(PWR_TOTAL) * 1e3
+
+    def score(self):
+        """Benchmark scores: 1 / (execution time x benchmark scale)"""
+
+        scale = np.array([score_info(b)[2] for b in self.benchmarks], dtype=float)
+        return 1 / (self.exec_time() * scale[:, None])
+
+    def score_pwr(self):
+        """Benchmark scores per mW"""
+
+        return self.score() / self.power()
+
+def load_benchmarks(csv_f, cache=True):
+    """Load <csv_f> (benchmarks_summary.csv) into a Benchmarks model"""
+
+    return Benchmarks(table.load_table(csv_f, labels=['PROCESSOR', 'BENCHMARK'], cache=cache))
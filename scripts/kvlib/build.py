@@ -0,0 +1,111 @@
+#-----------------------------------------------------------------------------
+# Project : KeyV
+# File    : build.py
+# Author  : Mickael Fiorentino <mickael.fiorentino@polymtl.ca>
+# Lab     : GRM - Polytechnique Montreal
+# Date    : <2026-10-17 Sat>
+# Brief   : Dependency tracking of generated outputs (figures, tables...)
+#-----------------------------------------------------------------------------
+# A Target is an output file, the list of input files it is built from, and
+# the parameters used to build it. The Manifest (json) records, for each
+# output, the content hash of its inputs and its parameters at the time it
+# was last built, and the extra files it was built with (e.g. the pages of a
+# figure, whose number depends on the inputs). A target is stale if its
+# output or one of those files is missing, or if its inputs or parameters
+# changed.
+#
+# Hashing large inputs on every run would defeat the purpose: file hashes
+# are also cached in the manifest and only recomputed when the file mtime or
+# size changed.
+#-----------------------------------------------------------------------------
+import os
+import json
+import hashlib
+import collections
+
+Target = collections.namedtuple('Target', ['name', 'output', 'inputs', 'params'])
+
+def _canonical(params):
+    """Returns <params> as they read back from json (tuples become lists)"""
+
+    return json.loads(json.dumps(params, sort_keys=True))
+
+def file_hash(fname, chunk=1 << 20):
+    """Returns the sha1 hex digest of <fname> content"""
+
+    h = hashlib.sha1()
+    with open(fname, 'rb') as f:
+        for block in iter(lambda: f.read(chunk), b''):
+            h.update(block)
+    return h.hexdigest()
+
+#-----------------------------------------------------------------------------
+# MANIFEST
+#-----------------------------------------------------------------------------
+class Manifest:
+    """Inputs hashes & parameters of the last build of each output"""
+
+    def __init__(self, fname):
+
+        self.fname = fname
+        try:
+            with open(fname) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+        self.files   = data.get('files', {})
+        self.outputs = data.get('outputs', {})
+
+    def digest(self, fname):
+        """Returns the content hash of <fname>, None if it does not exist"""
+
+        path = os.path.abspath(fname)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+
+        stamp = [st.st_mtime_ns, st.st_size]
+        known = self.files.get(path)
+        if known is not None and known[:2] == stamp:
+            return known[2]
+
+        h = file_hash(path)
+        self.files[path] = stamp + [h]
+        return h
+
+    def _state(self, target):
+        return {'inputs': {os.path.abspath(i): self.digest(i) for i in target.inputs},
+                'params': _canonical(target.params)}
+
+    def stale(self, target):
+        """Returns True if <target> must be rebuilt"""
+
+        if not os.path.exists(target.output):
+            return True
+        known = self.outputs.get(os.path.abspath(target.output))
+        if known is None or not all(os.path.exists(f) for f in known.get('extra', [])):
+            return True
+        return {k: v for k, v in known.items() if k != 'extra'} != self._state(target)
+
+    def record(self, target, extra=()):
+        """Record <target> as built from its current inputs & parameters, with <extra> output files"""
+
+        state = self._state(target)
+        if extra:
+            state['extra'] = sorted(os.path.abspath(f) for f in extra)
+        self.outputs[os.path.abspath(target.output)] = state
+
+    def save(self):
+        """Write the manifest (atomically)"""
+
+        tmp = '{}.{}.tmp'.format(self.fname, os.getpid())
+        os.makedirs(os.path.dirname(os.path.abspath(self.fname)), exist_ok=True)
+        with open(tmp, 'w') as f:
+            json.dump({'files': self.files, 'outputs': self.outputs}, f, indent=1, sort_keys=True)
+        os.replace(tmp, self.fname)
+
+def stale_targets(targets, manifest, force=False):
+    """Returns the list of <targets> that must be rebuilt"""
+
+    return [t for t in targets if force or manifest.stale(t)]
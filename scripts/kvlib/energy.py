@@ -0,0 +1,152 @@
+#-----------------------------------------------------------------------------
+# Project : KeyV
+# File    : energy.py
+# Author  : Mickael Fiorentino <mickael.fiorentino@polymtl.ca>
+# Lab     : GRM - Polytechnique Montreal
+# Date    : <2026-10-17 Sat>
+# Brief   : Energy, energy-delay & energy per instruction of benchmarks
+#-----------------------------------------------------------------------------
+# Derived from the (benchmark x processor x metric) Benchmarks model, for
+# every benchmark & processor at once:
+#
+#   CPI    = CYCLES / INSTS
+#   TIME   = PERIOD x CYCLES                      (s)
+#   ENERGY = PWR-TOT x TIME                       (J, one run)
+#   EPI    = ENERGY / INSTS                       (J)
+#   EDP    = ENERGY x TIME                        (J.s)
+#   ED2P   = ENERGY x TIME^2                      (J.s^2)
+#
+# Module energies are PWR-<module> x TIME. Processors without a module have
+# NaN in its column: its energy is 0 in the module breakdowns.
+#
+# Comparisons are normalized to a baseline processor (synv by default):
+# 0.8 means 20% less than the baseline on the same benchmark.
+#-----------------------------------------------------------------------------
+import numpy as np
+from .parse.scan import write_csv
+
+BASELINE = 'synv'
+
+# Metric: (title, unit)
+METRICS = {
+    'CPI':    ('CPI',                    ''),
+    'TIME':   ('Execution time',         's'),
+    'ENERGY': ('Energy',                 'J'),
+    'EPI':    ('Energy per instruction', 'J'),
+    'EDP':    ('Energy-delay product',   'J.s'),
+    'ED2P':   ('Energy-delay2 product',  'J.s2'),
+}
+
+# Metrics of the comparison plots
+COMPARE = ['CPI', 'EPI', 'ENERGY', 'EDP', 'ED2P']
+
+# Power columns that are not modules
+PWR_GLOBALS = ['PWR-TOT', 'PWR-SEQ', 'PWR-REG', 'PWR-CT', 'PWR-CMB', 'PWR-INT', 'PWR-SWITCH', 'PWR-LEAK']
+
+# Module energy breakdown: (label, [power columns]), the residual is OTHER
+ENERGY_HIER = [
+    ('RF',      ['PWR-RF']),
+    ('ALU',     ['PWR-ALU']),
+    ('DECODE',  ['PWR-IDECODE']),
+    ('SYS',     ['PWR-SYS']),
+    ('PERF',    ['PWR-PERF']),
+    ('PC',      ['PWR-PC']),
+    ('LSU',     ['PWR-LSU']),
+    ('KEYRING', ['PWR-KEYRING']),
+    ('XBS',     ['PWR-XBS']),
+    ('XU',      ['PWR-XU0', 'PWR-XU1', 'PWR-XU2', 'PWR-XU3', 'PWR-XU4', 'PWR-XU5']),
+]
+OTHER = 'OTHER'
+
+#-----------------------------------------------------------------------------
+# MODEL
+#-----------------------------------------------------------------------------
+class Energy:
+    """Energy metrics of a Benchmarks model, as (benchmark x processor) arrays"""
+
+    def __init__(self, bench):
+
+        self.benchmarks = bench.benchmarks
+        self.processors = bench.processors
+
+        cycles = bench.metric('CYCLES')
+        insts  = bench.metric('INSTS')
+        time   = bench.exec_time()
+        energy = bench.metric('PWR-TOT') * time
+
+        self.metrics = {
+            'CPI':    cycles / insts,
+            'TIME':   time,
+            'ENERGY': energy,
+            'EPI':    energy / insts,
+            'EDP':    energy * time,
+            'ED2P':   energy * time ** 2,
+        }
+
+        # (benchmark x processor x module) energies of every module column
+        self.modules = [m for m in bench.metrics if m.startswith('PWR-') and m not in PWR_GLOBALS]
+        self.module_energy = bench.data[..., [bench.index[m] for m in self.modules]] * time[..., None]
+
+    def __getitem__(self, name):
+        try:
+            return self.metrics[name]
+        except KeyError:
+            raise KeyError("Energy:: metric {} not found".format(name)) from None
+
+    def baseline(self, name=BASELINE):
+        """Returns the index of baseline processor <name>"""
+
+        procs = list(self.processors)
+        if name not in procs:
+            raise ValueError("Energy:: baseline {} not in processors ({})".format(name, ', '.join(procs)))
+        return procs.index(name)
+
+    def normalized(self, name, baseline=BASELINE):
+        """Returns metric <name> relative to processor <baseline> on each benchmark"""
+
+        val = self[name]
+        return val / val[:, self.baseline(baseline), None]
+
+    def breakdown(self, spec=ENERGY_HIER, other=True):
+        """Returns the (benchmark x processor x label) energy of the module groups of <spec> (J)
+
+        With <other>, the residual w.r.t. the total energy is appended (at
+        least 0: module powers are rounded in the reports)."""
+
+        idx = {m: i for i, m in enumerate(self.modules)}
+        out = np.stack([np.nansum(self.module_energy[..., [idx[c] for c in cols if c in idx]], axis=-1)
+                        for label, cols in spec], axis=-1)
+        if other:
+            out = np.concatenate([out, np.maximum(self['ENERGY'] - out.sum(axis=-1), 0)[..., None]], axis=-1)
+        return out
+
+    def labels(self, spec=ENERGY_HIER, other=True):
+        """Returns the labels of breakdown <spec>"""
+
+        return [l for l, _ in spec] + ([OTHER] if other else [])
+
+#-----------------------------------------------------------------------------
+# TABLES
+#-----------------------------------------------------------------------------
+def write_energy(energy, csv, baseline=None, verbose=False):
+    """Write the metrics & module energies of <energy> into <csv>
+
+    With <baseline>, every value is relative to processor <baseline> (module
+    energies to its total energy)."""
+
+    vals = [energy[m] for m in METRICS]
+    mods = [energy.module_energy[..., i] for i in range(len(energy.modules))]
+    if baseline is not None:
+        b    = energy.baseline(baseline)
+        vals = [energy.normalized(m, baseline) for m in METRICS]
+        mods = [v / energy['ENERGY'][:, b, None] for v in mods]
+
+    header = ['PROCESSOR', 'BENCHMARK'] + list(METRICS) + ['E-' + m[4:] for m in energy.modules]
+    lines  = [','.join(header)]
+    for i, bench in enumerate(energy.benchmarks):
+        for j, proc in enumerate(energy.processors):
+            if np.isnan(energy['ENERGY'][i, j]):
+                continue
+            lines.append(','.join([proc, bench] + ['{:.6e}'.format(v[i, j]) for v in vals + mods]))
+    write_csv(csv, lines, verbose)
+    return csv
@@ -0,0 +1,239 @@
+#-----------------------------------------------------------------------------
+# Project : KeyV
+# File    : history.py
+# Author  : Mickael Fiorentino <mickael.fiorentino@polymtl.ca>
+# Lab     : GRM - Polytechnique Montreal
+# Date    : <2026-10-17 Sat>
+# Brief   : Append-only SQLite store of results, trends & regression checks
+#-----------------------------------------------------------------------------
+# Each run overwrites the csv summaries of $KEYV_DATA: they are archived in
+# $KEYV_DATA/history.db (SQLite, no extra dependency), in long format:
+#
+#   runs    (id, timestamp, rev, digest)           one row per ingested run
+#   results (run, processor, benchmark, metric, value)
+#
+# New columns in the summaries are new metric names, not schema changes.
+# Area & STA results have an empty benchmark. STA summaries are stored as
+# slack statistics per stage, under the KeyRing configuration name.
+#
+# Rows are never updated nor deleted. A run is identified by the content
+# hash of its summaries: ingesting unchanged summaries again is a no-op.
+# The (processor, metric, benchmark, run) index keeps trend & regression
+# queries fast with thousands of archived runs.
+#-----------------------------------------------------------------------------
+import os
+import sqlite3
+import hashlib
+import subprocess
+import numpy as np
+
+from . import table
+from . import benchmarks
+from . import timing
+from .parse.cores import KEYRINGS
+
+DB_NAME   = 'history.db'
+SUMMARIES = ['area_summary.csv', 'benchmarks_summary.csv', 'sta_summary.csv']
+WEEK      = 7 * 24 * 3600
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id        INTEGER PRIMARY KEY,
+    timestamp INTEGER NOT NULL,
+    rev       TEXT NOT NULL,
+    digest    TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS results (
+    run       INTEGER NOT NULL REFERENCES runs(id),
+    processor TEXT NOT NULL,
+    benchmark TEXT NOT NULL,
+    metric    TEXT NOT NULL,
+    value     REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_timestamp ON runs(timestamp);
+CREATE INDEX IF NOT EXISTS runs_rev       ON runs(rev);
+CREATE INDEX IF NOT EXISTS results_key    ON results(processor, metric, benchmark, run);
+CREATE INDEX IF NOT EXISTS results_metric ON results(metric, benchmark, processor);
+"""
+
+def git_rev(path):
+    """Returns the git revision of the repository at <path> ('' if none)"""
+
+    try:
+        out = subprocess.run(['git', '-C', path, 'rev-parse', 'HEAD'], capture_output=True, text=True)
+    except OSError:
+        return ''
+    return out.stdout.strip() if out.returncode == 0 else ''
+
+#-----------------------------------------------------------------------------
+# SUMMARIES -> ROWS
+#-----------------------------------------------------------------------------
+def area_rows(csv_f):
+    """Yields (processor, '', metric, value) of area_summary.csv"""
+
+    tab = table.load_table(csv_f, labels=['PROCESSOR'])
+    for j, proc in enumerate(tab['PROCESSOR']):
+        for m, v in zip(tab.names, tab.data[:, j]):
+            yield proc, '', m, v
+
+def bench_rows(csv_f):
+    """Yields (processor, benchmark, metric, value) of benchmarks_summary.csv
+
+    The scores (SCORE, e.g. DMIPS) & scores per mW (SCORE-MW) are added."""
+
+    bench = benchmarks.load_benchmarks(csv_f)
+    extra = [('SCORE', bench.score()), ('SCORE-MW', bench.score_pwr())]
+    for b, name in enumerate(bench.benchmarks):
+        for p, proc in enumerate(bench.processors):
+            for m, i in bench.index.items():
+                yield proc, name, m, bench.data[b, p, i]
+            for m, val in extra:
+                yield proc, name, m, val[b, p]
+
+def sta_rows(csv_f):
+    """Yields (processor, '', metric, value) slack statistics of sta_summary.csv
+
+    Metrics are SLACK-<SETUP|HOLD>-<stage>-<MIN|MEAN> and SLACK-<SETUP|HOLD>-MIN."""
+
+    sta   = timing.load_sta(csv_f)
+    names = [k for k, (E, S, D) in KEYRINGS.items() if (E, S) == (sta.E, sta.S)]
+    proc  = names[0] if names else 'keyv{}{}'.format(sta.E, sta.S)
+
+    for check, dirs in (('SETUP', timing.SETUP), ('HOLD', timing.HOLD)):
+        slack = sta.slack[:, :, dirs]
+        yield proc, '', 'SLACK-{}-MIN'.format(check), slack.min()
+        for s, stage in enumerate(sta.stages):
+            yield proc, '', 'SLACK-{}-{}-MIN'.format(check, stage), slack[:, s].min()
+            yield proc, '', 'SLACK-{}-{}-MEAN'.format(check, stage), slack[:, s].mean()
+
+ROWS = {'area_summary.csv': area_rows, 'benchmarks_summary.csv': bench_rows, 'sta_summary.csv': sta_rows}
+
+#-----------------------------------------------------------------------------
+# STORE
+#-----------------------------------------------------------------------------
+class History:
+    """Append-only store of (processor, benchmark, metric) results per run"""
+
+    def __init__(self, db_f):
+
+        self.db_f = db_f
+        os.makedirs(os.path.dirname(os.path.abspath(db_f)), exist_ok=True)
+        self.db = sqlite3.connect(db_f)
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.db.execute('SELECT COUNT(*) FROM runs').fetchone()[0]
+
+    def add_run(self, rows, timestamp, rev, digest):
+        """Append a run of (processor, benchmark, metric, value) <rows>
+
+        Returns the run id, None if a run with the same <digest> exists."""
+
+        with self.db:
+            try:
+                cur = self.db.execute('INSERT INTO runs (timestamp, rev, digest) VALUES (?, ?, ?)',
+                                      (int(timestamp), rev, digest))
+            except sqlite3.IntegrityError:
+                return None
+            run = cur.lastrowid
+            self.db.executemany('INSERT INTO results VALUES (?, ?, ?, ?, ?)',
+                                ((run, p, b, m, float(v)) for p, b, m, v in rows if not np.isnan(v)))
+        return run
+
+    def ingest(self, data, timestamp=None, rev=None):
+        """Archive the csv summaries of <data> (timestamp: newest summary mtime)
+
+        Returns the run id, None if there is nothing new to archive."""
+
+        files = [os.path.join(data, s) for s in SUMMARIES if os.path.exists(os.path.join(data, s))]
+        if not files:
+            return None
+
+        h = hashlib.sha1()
+        for f in files:
+            h.update(os.path.basename(f).encode())
+            with open(f, 'rb') as fd:
+                h.update(fd.read())
+
+        if timestamp is None:
+            timestamp = max(os.path.getmtime(f) for f in files)
+        if rev is None:
+            rev = git_rev(os.getenv('KEYV_HOME', data))
+
+        rows = (r for f in files for r in ROWS[os.path.basename(f)](f))
+        return self.add_run(rows, timestamp, rev, h.hexdigest())
+
+    #-------------------------------------------------------------------------
+    # Queries
+    #-------------------------------------------------------------------------
+    def processors(self, metric, benchmark=''):
+        """Returns the processors with results for <metric> (& <benchmark>)"""
+
+        cur = self.db.execute('SELECT DISTINCT processor FROM results WHERE metric = ? AND benchmark = ?'
+                              ' ORDER BY processor', (metric, benchmark))
+        return [r[0] for r in cur]
+
+    def trend(self, processor, metric, benchmark='', since=None, until=None):
+        """Returns (timestamps, values, revs) of <metric> over runs, oldest first"""
+
+        cur = self.db.execute(
+            'SELECT r.timestamp, v.value, r.rev FROM results v JOIN runs r ON r.id = v.run'
+            ' WHERE v.processor = ? AND v.metric = ? AND v.benchmark = ?'
+            ' AND r.timestamp >= ? AND r.timestamp <= ? ORDER BY r.timestamp, r.id',
+            (processor, metric, benchmark, since or 0, until or 2**62))
+        rows = cur.fetchall()
+        return (np.array([r[0] for r in rows], dtype=np.int64),
+                np.array([r[1] for r in rows], dtype=float),
+                [r[2] for r in rows])
+
+    def value_at(self, processor, metric, benchmark='', timestamp=None):
+        """Returns (timestamp, value, rev) of the last run at or before <timestamp>"""
+
+        return self.db.execute(
+            'SELECT r.timestamp, v.value, r.rev FROM results v JOIN runs r ON r.id = v.run'
+            ' WHERE v.processor = ? AND v.metric = ? AND v.benchmark = ? AND r.timestamp <= ?'
+            ' ORDER BY r.timestamp DESC, r.id DESC LIMIT 1',
+            (processor, metric, benchmark, 2**62 if timestamp is None else int(timestamp))).fetchone()
+
+    def regression(self, processor, metric, benchmark='', period=WEEK):
+        """Compares the last value of <metric> to the last one <period> (s) before
+
+        Returns (change, last, ref) where <change> is relative (e.g. -0.05),
+        and last/ref are (timestamp, value, rev); None if there is no
+        reference."""
+
+        last = self.value_at(processor, metric, benchmark)
+        if last is None:
+            return None
+        ref = self.value_at(processor, metric, benchmark, last[0] - period)
+        if ref is None or ref[1] == 0:
+            return None
+        change = (last[1] - ref[1]) / abs(ref[1])
+        return change, last, ref
+
+    def regressions(self, metric, benchmark='', period=WEEK, threshold=0.03, higher_is_better=True):
+        """Returns [(processor, change, last, ref)] of the processors worse by more than <threshold>"""
+
+        out = []
+        for proc in self.processors(metric, benchmark):
+            res = self.regression(proc, metric, benchmark, period)
+            if res is None:
+                continue
+            change = res[0] if higher_is_better else -res[0]
+            if change < -threshold:
+                out.append((proc,) + res)
+        return out
+
+def open_history(data):
+    """Returns the History of the <data> directory"""
+
+    return History(os.path.join(data, DB_NAME))
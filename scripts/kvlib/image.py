@@ -0,0 +1,157 @@
+#-----------------------------------------------------------------------------
+# Project : KeyV
+# File    : image.py
+# Author  : Mickael Fiorentino <mickael.fiorentino@polymtl.ca>
+# Lab     : GRM - Polytechnique Montreal
+# Date    : <2026-10-17 Sat>
+# Brief   : Memory images: Verilog hex to dpm.vhd hex & flat binary, cached
+#-----------------------------------------------------------------------------
+# Same conversion as hex.tcl, from the Verilog hex of objcopy:
+#   @<byte address>                  ->  @<word address> (%08X, address >> 2)
+#   B0 B1 B2 B3 B4 B5 B6 B7 ...      ->  B3B2B1B0
+#                                        B7B6B5B4 ...
+# i.e. one little-endian word per line, the bytes of each line that do not
+# fill a word being dropped (as hex.tcl does). Bytes are copied as written.
+#
+# The data lines between two addresses are converted at once: their bytes
+# are an (n x 2) array of hex digits, reshaped in words whose bytes are
+# reversed, and the output is written in a single write. The flat binary
+# image holds the little-endian words of the whole address range (0 in the
+# gaps, word i at byte 4i): np.memmap(<image>.bin, '<u4') reads it back.
+#
+# Conversions are cached by content: <dir>/.cache/<sha1>.hex (& .bin), next
+# to the input, <sha1> being the hash of the input & of FORMAT.
+#-----------------------------------------------------------------------------
+import os
+import shutil
+import hashlib
+import numpy as np
+from .table import CACHE_DIR, cache_write
+from .render import pool_map
+
+FORMAT = b'dpm-hex-1'
+
+# Software images of $KEYV_SW_BENCH (see software/Makefile)
+BENCHMARKS = ['basic', 'fibo', 'dhrystone', 'coremark']
+
+#-----------------------------------------------------------------------------
+# CONVERSION
+#-----------------------------------------------------------------------------
+def _words(lines, fname):
+    """Returns the (word x 8) hex digits of the data <lines> (bytes, one per line)"""
+
+    if not lines:
+        return np.empty((0, 8), dtype=np.uint8)
+    for l in lines:
+        if len(l) % 3 != 2 or l[2::3].strip():
+            raise ValueError("image:: invalid data line '{}' in {}".format(l.decode(errors='replace'), fname))
+
+    # Bytes of each line, the last ones that do not fill a word dropped
+    count = np.array([(len(l) + 1) // 3 for l in lines])
+    text  = np.frombuffer(b' '.join(lines) + b' ', dtype=np.uint8).reshape(-1, 3)[:, :2]
+    pos   = np.arange(len(text)) - np.repeat(np.cumsum(count) - count, count)
+    keep  = pos < np.repeat(count // 4 * 4, count)
+    return text[keep].reshape(-1, 4, 2)[:, ::-1].reshape(-1, 8)
+
+def convert(ver, fname='<hex>'):
+    """Returns the dpm.vhd hex (bytes) & the (word address, words) segments of Verilog hex <ver>"""
+
+    out, segs = [], []
+    addr, data = 0, []
+
+    def flush():
+        words = _words(data, fname)
+        if len(words):
+            out.append(np.column_stack([words, np.full(len(words), ord('\n'), dtype=np.uint8)]).tobytes())
+            segs.append((addr, words))
+        data.clear()
+
+    for line in ver.split(b'\n'):
+        if line[:1] == b'@':
+            flush()
+            try:
+                addr = int(line[1:].strip(), 16) >> 2
+            except ValueError:
+                raise ValueError("image:: invalid address '{}' in {}".format(line.decode(errors='replace'),
+                                                                           fname)) from None
+            out.append(b'@%08X\n' % addr)
+        else:
+            line = line.strip()
+            if line:
+                data.append(line)
+    flush()
+    return b''.join(out), segs
+
+def flat_image(segs):
+    """Returns the little-endian words of (word address, words) segments <segs>, 0 in the gaps"""
+
+    size  = max((a + len(w) for a, w in segs), default=0)
+    image = np.zeros(size, dtype='<u4')
+    for addr, words in segs:
+        image[addr:addr + len(words)] = np.frombuffer(bytes.fromhex(words.tobytes().decode()), dtype='>u4')
+    return image
+
+def load_image(bin_f):
+    """Returns the words of flat binary image <bin_f>, memory-mapped"""
+
+    if os.path.getsize(bin_f) == 0:
+        return np.zeros(0, dtype='<u4')
+    return np.memmap(bin_f, dtype='<u4', mode='r')
+
+#-----------------------------------------------------------------------------
+# CACHE
+#-----------------------------------------------------------------------------
+def cache_path(ver_f, digest, ext):
+    """Returns the cache file of the conversion of <ver_f> of content hash <digest>"""
+
+    return os.path.join(os.path.dirname(os.path.abspath(ver_f)), CACHE_DIR, digest + ext)
+
+def _write(out_f, content):
+    """Create <out_f> (and its directory), write <content> in a single write"""
+
+    out_d = os.path.dirname(out_f)
+    if out_d:
+        os.makedirs(out_d, exist_ok=True)
+    with open(out_f, 'wb') as f:
+        f.write(content)
+
+def convert_file(ver_f, vhd_f, bin_f=None, cache=True, verbose=False):
+    """Convert Verilog hex <ver_f> into dpm.vhd hex <vhd_f> (& flat binary <bin_f>)
+
+    Returns True if the conversion was found in the cache."""
+
+    with open(ver_f, 'rb') as f:
+        ver = f.read()
+    digest  = hashlib.sha1(FORMAT + b'\0' + ver).hexdigest()
+    outputs = [(vhd_f, '.hex')] + ([(bin_f, '.bin')] if bin_f else [])
+    cached  = [cache_path(ver_f, digest, ext) for _, ext in outputs]
+
+    hit = cache and all(os.path.exists(c) for c in cached)
+    if not hit:
+        vhd, segs = convert(ver, ver_f)
+        content   = [vhd] + ([flat_image(segs).tobytes()] if bin_f else [])
+        for (out_f, _), c in zip(outputs, content):
+            _write(out_f, c)
+        if cache:
+            for cache_f, c in zip(cached, content):
+                cache_write(cache_f, lambda f: f.write(c))
+    else:
+        for (out_f, _), cache_f in zip(outputs, cached):
+            out_d = os.path.dirname(out_f)
+            if out_d:
+                os.makedirs(out_d, exist_ok=True)
+            shutil.copyfile(cache_f, out_f)
+
+    if verbose:
+        print('{}{}'.format(vhd_f, ' (cached)' if hit else ''))
+    return hit
+
+def _run(task):
+    return convert_file(*task)
+
+def convert_all(tasks, n_jobs=0):
+    """Run the conversions <tasks> (convert_file arguments) on <n_jobs> processes (0: one per cpu)
+
+    Returns the cache hit of each task."""
+
+    return list(pool_map(_run, tasks, n_jobs))
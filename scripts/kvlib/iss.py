@@ -0,0 +1,509 @@
+#-----------------------------------------------------------------------------
+# Project : KeyV
+# File    : iss.py
+# Author  : Mickael Fiorentino <mickael.fiorentino@polymtl.ca>
+# Lab     : GRM - Polytechnique Montreal
+# Date    : <2026-10-17 Sat>
+# Brief   : RV32IM instruction-set simulator (cycles & instructions estimates)
+#-----------------------------------------------------------------------------
+# Memory map (link.ld, stdlib.h & design/tb/top.vhd):
+#   IMEM  : 0x00000 - 0x07FFF  program, rodata, bss
+#   DMEM  : 0x08000 - 0x0FFFF  heap (HEAP_START) & stack (from the top)
+#   IOPAD : 0x10000 - 0x10FFF  selected by address bit 16: exit code at 0,
+#                              print_pad() outputs from PAD_START
+#
+# Memory is a flat bytearray (main memory followed by the pad), accessed
+# through word/half-word views. Like the testbench memories, word & half-word
+# accesses ignore the low address bits.
+#
+# Each instruction word is decoded once into a closure: f(pc) -> next pc.
+# Slots start with a decoding stub, and a store to a slot puts the stub back.
+# System instructions (CSR, ecall, ebreak) & illegal instructions return
+# SYSTEM, so that the main loop handles them with the counters at hand.
+#
+# Execution starts at RESET_VECTOR with sp = 0 (see crt.S). ebreak and
+# illegal instructions trap to RESET_VECTOR, with mcause & mepc set as in
+# sys.vhd. Simulation ends on a jump to itself ('forever: j forever').
+#
+# Cycles are a first-order estimate: one cycle per instruction, plus a
+# penalty for each taken branch or jump.
+#-----------------------------------------------------------------------------
+import os
+import sys
+
+IMEM_START   = 0x00000
+HEAP_START   = 0x08000
+IOPAD_START  = 0x10000
+PAD_START    = 0x10004
+MEM_SIZE     = 0x10000
+PAD_SIZE     = 0x01000
+RESET_VECTOR = 0
+
+CSR_MCYCLE    = 0xC00
+CSR_MCYCLEH   = 0xC80
+CSR_MINSTRET  = 0xC02
+CSR_MINSTRETH = 0xC82
+CSR_MEPC      = 0x341
+CSR_MCAUSE    = 0x342
+
+MCAUSE_ILLEGAL = 2
+MCAUSE_BREAK   = 3
+
+BRANCH_PENALTY = 2
+MAX_INSTS      = 1 << 32
+
+SYSTEM = -1
+M32    = 0xFFFFFFFF
+
+def signed(v):
+    """Returns the 32-bit unsigned <v> as a signed integer"""
+
+    return (v ^ 0x80000000) - 0x80000000
+
+def imm_i(w):
+    return signed(w) >> 20
+
+def imm_s(w):
+    return (signed(w) >> 20 & ~0x1F) | (w >> 7 & 0x1F)
+
+def imm_b(w):
+    return (signed(w) >> 19 & ~0xFFF) | (w << 4 & 0x800) | (w >> 20 & 0x7E0) | (w >> 7 & 0x1E)
+
+def imm_u(w):
+    return w & 0xFFFFF000
+
+def imm_j(w):
+    return (signed(w) >> 11 & ~0xFFFFF) | (w & 0xFF000) | (w >> 9 & 0x800) | (w >> 20 & 0x7FE)
+
+def _div(a, b):
+    """RISC-V signed division (rounds toward zero)"""
+
+    if b == 0:
+        return -1
+    q = abs(a) // abs(b)
+    return q if (a < 0) == (b < 0) else -q
+
+def _rem(a, b):
+    """RISC-V signed remainder (sign of the dividend)"""
+
+    if b == 0:
+        return a
+    r = abs(a) % abs(b)
+    return r if a >= 0 else -r
+
+#-----------------------------------------------------------------------------
+# ISS
+#-----------------------------------------------------------------------------
+class Iss:
+    """RV32IM instruction-set simulator of the KeyV memory map"""
+
+    def __init__(self, branch_penalty=BRANCH_PENALTY):
+
+        if sys.byteorder != 'little':
+            raise RuntimeError("Iss:: memory views require a little-endian host")
+
+        self.mem  = bytearray(MEM_SIZE + PAD_SIZE)
+        self.m32  = memoryview(self.mem).cast('I')
+        self.m16  = memoryview(self.mem).cast('H')
+        self.s16  = memoryview(self.mem).cast('h')
+        self.s8   = memoryview(self.mem).cast('b')
+        self.x    = [0] * 32
+        self.code = [self._stub] * len(self.m32)
+
+        self.pc        = RESET_VECTOR
+        self.insts     = 0
+        self.redirects = 0
+        self.mepc      = 0
+        self.mcause    = 0
+        self.penalty   = branch_penalty
+
+    @property
+    def cycles(self):
+        return self.insts + self.penalty * self.redirects
+
+    #-------------------------------------------------------------------------
+    # Memory
+    #-------------------------------------------------------------------------
+    def load_hex(self, fname):
+        """Load a memory image in the dpm.vhd format (see hex.tcl)
+
+        '@<addr>' lines set the (word) address of the following data words."""
+
+        addr = 0
+        with open(fname) as f:
+            for n, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    if line[0] == '@':
+                        addr = int(line[1:], 16)
+                    else:
+                        self.m32[addr] = int(line, 16)
+                        addr += 1
+                except (ValueError, IndexError):
+                    raise ValueError("Iss:: invalid memory image {} (line {})".format(fname, n)) from None
+        self.code = [self._stub] * len(self.m32)
+
+    def pad(self):
+        """Returns the words of the IOPAD memory"""
+
+        return self.m32[IOPAD_START >> 2:].tolist()
+
+    #-------------------------------------------------------------------------
+    # Decoding
+    #-------------------------------------------------------------------------
+    def _stub(self, pc):
+        """Decode the instruction at <pc>, cache it & execute it"""
+
+        f = self.code[pc >> 2] = self.decode(self.m32[pc >> 2])
+        return f(pc)
+
+    def decode(self, w):
+        """Returns the closure f(pc) -> next pc of instruction word <w>"""
+
+        x, m32, m16, s16, s8, mem = self.x, self.m32, self.m16, self.s16, self.s8, self.mem
+        code, stub = self.code, self._stub
+
+        op  = w & 0x7F
+        rd  = w >> 7 & 0x1F
+        f3  = w >> 12 & 0x7
+        rs1 = w >> 15 & 0x1F
+        rs2 = w >> 20 & 0x1F
+        f7  = w >> 25
+
+        def addr(a):
+            # Pad selected by bit 16, main memory otherwise
+            return IOPAD_START | (a & (PAD_SIZE - 1)) if a & IOPAD_START else a & (MEM_SIZE - 1)
+
+        def nop(pc):
+            return pc + 4
+
+        def system(pc):
+            return SYSTEM
+
+        # LUI / AUIPC
+        if op == 0x37:
+            if rd == 0: return nop
+            imm = imm_u(w)
+            def f(pc):
+                x[rd] = imm
+                return pc + 4
+            return f
+
+        if op == 0x17:
+            if rd == 0: return nop
+            imm = imm_u(w)
+            def f(pc):
+                x[rd] = (pc + imm) & M32
+                return pc + 4
+            return f
+
+        # JAL / JALR
+        if op == 0x6F:
+            imm = imm_j(w)
+            if rd == 0:
+                def f(pc):
+                    return (pc + imm) & M32
+            else:
+                def f(pc):
+                    x[rd] = pc + 4
+                    return (pc + imm) & M32
+            return f
+
+        if op == 0x67 and f3 == 0:
+            imm = imm_i(w)
+            def f(pc):
+                t = (x[rs1] + imm) & 0xFFFFFFFE
+                if rd:
+                    x[rd] = pc + 4
+                return t
+            return f
+
+        # Branches
+        if op == 0x63:
+            imm = imm_b(w)
+            if f3 == 0:
+                def f(pc):
+                    return (pc + imm) & M32 if x[rs1] == x[rs2] else pc + 4
+            elif f3 == 1:
+                def f(pc):
+                    return (pc + imm) & M32 if x[rs1] != x[rs2] else pc + 4
+            elif f3 == 4:
+                def f(pc):
+                    return (pc + imm) & M32 if (x[rs1] ^ 0x80000000) < (x[rs2] ^ 0x80000000) else pc + 4
+            elif f3 == 5:
+                def f(pc):
+                    return (pc + imm) & M32 if (x[rs1] ^ 0x80000000) >= (x[rs2] ^ 0x80000000) else pc + 4
+            elif f3 == 6:
+                def f(pc):
+                    return (pc + imm) & M32 if x[rs1] < x[rs2] else pc + 4
+            elif f3 == 7:
+                def f(pc):
+                    return (pc + imm) & M32 if x[rs1] >= x[rs2] else pc + 4
+            else:
+                return system
+            return f
+
+        # Loads
+        if op == 0x03:
+            imm = imm_i(w)
+            if f3 == 0:
+                def f(pc):
+                    v = s8[addr((x[rs1] + imm) & M32)]
+                    if rd: x[rd] = v & M32
+                    return pc + 4
+            elif f3 == 1:
+                def f(pc):
+                    v = s16[addr((x[rs1] + imm) & M32) >> 1]
+                    if rd: x[rd] = v & M32
+                    return pc + 4
+            elif f3 == 2:
+                def f(pc):
+                    v = m32[addr((x[rs1] + imm) & M32) >> 2]
+                    if rd: x[rd] = v
+                    return pc + 4
+            elif f3 == 4:
+                def f(pc):
+                    v = mem[addr((x[rs1] + imm) & M32)]
+                    if rd: x[rd] = v
+                    return pc + 4
+            elif f3 == 5:
+                def f(pc):
+                    v = m16[addr((x[rs1] + imm) & M32) >> 1]
+                    if rd: x[rd] = v
+                    return pc + 4
+            else:
+                return system
+            return f
+
+        # Stores (invalidate the decoded instruction)
+        if op == 0x23:
+            imm = imm_s(w)
+            if f3 == 0:
+                def f(pc):
+                    a = addr((x[rs1] + imm) & M32)
+                    mem[a] = x[rs2] & 0xFF
+                    code[a >> 2] = stub
+                    return pc + 4
+            elif f3 == 1:
+                def f(pc):
+                    a = addr((x[rs1] + imm) & M32)
+                    m16[a >> 1] = x[rs2] & 0xFFFF
+                    code[a >> 2] = stub
+                    return pc + 4
+            elif f3 == 2:
+                def f(pc):
+                    a = addr((x[rs1] + imm) & M32)
+                    m32[a >> 2] = x[rs2]
+                    code[a >> 2] = stub
+                    return pc + 4
+            else:
+                return system
+            return f
+
+        # Register-immediate operations
+        if op == 0x13:
+            imm = imm_i(w)
+            sh  = rs2
+            if rd == 0:
+                return nop
+            if f3 == 0:
+                def f(pc):
+                    x[rd] = (x[rs1] + imm) & M32
+                    return pc + 4
+            elif f3 == 2:
+                def f(pc):
+                    x[rd] = int(signed(x[rs1]) < imm)
+                    return pc + 4
+            elif f3 == 3:
+                uimm = imm & M32
+                def f(pc):
+                    x[rd] = int(x[rs1] < uimm)
+                    return pc + 4
+            elif f3 == 4:
+                uimm = imm & M32
+                def f(pc):
+                    x[rd] = x[rs1] ^ uimm
+                    return pc + 4
+            elif f3 == 6:
+                uimm = imm & M32
+                def f(pc):
+                    x[rd] = x[rs1] | uimm
+                    return pc + 4
+            elif f3 == 7:
+                uimm = imm & M32
+                def f(pc):
+                    x[rd] = x[rs1] & uimm
+                    return pc + 4
+            elif f3 == 1 and f7 == 0:
+                def f(pc):
+                    x[rd] = (x[rs1] << sh) & M32
+                    return pc + 4
+            elif f3 == 5 and f7 == 0:
+                def f(pc):
+                    x[rd] = x[rs1] >> sh
+                    return pc + 4
+            elif f3 == 5 and f7 == 0x20:
+                def f(pc):
+                    x[rd] = (signed(x[rs1]) >> sh) & M32
+                    return pc + 4
+            else:
+                return system
+            return f
+
+        # Register-register operations
+        if op == 0x33:
+            func = REG_OPS.get((f7, f3))
+            if func is None:
+                return system
+            if rd == 0:
+                return nop
+            def f(pc):
+                x[rd] = func(x[rs1], x[rs2]) & M32
+                return pc + 4
+            return f
+
+        # FENCE
+        if op == 0x0F:
+            return nop
+
+        # CSR, ECALL, EBREAK & illegal instructions
+        return system
+
+    #-------------------------------------------------------------------------
+    # System instructions
+    #-------------------------------------------------------------------------
+    def csr_read(self, csr):
+        """Returns the value of <csr> (0 if not implemented)"""
+
+        return {CSR_MCYCLE:    self.cycles & M32,
+                CSR_MCYCLEH:   self.cycles >> 32 & M32,
+                CSR_MINSTRET:  self.insts & M32,
+                CSR_MINSTRETH: self.insts >> 32 & M32,
+                CSR_MEPC:      self.mepc,
+                CSR_MCAUSE:    self.mcause}.get(csr, 0)
+
+    def trap(self, pc, cause):
+        """Trap to the reset vector (sys.vhd)"""
+
+        self.mepc, self.mcause = pc, cause
+        return RESET_VECTOR
+
+    def system(self, pc):
+        """Execute the system (or illegal) instruction at <pc>, returns the next pc"""
+
+        w   = self.m32[pc >> 2]
+        op  = w & 0x7F
+        rd  = w >> 7 & 0x1F
+        f3  = w >> 12 & 0x7
+        rs1 = w >> 15 & 0x1F
+        csr = w >> 20
+
+        if op != 0x73 or f3 == 4:
+            return self.trap(pc, MCAUSE_ILLEGAL)
+        if f3 == 0:
+            if csr in (0, 1) and rs1 == 0 and rd == 0:
+                return self.trap(pc, MCAUSE_BREAK)
+            return self.trap(pc, MCAUSE_ILLEGAL)
+
+        old = self.csr_read(csr)
+        src = rs1 if f3 & 4 else self.x[rs1]
+        new = [None, src, old | src, old & ~src & M32][f3 & 3]
+        if csr == CSR_MEPC and not (f3 & 2 and rs1 == 0):
+            self.mepc = new
+        if rd:
+            self.x[rd] = old
+        return pc + 4
+
+    #-------------------------------------------------------------------------
+    # Main loop
+    #-------------------------------------------------------------------------
+    def run(self, max_insts=MAX_INSTS):
+        """Run until a jump to itself or about <max_insts> instructions
+
+        The limit is only checked on taken branches & jumps. Returns True if
+        the program ended, False if the limit was reached."""
+
+        code = self.code
+        pc   = self.pc
+        n    = self.insts
+        r    = self.redirects
+        done = False
+
+        try:
+            while True:
+                npc = code[pc >> 2](pc)
+                n  += 1
+                if npc != pc + 4:
+                    if npc == SYSTEM:
+                        self.insts, self.redirects = n - 1, r
+                        npc = self.system(pc)
+                        if npc == pc + 4:
+                            pc = npc
+                            continue
+                    r += 1
+                    done = (npc == pc)
+                    if done or n >= max_insts:
+                        pc = npc
+                        break
+                pc = npc
+        except IndexError:
+            raise RuntimeError("Iss:: pc 0x{:08X} is out of memory".format(pc)) from None
+        finally:
+            self.pc, self.insts, self.redirects = pc, n, r
+
+        return done
+
+#-----------------------------------------------------------------------------
+# Register-register operations: (funct7, funct3) -> f(rs1, rs2)
+#-----------------------------------------------------------------------------
+REG_OPS = {
+    (0x00, 0): lambda a, b: a + b,
+    (0x20, 0): lambda a, b: a - b,
+    (0x00, 1): lambda a, b: a << (b & 0x1F),
+    (0x00, 2): lambda a, b: int(signed(a) < signed(b)),
+    (0x00, 3): lambda a, b: int(a < b),
+    (0x00, 4): lambda a, b: a ^ b,
+    (0x00, 5): lambda a, b: a >> (b & 0x1F),
+    (0x20, 5): lambda a, b: signed(a) >> (b & 0x1F),
+    (0x00, 6): lambda a, b: a | b,
+    (0x00, 7): lambda a, b: a & b,
+    # M extension
+    (0x01, 0): lambda a, b: a * b,
+    (0x01, 1): lambda a, b: (signed(a) * signed(b)) >> 32,
+    (0x01, 2): lambda a, b: (signed(a) * b) >> 32,
+    (0x01, 3): lambda a, b: (a * b) >> 32,
+    (0x01, 4): lambda a, b: _div(signed(a), signed(b)),
+    (0x01, 5): lambda a, b: a // b if b else M32,
+    (0x01, 6): lambda a, b: _rem(signed(a), signed(b)),
+    (0x01, 7): lambda a, b: a % b if b else a,
+}
+
+#-----------------------------------------------------------------------------
+# Reports
+#-----------------------------------------------------------------------------
+def write_mti(fname, words, instance='/tb/u_top/u_iopad/mem', verbose=True):
+    """Write <words> as a Modelsim memory dump (mem save, hex radix)"""
+
+    width = len('{:x}'.format(max(len(words) - 1, 0)))
+    lines = ['// memory data file (do not edit the following line - required for mem load use)',
+             '// instance={}'.format(instance),
+             '// format=hex addressradix=h dataradix=h version=1.0 wordsperline=1']
+    lines += ['{:>{}x}: {:08x}'.format(a, width, w) for a, w in enumerate(words)]
+
+    os.makedirs(os.path.dirname(os.path.abspath(fname)), exist_ok=True)
+    with open(fname, 'w') as f:
+        f.write('\n'.join(lines) + '\n')
+    if verbose:
+        print("Updated: {}".format(fname))
+
+def simulate(hex_f, rpt, max_insts=MAX_INSTS, branch_penalty=BRANCH_PENALTY, verbose=True):
+    """Simulate memory image <hex_f> and dump the IOPAD memory into <rpt>"""
+
+    iss = Iss(branch_penalty)
+    iss.load_hex(hex_f)
+    if not iss.run(max_insts) and verbose:
+        print("Warning: {} stopped after {} instructions".format(hex_f, iss.insts))
+    write_mti(rpt, iss.pad(), verbose=verbose)
+    return iss
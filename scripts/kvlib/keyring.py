@@ -0,0 +1,218 @@
+#-----------------------------------------------------------------------------
+# Project : KeyV
+# File    : keyring.py
+# Author  : Mickael Fiorentino <mickael.fiorentino@polymtl.ca>
+# Lab     : GRM - Polytechnique Montreal
+# Date    : <2026-10-17 Sat>
+# Brief   : NumPy model of the KeyRing timing graph (see KeyRing.tcl)
+#-----------------------------------------------------------------------------
+# The KeyRing is a toroidal mesh G = (C, K), C ∈ E × S, with connections:
+#   (1)          (e,s) ← (e, [s − 1]%S), ([e − 1]%E, [s + D - 1]%S)
+#   (2)          (e,s) → (e, [s + 1]%S), ([e + 1]%E, [s - D + 1]%S)
+#
+# Click (e, s) is numbered c = e*S + s. The graph is stored as integer
+# adjacency arrays: parents[c] = (left, up), children[c] = (right, down).
+# Timing attributes are arrays over all clicks:
+#   delay_max/min[c, j] : DE delay from c to children[c, j] (setup/hold)
+#   margin[c]           : (setup, hold) margins of c
+#   period[c]           : effective period of c
+#
+# get_effective_delay of KeyRing.tcl explores the graph breadth-first from
+# the source click, twice, relaxing the cumulated delays of the children of
+# each visited click. The visit order only depends on the graph: it is
+# computed once and translated to every source, and both passes then run for all sources
+# at once (one vectorized step per visited click).
+#-----------------------------------------------------------------------------
+import collections
+import numpy as np
+
+LEFT, UP    = 0, 1
+RIGHT, DOWN = 0, 1
+PARENTS     = {'left': LEFT, 'up': UP}
+CHILDREN    = {'right': RIGHT, 'down': DOWN}
+SETUP, HOLD = 0, 1
+
+class KeyRing:
+    """E x S KeyRing with a dependency shift D between successive EUs"""
+
+    def __init__(self, E, S, D, name='main'):
+
+        if D * E != S:
+            raise ValueError("KeyRing:: wrong configuration: {} =/= {} x {}".format(S, E, D))
+
+        self.E, self.S, self.D = E, S, D
+        self.name = name
+        self.n    = E * S
+
+        c = np.arange(self.n)
+        self.eu, self.stage = np.divmod(c, S)
+        e, s = self.eu, self.stage
+
+        self.parents  = np.stack([self.index(e, s - 1),     self.index(e - 1, s + D - 1)], axis=1)
+        self.children = np.stack([self.index(e, s + 1),     self.index(e + 1, s - D + 1)], axis=1)
+
+        # The mesh is invariant by translation: so is the visit order
+        o = np.array(self._bfs(0), dtype=int)
+        self.order = self.index(e[:, None] + self.eu[o], s[:, None] + self.stage[o])
+
+        self.delay_max = np.zeros((self.n, 2))
+        self.delay_min = np.zeros((self.n, 2))
+        self.margin    = np.zeros((self.n, 2))
+        self.period    = np.zeros(self.n)
+        self.dl_size   = np.zeros(self.n, dtype=int)
+        self.dl_length = np.zeros(self.n, dtype=int)
+
+    def _bfs(self, src):
+        """Returns the clicks in the order they are visited from <src>"""
+
+        seen  = {src}
+        queue = collections.deque([src])
+        order = []
+        while queue:
+            c = queue.popleft()
+            order.append(c)
+            for child in self.children[c]:
+                if child not in seen:
+                    seen.add(child)
+                    queue.append(child)
+        return order
+
+    #-------------------------------------------------------------------------
+    # Naming & indexing
+    #-------------------------------------------------------------------------
+    def index(self, e, s):
+        """Returns the click number(s) of indexes (<e>, <s>), modulo (E, S)"""
+
+        return (np.asarray(e) % self.E) * self.S + np.asarray(s) % self.S
+
+    def get_name(self, c):
+        """Returns the name of click number <c> (C_<name>_<e><s>)"""
+
+        return 'C_{}_{}{}'.format(self.name, self.eu[c], self.stage[c])
+
+    def get_click(self, click):
+        """Returns the number of <click> (name or number)"""
+
+        if isinstance(click, str):
+            prefix = 'C_{}_'.format(self.name)
+            es = click[len(prefix):] if click.startswith(prefix) else ''
+            if len(es) != 2 or not es.isdigit() or int(es[0]) >= self.E or int(es[1]) >= self.S:
+                raise ValueError("KeyRing:: click {} is not in the keyring".format(click))
+            return int(self.index(int(es[0]), int(es[1])))
+        return int(click)
+
+    def get_clicks(self):
+        """Returns the names of all clicks"""
+
+        return [self.get_name(c) for c in range(self.n)]
+
+    def get_parent(self, click, direction):
+        """Returns the 'left' or 'up' parent name of <click>"""
+
+        return self.get_name(self.parents[self.get_click(click), PARENTS[direction]])
+
+    def get_child(self, click, direction):
+        """Returns the 'right' or 'down' child name of <click>"""
+
+        return self.get_name(self.children[self.get_click(click), CHILDREN[direction]])
+
+    def get_clock_name(self, click, kind, direction):
+        """Returns the <kind> (launch|capture) clock name of <click> in <direction>"""
+
+        check = 'setup' if direction in PARENTS else 'hold'
+        return '{}_{}_{}_{}'.format(self.get_name(self.get_click(click)), check, direction, kind)
+
+    #-------------------------------------------------------------------------
+    # Delays
+    #-------------------------------------------------------------------------
+    def set_delays(self, delay_max=None, delay_min=None):
+        """Set the (click x child) DE delays, then update the periods
+
+        When both children of a click are the same click, a single delay is
+        recorded in KeyRing.tcl (the last one set, 'down'): it is used for both."""
+
+        for attr, val in (('delay_max', delay_max), ('delay_min', delay_min)):
+            if val is None:
+                continue
+            val = np.array(val, dtype=float).reshape(self.n, 2)
+            same = self.children[:, RIGHT] == self.children[:, DOWN]
+            val[same, RIGHT] = val[same, DOWN]
+            setattr(self, attr, val)
+        self.period = self.periods()
+
+    def init_delays(self, de_size, de_min, de_max, de_length, margins=(0, 0)):
+        """Initial delays from the DE parameters & per stage lengths <de_length>"""
+
+        self.dl_size[:]   = de_size
+        self.dl_length[:] = np.asarray(de_length)[self.stage]
+        if (self.dl_length > self.dl_size).any():
+            raise ValueError("KeyRing:: delay line size cannot be less than its length")
+
+        length = np.repeat(self.dl_length[:, None], 2, axis=1)
+        self.margin[:] = margins
+        self.set_delays(de_max * length, de_min * length)
+
+    def distances(self):
+        """Returns the (source x click) distances of the effective delay exploration"""
+
+        rows  = np.arange(self.n)
+        cumul = np.zeros((self.n, self.n))
+        dist  = np.zeros((self.n, self.n))
+
+        # 1st pass: init, 2nd pass: definitive values
+        for _ in range(2):
+            for k in range(self.n):
+                src = self.order[:, k]
+                dist[rows, src] = cumul[rows, src]
+                for j in (RIGHT, DOWN):
+                    dest = self.children[src, j]
+                    cumul[rows, dest] = np.maximum(cumul[rows, dest],
+                                                   cumul[rows, src] + self.delay_max[src, j])
+        return dist
+
+    def effective_delays(self):
+        """Returns the (source x destination) maximum delays between clicks
+
+        The diagonal holds the effective period of each click."""
+
+        dist = self.distances()
+        eff  = dist - np.diag(dist)[:, None]
+
+        c    = np.arange(self.n)
+        left = self.parents[:, LEFT]
+        up   = self.parents[:, UP]
+        eff[c, c] = np.maximum(eff[c, left] + self.delay_max[left, RIGHT],
+                               eff[c, up] + self.delay_max[up, DOWN])
+        return eff
+
+    def get_effective_delay(self, src, dest):
+        """Returns the maximum delay between <src> and <dest> clicks"""
+
+        return self.effective_delays()[self.get_click(src), self.get_click(dest)]
+
+    def periods(self):
+        """Returns the effective period of each click"""
+
+        return np.diag(self.effective_delays()).copy()
+
+    #-------------------------------------------------------------------------
+    # Slacks
+    #-------------------------------------------------------------------------
+    def slacks(self, arrival_max, arrival_min):
+        """Returns the (click x parent) setup & (click x child) hold slacks
+
+        <arrival_max> and <arrival_min> are the (click x child) data arrival
+        times: setup paths must arrive before the DE delay (minus margin),
+        hold paths after it (plus margin)."""
+
+        arrival_max = np.asarray(arrival_max, dtype=float).reshape(self.n, 2)
+        arrival_min = np.asarray(arrival_min, dtype=float).reshape(self.n, 2)
+
+        # Setup paths end at the click: parent -> click
+        p = self.parents
+        d = np.array([RIGHT, DOWN])
+        setup = self.delay_max[p, d] - arrival_max[p, d] - self.margin[:, SETUP, None]
+
+        # Hold paths start at the click: click -> child
+        hold = arrival_min - self.delay_min - self.margin[:, HOLD, None]
+        return setup, hold
@@ -0,0 +1,19 @@
+#-----------------------------------------------------------------------------
+# Project : KeyV
+# File    : __init__.py
+# Author  : Mickael Fiorentino <mickael.fiorentino@polymtl.ca>
+# Lab     : GRM - Polytechnique Montreal
+# Date    : <2026-10-17 Sat>
+# Brief   : Streaming parsers for DC/PrimeTime & simulation reports
+#-----------------------------------------------------------------------------
+# Python port of data_parse.tcl. Reports are read line by line and matched
+# against a single precompiled alternation, so they never sit in memory.
+#
+#   scan  : Line scanner built on one alternation of named patterns
+#   area  : Area reports      -> <core>.area.csv
+#   bench : Sim/power reports -> <core>.benchmarks.csv
+#   sta   : Timing reports    -> <core>.timing.csv
+#   paths : Timing reports    -> every path (memory-mapped, see kvlib/paths.py)
+#   saif  : SAIF activity     -> <design>.<step>.<bench>.activity.csv
+#   cores : Processors configuration & parallel driver
+#-----------------------------------------------------------------------------
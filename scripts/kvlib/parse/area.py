@@ -0,0 +1,44 @@
+#-----------------------------------------------------------------------------
+# Project : KeyV
+# File    : area.py
+# Author  : Mickael Fiorentino <mickael.fiorentino@polymtl.ca>
+# Lab     : GRM - Polytechnique Montreal
+# Date    : <2026-10-17 Sat>
+# Brief   : Parse DC area reports and produce csv summaries
+#-----------------------------------------------------------------------------
+from .scan import Scanner, VAL_RE, read_lines, write_csv
+
+# Global metrics (in csv column order)
+AREA_GLOBALS = [
+    ('cmb', r'Combinational area:\s+(' + VAL_RE + ')'),
+    ('inv', r'Buf/Inv area:\s+(' + VAL_RE + ')'),
+    ('seq', r'Noncombinational area:\s+(' + VAL_RE + ')'),
+    ('tot', r'Total cell area:\s+(' + VAL_RE + ')'),
+]
+
+def area_scanner(modules):
+    """Returns the Scanner of global metrics & <modules> instances (u_<m>)"""
+
+    mods = [(m, r'\bu_' + m + r'\s+\w+\s+(' + VAL_RE + ')') for m in modules]
+    return Scanner(AREA_GLOBALS + mods)
+
+def parse_area(rpt, csv, modules, verbose=True):
+    """Parse area report <rpt> into <csv> for instances <modules>"""
+
+    with read_lines(rpt) as f:
+        found = area_scanner(modules).first(f)
+
+    area = {}
+    for k in [g for g, _ in AREA_GLOBALS] + list(modules):
+        if k not in found:
+            raise ValueError("parse_area:: module {} not found in {}".format(k, rpt))
+        area[k] = float(found[k])
+
+    # core area is total-sum(modules)
+    core = area['tot'] - sum(area[m] for m in modules)
+
+    keys    = list(modules) + [g for g, _ in AREA_GLOBALS]
+    header  = ','.join(['CORE'] + [k.upper() for k in keys])
+    content = ','.join(['{:.6e}'.format(core)] + ['{:.6e}'.format(area[k]) for k in keys])
+    write_csv(csv, [header, content], verbose)
+    return area
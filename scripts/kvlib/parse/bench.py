@@ -0,0 +1,84 @@
+#-----------------------------------------------------------------------------
+# Project : KeyV
+# File    : bench.py
+# Author  : Mickael Fiorentino <mickael.fiorentino@polymtl.ca>
+# Lab     : GRM - Polytechnique Montreal
+# Date    : <2026-10-17 Sat>
+# Brief   : Parse simulation & power reports and produce benchmark summaries
+#-----------------------------------------------------------------------------
+from .scan import Scanner, VAL_RE, read_lines, write_csv
+
+BENCHMARKS = ['dhrystone', 'coremark']
+
+# Scratchpad word addresses of the cycles & instructions counters
+SIM_ADDR_CYCLE = {'dhrystone': 2, 'coremark': 8}
+SIM_ADDR_INST  = {'dhrystone': 3, 'coremark': 6}
+
+# Global metrics (in csv column order). Values are the last of a run.
+PWR_GLOBALS = [
+    ('ct',  r'clock_network\s+((?:' + VAL_RE + ')+)'),
+    ('reg', r'register\s+((?:' + VAL_RE + ')+)'),
+    ('cmb', r'combinational\s+((?:' + VAL_RE + ')+)'),
+    ('seq', r'sequential\s+((?:' + VAL_RE + ')+)'),
+    ('sw',  r'Net Switching Power\s+=\s+(' + VAL_RE + ')'),
+    ('int', r'Cell Internal Power\s+=\s+(' + VAL_RE + ')'),
+    ('lk',  r'Cell Leakage Power\s+=\s+(' + VAL_RE + ')'),
+    ('tot', r'Total Power\s+=\s+(' + VAL_RE + ')'),
+]
+
+def power_scanner(modules):
+    """Returns the Scanner of global metrics & <modules> instances (u_<m>)"""
+
+    mods = [(m, r'\bu_' + m + r'\s+\(\w+\)\s+((?:' + VAL_RE + ')+)') for m in modules]
+    return Scanner(PWR_GLOBALS + mods)
+
+def sim_scanner(bench):
+    """Returns the Scanner of the <bench> scratchpad counters"""
+
+    return Scanner([
+        ('cycles', r'^\s*{}:\s+(\w+)'.format(SIM_ADDR_CYCLE[bench])),
+        ('insts',  r'^\s*{}:\s+(\w+)'.format(SIM_ADDR_INST[bench])),
+    ])
+
+def parse_sim(sim_rpt, bench):
+    """Returns {cycles, insts} of <bench> from the memory dump <sim_rpt>"""
+
+    with read_lines(sim_rpt) as f:
+        found = sim_scanner(bench).first(f)
+
+    for k in ['cycles', 'insts']:
+        if k not in found:
+            raise ValueError("parse_benchmarks:: {} not found in {}".format(k, sim_rpt))
+    return {k: int(found[k], 16) for k in ['cycles', 'insts']}
+
+def parse_power(pwr_rpt, modules):
+    """Returns {metric: power} from the power report <pwr_rpt>"""
+
+    with read_lines(pwr_rpt) as f:
+        found = power_scanner(modules).first(f)
+
+    power = {}
+    for k in [g for g, _ in PWR_GLOBALS] + list(modules):
+        if k not in found:
+            raise ValueError("parse_benchmarks:: module {} not found in {}".format(k, pwr_rpt))
+        power[k] = float(found[k].split()[-1])
+    return power
+
+def parse_benchmarks(sim_rpt, pwr_rpt, csv, modules, benchmarks=BENCHMARKS, verbose=True):
+    """Parse sim & power reports (<B> is the benchmark) into <csv>"""
+
+    rows = []
+    for bench in benchmarks:
+        sim   = parse_sim(sim_rpt.replace('<B>', bench), bench)
+        power = parse_power(pwr_rpt.replace('<B>', bench), modules)
+
+        # core power is total-sum(modules)
+        core = power['tot'] - sum(power[m] for m in modules)
+
+        vals = [core] + [power[m] for m in modules] \
+             + [power[g] for g, _ in PWR_GLOBALS] + [sim['cycles'], sim['insts']]
+        rows.append(','.join([bench] + ['{:.6e}'.format(v) for v in vals]))
+
+    keys   = list(modules) + [g for g, _ in PWR_GLOBALS] + ['cycles', 'insts']
+    header = ','.join(['BENCH', 'CORE'] + [k.upper() for k in keys])
+    write_csv(csv, [header] + rows, verbose)
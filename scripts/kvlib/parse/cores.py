@@ -0,0 +1,109 @@
+#-----------------------------------------------------------------------------
+# Project : KeyV
+# File    : cores.py
+# Author  : Mickael Fiorentino <mickael.fiorentino@polymtl.ca>
+# Lab     : GRM - Polytechnique Montreal
+# Date    : <2026-10-17 Sat>
+# Brief   : Processors configuration & parallel parsing driver
+#-----------------------------------------------------------------------------
+# Reports & csv outputs live in $KEYV_DATA/<core>/ (see data_parse.tcl).
+# Every (core, report) pair is an independent task run in a process pool.
+#-----------------------------------------------------------------------------
+import os
+
+from .area  import parse_area
+from .bench import parse_benchmarks
+from .sta   import parse_sta
+from ..render import pool_map
+
+CORES = ['keyv362', 'keyv661', 'synv', 'synvcg']
+
+MODULES = {
+    'synv':    ['idecode', 'pc', 'rf', 'alu', 'lsu', 'sys', 'perf', 'clock_and_reset'],
+    'synvcg':  ['idecode', 'pc', 'rf', 'alu', 'lsu', 'sys', 'perf', 'clock_and_reset'],
+    'keyv362': ['idecode', 'pc', 'rf', 'alu', 'lsu', 'sys', 'perf', 'keyring', 'xbs', 'cycle_sync',
+                'xu_0', 'xu_1', 'xu_2'],
+    'keyv661': ['idecode', 'pc', 'rf', 'alu', 'lsu', 'sys', 'perf', 'keyring', 'xbs', 'cycle_sync',
+                'xu_0', 'xu_1', 'xu_2', 'xu_3', 'xu_4', 'xu_5'],
+}
+
+# KeyRing (E, S, D) of KeyV processors: only those have a STA summary
+KEYRINGS = {
+    'keyv362': (3, 6, 2),
+    'keyv661': (6, 6, 1),
+}
+
+# Inputs & outputs, relative to $KEYV_DATA (<B> is the benchmark)
+STA_RPT   = '{core}/{core}.timing.rpt'
+AREA_RPT  = '{core}/{core}.area.rpt'
+PWR_RPT   = '{core}/{core}.pwr.<B>.rpt'
+SIM_RPT   = '{core}/{core}.sim.<B>.rpt'
+BENCH_CSV = '{core}/{core}.benchmarks.csv'
+AREA_CSV  = '{core}/{core}.area.csv'
+STA_CSV   = '{core}/{core}.timing.csv'
+
+def core_path(data, fmt, core):
+    """Returns the path <fmt> of <core> in the <data> directory"""
+
+    return os.path.join(data, fmt.format(core=core))
+
+def core_tasks(core, data):
+    """Returns the list of parsing tasks (func, args) of <core>"""
+
+    if core not in CORES:
+        raise ValueError("core_tasks:: core {} is not in the processor list ({})".format(core, CORES))
+
+    tasks = [(parse_area, (core_path(data, AREA_RPT, core), core_path(data, AREA_CSV, core),
+                           MODULES[core]))]
+    if core in KEYRINGS:
+        tasks.append((parse_sta, (core_path(data, STA_RPT, core), core_path(data, STA_CSV, core),
+                                  KEYRINGS[core])))
+    tasks.append((parse_benchmarks, (core_path(data, SIM_RPT, core), core_path(data, PWR_RPT, core),
+                                     core_path(data, BENCH_CSV, core), MODULES[core])))
+    return tasks
+
+def _run(task):
+    func, args = task
+    return func(*args)
+
+def parse_all(cores=CORES, data=None, n_jobs=0):
+    """Parse all reports of <cores> on <n_jobs> processes (0: one per cpu)"""
+
+    data  = data or os.environ['KEYV_DATA']
+    tasks = [t for core in cores for t in core_tasks(core, data)]
+
+    for _ in pool_map(_run, tasks, n_jobs):
+        pass
+
+#-----------------------------------------------------------------------------
+# CHECK
+#-----------------------------------------------------------------------------
+def read_columns(csv_f):
+    """Returns {column: values} of <csv_f> (values as written)"""
+
+    with open(csv_f) as f:
+        rows = [l.rstrip('\n').split(',') for l in f if l.strip()]
+    return {k: [r[i] for r in rows[1:]] for i, k in enumerate(rows[0])}
+
+def compare(cores=CORES, data=None, ref=None):
+    """Returns the differences between the csv outputs of <cores> in <data> & <ref>
+
+    <ref> holds the outputs of data_parse.tcl. Columns are matched by name,
+    as data_parse.tcl writes them in hash order."""
+
+    data  = data or os.environ['KEYV_DATA']
+    diffs = []
+    for core in cores:
+        for fmt in [AREA_CSV, BENCH_CSV] + ([STA_CSV] if core in KEYRINGS else []):
+            out, exp = core_path(data, fmt, core), core_path(ref, fmt, core)
+            for f in (out, exp):
+                if not os.path.exists(f):
+                    diffs.append("{}: not found".format(f))
+            if not (os.path.exists(out) and os.path.exists(exp)):
+                continue
+            a, b = read_columns(out), read_columns(exp)
+            if set(a) != set(b):
+                diffs.append("{}: columns {} =/= {}".format(out, sorted(a), sorted(b)))
+                continue
+            diffs += ["{}: {} {} =/= {}".format(out, k, a[k], b[k]) for k in a if a[k] != b[k]]
+    return diffs
@@ -0,0 +1,209 @@
+#-----------------------------------------------------------------------------
+# Project : KeyV
+# File    : paths.py
+# Author  : Mickael Fiorentino <mickael.fiorentino@polymtl.ca>
+# Lab     : GRM - Polytechnique Montreal
+# Date    : <2026-10-17 Sat>
+# Brief   : Memory-mapped scanner of every path of a PrimeTime timing report
+#-----------------------------------------------------------------------------
+# parse_sta only reads the summary table of the report. This scanner reads
+# the path sections:
+#   Startpoint: <name> (... clocked by C_main_<e><s>_<setup|hold>_<dir>_launch)
+#   Endpoint: <name> (... clocked by C_main_<e><s>_<setup|hold>_<dir>_capture)
+#   Path Type: max|min
+#   ...
+#   data arrival time   <arrival>
+#   ...
+#   slack (MET)         <slack>
+#
+# The report is memory-mapped and scanned in chunks cut at the start of a
+# path, so that no path spans two chunks. Each chunk is matched with one
+# findall (no Python code per line) and its matches are turned into columns
+# with NumPy: a path is everything between two Startpoint lines, and only the
+# first occurrence of each field is kept (PrimeTime repeats the arrival time
+# in the slack computation). Memory is the chunk plus the output columns.
+#
+# Reports without path sections (summary table only) are indexed from the
+# table: one path per row, from the launch to the capture clock.
+#
+# KeyRing.tcl names both clocks of a path after the captured click (e.g.
+# C_main_12_setup_up_launch & C_main_12_setup_up_capture): the launching
+# click is not in the report, it is the parent of the captured click in the
+# direction of the path (see paths.PathIndex.launch).
+#-----------------------------------------------------------------------------
+import os
+import re
+import mmap
+import numpy as np
+from .sta import STA_RE
+
+CHUNK_SIZE = 1 << 22
+
+DIRECTIONS = ['left', 'up', 'right', 'down']
+KINDS      = ['setup', 'hold']
+
+CLK_RE  = rb'(?:[^\n]*?C_main_([0-9])([0-9])(?:_(setup|hold)_(left|up|right|down))?)?'
+PATH_RE = re.compile(
+    rb'^[ \t]*(?:(Startpoint|Endpoint):[ \t]*(\S+)' + CLK_RE +
+    rb'|Path Type:[ \t]*(max|min)'
+    rb'|(data arrival time|slack)(?:[ \t]*\(\w+\))?[ \t]+(-?[0-9]+\.?[0-9]*(?:e-?[0-9]+)?))', re.M)
+ROW_RE  = re.compile(STA_RE.pattern.encode())
+CLICK_RE = re.compile(rb'C_main_([0-9])([0-9])_(setup|hold)_(left|up|right|down)')
+
+# Columns of a path table: names are ids into the names array
+COLUMNS = ['start', 'end', 'capture_e', 'capture_s', 'kind', 'dir', 'arrival', 'slack']
+
+#-----------------------------------------------------------------------------
+# CHUNKS
+#-----------------------------------------------------------------------------
+def chunks(mm, size=CHUNK_SIZE, key=b'Startpoint:'):
+    """Yields (start, end) chunks of <mm> of about <size> bytes, cut at the line of a <key>"""
+
+    pos, total = 0, len(mm)
+    while pos < total:
+        end = min(pos + size, total)
+        if end < total:
+            cut  = mm.rfind(key, pos, end)
+            line = mm.rfind(b'\n', pos, cut) + 1 if cut > pos else 0
+            if line <= pos:
+                # A single path longer than the chunk: up to the next one
+                cut  = mm.find(key, end)
+                line = mm.rfind(b'\n', pos, cut) + 1 if cut > 0 else 0
+            end = line if line > pos else total
+        yield pos, end
+        pos = end
+
+def _first(mask, path, n):
+    """Returns the match index of the first <mask> match of each of the <n> paths (-1 if none)"""
+
+    sel   = np.flatnonzero(mask & (path >= 0))
+    first = np.full(n, -1)
+    p, i  = np.unique(path[sel], return_index=True)
+    first[p] = sel[i]
+    return first
+
+def _take(col, first, fill):
+    """Returns <col>[first], <fill> where first is -1"""
+
+    out = col[np.maximum(first, 0)]
+    out[first < 0] = fill
+    return out
+
+def _ints(col):
+    """Bytes digits column to int8 (-1 if empty)"""
+
+    out = np.full(len(col), -1, dtype=np.int8)
+    ok  = col != b''
+    out[ok] = col[ok].astype(np.int8)
+    return out
+
+def _enum(col, values):
+    """Bytes column to the int8 index in <values> (-1 if not one of them)"""
+
+    out = np.full(len(col), -1, dtype=np.int8)
+    for i, v in enumerate(values):
+        out[col == v.encode()] = i
+    return out
+
+#-----------------------------------------------------------------------------
+# SCANNER
+#-----------------------------------------------------------------------------
+class _Names:
+    """Interning of path start/end names across chunks"""
+
+    def __init__(self):
+        self.ids   = {}
+        self.names = []
+
+    def intern(self, col):
+        uniq, inv = np.unique(col, return_inverse=True)
+        gid = np.empty(len(uniq), dtype=np.int32)
+        for i, n in enumerate(uniq.tolist()):
+            gid[i] = self.ids.setdefault(n, len(self.names))
+            if gid[i] == len(self.names):
+                self.names.append(n)
+        return gid[inv.reshape(-1)]
+
+def _scan_chunk(mm, start, end, names):
+    """Returns the columns of the paths in mm[start:end]"""
+
+    m = PATH_RE.findall(mm, start, end)
+    if not m:
+        return None
+    key, name, e, s, kind, dr, ptype, fkey, val = (np.array(c, dtype=bytes) for c in zip(*m))
+
+    is_start = key == b'Startpoint'
+    path = np.cumsum(is_start) - 1
+    n    = int(path[-1]) + 1
+    if n == 0:
+        return None
+
+    st  = np.flatnonzero(is_start)
+    en  = _first(key == b'Endpoint', path, n)
+    pt  = _first(ptype != b'', path, n)
+    arr = _first(fkey == b'data arrival time', path, n)
+    slk = _first(fkey == b'slack', path, n)
+
+    vals = np.where(val == b'', b'nan', val).astype(np.float32)
+    cols = {
+        'start':     names.intern(name[st]),
+        'end':       names.intern(_take(name, en, b'')),
+        'capture_e': _ints(_take(e, en, b'')),
+        'capture_s': _ints(_take(s, en, b'')),
+        'kind':      _enum(kind[st], KINDS),
+        'dir':       _enum(dr[st], DIRECTIONS),
+        'arrival':   _take(vals, arr, np.nan),
+        'slack':     _take(vals, slk, np.nan),
+    }
+
+    # Path Type: max is a setup check, min a hold check (clock names aside)
+    ptk = _enum(_take(ptype, pt, b''), ['max', 'min'])
+    cols['kind'] = np.where(ptk >= 0, ptk, cols['kind']).astype(np.int8)
+    return cols
+
+def _click(clock):
+    m = CLICK_RE.search(clock)
+    return m.groups() if m else (b'',) * 4
+
+def _scan_table(mm, names):
+    """Returns the columns of the rows of the summary table (one path per row)"""
+
+    m = ROW_RE.findall(mm)
+    if not m:
+        return None
+    launch, capture, delay, slack = (np.array(c, dtype=bytes) for c in zip(*m))
+    lc = [_click(l) for l in launch.tolist()]
+    cc = [_click(c) for c in capture.tolist()]
+    _, _, kind, dr   = (np.array(c, dtype=bytes) for c in zip(*lc))
+    ce, cs, _, _     = (np.array(c, dtype=bytes) for c in zip(*cc))
+    delay, slack     = delay.astype(np.float32), slack.astype(np.float32)
+
+    # Same convention as timing.StaSummary: the arrival time is delay - slack
+    return {'start': names.intern(launch), 'end': names.intern(capture),
+            'capture_e': _ints(ce), 'capture_s': _ints(cs),
+            'kind': _enum(kind, KINDS), 'dir': _enum(dr, DIRECTIONS),
+            'arrival': delay - slack, 'slack': slack}
+
+def scan_paths(rpt, chunk_size=CHUNK_SIZE):
+    """Returns ({column: array}, names) of every path of timing report <rpt>"""
+
+    if not os.path.isfile(rpt):
+        raise FileNotFoundError("file {} does not exist".format(rpt))
+
+    names = _Names()
+    parts = []
+    if os.path.getsize(rpt) > 0:
+        with open(rpt, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for start, end in chunks(mm, chunk_size):
+                cols = _scan_chunk(mm, start, end, names)
+                if cols is not None:
+                    parts.append(cols)
+            if not parts:
+                cols = _scan_table(mm, names)
+                if cols is not None:
+                    parts.append(cols)
+
+    if not parts:
+        raise ValueError("scan_paths:: no timing path in {}".format(rpt))
+    cols = {c: np.concatenate([p[c] for p in parts]) for c in COLUMNS}
+    return cols, np.array(names.names, dtype=bytes)
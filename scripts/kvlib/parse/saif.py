@@ -0,0 +1,197 @@
+#-----------------------------------------------------------------------------
+# Project : KeyV
+# File    : saif.py
+# Author  : Mickael Fiorentino <mickael.fiorentino@polymtl.ca>
+# Lab     : GRM - Polytechnique Montreal
+# Date    : <2026-10-17 Sat>
+# Brief   : Streaming SAIF parser: switching activity per instance
+#-----------------------------------------------------------------------------
+# SAIF files (run.do: power report -bsaif) are nested S-expressions:
+#   (INSTANCE u_rf
+#     (NET
+#       (\regs[3][0]
+#         (T0 1200) (T1 300) (TX 0) (TC 18) (IG 0)
+#       ) ...
+#
+# The file is read in fixed-size chunks (cut after the last newline) and
+# tokenized with one compiled alternation. Net entries in the vsim layout
+# (T0, T1, TX, TC [, IG]) are matched as a whole, other layouts token by
+# token. Only the parenthesis depth, the stack of open instances & their
+# accumulators are kept: memory does not depend on the file size.
+#
+# Toggles of the nets of each instance are summed into [NETS, TC, T0, T1, TX,
+# IG]. Ports are the nets of the parent instance: they are left out unless
+# requested.
+#-----------------------------------------------------------------------------
+import re
+import numpy as np
+from .scan import read_lines, write_csv
+
+# Activity of the core (run.do: power add -r ${dut}/*, pwr.tcl: -strip_path)
+DUT = 'tb/u_top/u_core'
+
+FIELDS  = ['NETS', 'TC', 'T0', 'T1', 'TX', 'IG']
+TOGGLES = {k: i for i, k in enumerate(FIELDS) if i > 0}
+NETS    = 0
+
+CHUNK_SIZE = 1 << 22
+
+TIME_UNITS = {'s': 1, 'ms': 1e-3, 'us': 1e-6, 'ns': 1e-9, 'ps': 1e-12, 'fs': 1e-15}
+
+NAME_RE = r'(?:\\.|[^\s()"\\])'
+SAIF_RE = re.compile('|'.join([
+    r'(?P<net>\(' + NAME_RE + r'+\s*\(T0\s+(?P<t0>[0-9]+)\)\s*\(T1\s+(?P<t1>[0-9]+)\)\s*'
+    r'\(TX\s+(?P<tx>[0-9]+)\)\s*\(TC\s+(?P<tc>[0-9]+)\)\s*(?:\(IG\s+(?P<ig>[0-9]+)\)\s*)?\))',
+    r'\((?P<tk>T0|T1|TX|TC|IG)\s+(?P<tog>[0-9]+)\s*\)',
+    r'\(DURATION\s+(?P<dur>[0-9.eE+-]+)\s*\)',
+    r'\(TIMESCALE\s+(?P<tsv>[0-9]+)\s*(?P<ts>[munpf]?s)\s*\)',
+    r'\(INSTANCE\s+(?:"[^"]*"\s+)?(?P<inst>' + NAME_RE + r'+)',
+    r'\((?P<open>' + NAME_RE + r'*)',
+    r'(?P<close>\))',
+    r'(?P<str>"[^"]*")',
+]))
+
+#-----------------------------------------------------------------------------
+# PARSER
+#-----------------------------------------------------------------------------
+class Activity:
+    """Switching activity of a SAIF file: [NETS, TC, T0, T1, TX, IG] per instance"""
+
+    def __init__(self, instances, duration, timescale):
+
+        self.instances = instances
+        self.duration  = duration
+        self.timescale = timescale
+
+    @property
+    def time(self):
+        """Duration of the recorded activity (s)"""
+
+        return self.duration * self.timescale
+
+    def subtree(self, path):
+        """Returns the activity of instance <path> & all its descendants"""
+
+        acc = np.zeros(len(FIELDS), dtype=np.int64)
+        for p, val in self.instances.items():
+            if p == path or p.startswith(path + '/'):
+                acc += val
+        return acc
+
+    def modules(self, dut=DUT):
+        """Returns {instance: activity} of the children of <dut>, with their descendants
+
+        Nets of <dut> itself are reported as '.'."""
+
+        mods = {}
+        pre  = dut + '/'
+        for p, val in self.instances.items():
+            if p == dut:
+                name = '.'
+            elif p.startswith(pre):
+                name = p[len(pre):].split('/', 1)[0]
+            else:
+                continue
+            mods.setdefault(name, np.zeros(len(FIELDS), dtype=np.int64))
+            mods[name] += val
+        if not mods:
+            raise ValueError("parse_saif:: instance {} not found".format(dut))
+        return mods
+
+def tokens(f, chunk_size=CHUNK_SIZE):
+    """Yields the SAIF_RE matches of file <f>, read in chunks of <chunk_size>"""
+
+    rest = ''
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            break
+        buf = rest + chunk
+        cut = buf.rfind('\n') + 1
+        if cut == 0:
+            rest = buf
+            continue
+        rest = buf[cut:]
+        yield from SAIF_RE.finditer(buf, 0, cut)
+    if rest:
+        yield from SAIF_RE.finditer(rest)
+
+def parse_saif(saif, ports=False, chunk_size=CHUNK_SIZE):
+    """Returns the Activity of the nets (& <ports>) of every instance of <saif>"""
+
+    blocks = ('NET', 'PORT') if ports else ('NET',)
+    insts  = {}
+    stack  = []
+    path   = ''
+    acc    = None
+    depth  = 0
+    block  = -1
+    duration, timescale = 0, 1e-9
+
+    with read_lines(saif) as f:
+        for m in tokens(f, chunk_size):
+            g = m.lastgroup
+            if g == 'net':
+                if block == depth:
+                    # acc: [NETS, TC, T0, T1, TX, IG]
+                    t0, t1, tx, tc, ig = m.group('t0', 't1', 'tx', 'tc', 'ig')
+                    acc[0] += 1
+                    acc[1] += int(tc)
+                    acc[2] += int(t0)
+                    acc[3] += int(t1)
+                    acc[4] += int(tx)
+                    if ig:
+                        acc[5] += int(ig)
+            elif g == 'tog':
+                if block >= 0:
+                    acc[TOGGLES[m.group('tk')]] += int(m.group('tog'))
+            elif g == 'open':
+                depth += 1
+                if block >= 0:
+                    if depth == block + 1:
+                        acc[NETS] += 1
+                elif acc is not None and m.group('open') in blocks:
+                    block = depth
+            elif g == 'close':
+                if depth == block:
+                    block = -1
+                elif stack and depth == stack[-1][0]:
+                    stack.pop()
+                    path, acc = (stack[-1][1], insts[stack[-1][1]]) if stack else ('', None)
+                depth -= 1
+            elif g == 'inst':
+                depth += 1
+                path = path + '/' + m.group('inst') if path else m.group('inst')
+                acc  = insts.setdefault(path, [0] * len(FIELDS))
+                stack.append((depth, path))
+            elif g == 'dur':
+                duration = float(m.group('dur'))
+            elif g == 'ts':
+                timescale = int(m.group('tsv')) * TIME_UNITS[m.group('ts')]
+
+    if depth != 0:
+        raise ValueError("parse_saif:: unbalanced parentheses in {}".format(saif))
+    return Activity({p: np.array(v, dtype=np.int64) for p, v in insts.items()}, duration, timescale)
+
+#-----------------------------------------------------------------------------
+# TABLE
+#-----------------------------------------------------------------------------
+HEADER = ['MODULE'] + FIELDS + ['TC-NET', 'TC-SHARE']
+
+def write_activity(act, csv, dut=DUT, verbose=True):
+    """Write the per module activity of <act> (children of <dut>) into <csv>
+
+    TC-NET is the mean number of toggles per net, TC-SHARE the share (%) of
+    all toggles of <dut>."""
+
+    mods  = act.modules(dut)
+    total = max(sum(v[TOGGLES['TC']] for v in mods.values()), 1)
+
+    lines = [','.join(HEADER)]
+    for name in sorted(mods, key=lambda n: (n != '.', n)):
+        v = mods[name]
+        lines.append('{},{},{:.4e},{:.4e}'.format(
+            name, ','.join(str(x) for x in v),
+            v[TOGGLES['TC']] / max(v[NETS], 1), 100 * v[TOGGLES['TC']] / total))
+    write_csv(csv, lines, verbose)
+    return csv
@@ -0,0 +1,99 @@
+#-----------------------------------------------------------------------------
+# Project : KeyV
+# File    : scan.py
+# Author  : Mickael Fiorentino <mickael.fiorentino@polymtl.ca>
+# Lab     : GRM - Polytechnique Montreal
+# Date    : <2026-10-17 Sat>
+# Brief   : Line scanner built on one alternation of named patterns
+#-----------------------------------------------------------------------------
+# Each pattern has exactly one capturing group (the value). Patterns are
+# wrapped into named groups and joined into a single compiled alternation:
+# the name of the outer group that matched identifies the pattern, and the
+# value is the group right after it.
+#-----------------------------------------------------------------------------
+import os
+import re
+
+#-----------------------------------------------------------------------------
+# Regular expressions shared with data_parse.tcl
+#-----------------------------------------------------------------------------
+
+# DC values (area & power): requires 2 digits after the decimal point
+VAL_RE = r'[0-9]+\.[0-9]+e?-?[0-9]+\s+'
+
+# Timing report table values
+STA_VAL_RE = r'-?[0-9]+\.?[0-9]*e?-?[0-9]*'
+
+#-----------------------------------------------------------------------------
+# SCANNER
+#-----------------------------------------------------------------------------
+class Scanner:
+    """Single compiled alternation of (key, pattern) pairs"""
+
+    def __init__(self, patterns):
+
+        self.keys = [k for k, _ in patterns]
+        alts = []
+        for i, (k, p) in enumerate(patterns):
+            if re.compile(p).groups != 1:
+                raise ValueError("Scanner:: pattern {} must have one group ({})".format(k, p))
+            alts.append('(?P<_{}>{})'.format(i, p))
+        self.re = re.compile('|'.join(alts))
+
+    def finditer(self, line):
+        """Yields (key, value) for every pattern matched in <line>"""
+
+        for m in self.re.finditer(line):
+            i = m.lastindex
+            yield self.keys[int(m.lastgroup[1:])], m.group(i + 1)
+
+    def first(self, lines):
+        """Returns {key: value} of the first match of every pattern in <lines>
+
+        Like the whole-file regexps of data_parse.tcl, matches may span lines
+        (DC wraps long instance names without -nosplit): the unmatched end of
+        a line, or a match that reaches it, is carried over to the next one.
+        Stops reading as soon as all the patterns are found."""
+
+        found   = {}
+        pending = ''
+        for line in lines:
+            text, pending = pending + line, line
+            for m in self.re.finditer(text):
+                # May go on with the next line: decided once it is read
+                if m.end() == len(text):
+                    pending = text[m.start():]
+                    break
+                k = self.keys[int(m.lastgroup[1:])]
+                if k not in found:
+                    found[k] = m.group(m.lastindex + 1)
+                if m.end() > len(text) - len(line):
+                    pending = text[m.end():]
+            if len(found) == len(self.keys):
+                return found
+
+        for k, v in self.finditer(pending):
+            if k not in found:
+                found[k] = v
+        return found
+
+#-----------------------------------------------------------------------------
+# FILES
+#-----------------------------------------------------------------------------
+def read_lines(fname):
+    """Open <fname> for line by line streaming (newlines are kept)"""
+
+    if not os.path.isfile(fname):
+        raise FileNotFoundError("file {} does not exist".format(fname))
+    return open(fname, errors='replace')
+
+def write_csv(csv_f, lines, verbose=True):
+    """Create <csv_f> (and its directory), write <lines> in a single write"""
+
+    csv_d = os.path.dirname(csv_f)
+    if csv_d:
+        os.makedirs(csv_d, exist_ok=True)
+    with open(csv_f, 'w') as f:
+        f.write(''.join(l + '\n' for l in lines))
+    if verbose:
+        print(csv_f)
@@ -0,0 +1,73 @@
+#-----------------------------------------------------------------------------
+# Project : KeyV
+# File    : sta.py
+# Author  : Mickael Fiorentino <mickael.fiorentino@polymtl.ca>
+# Lab     : GRM - Polytechnique Montreal
+# Date    : <2026-10-17 Sat>
+# Brief   : Parse KeyV timing reports and produce csv summaries
+#-----------------------------------------------------------------------------
+# Only the summary table of the report is used:
+#   | <launch clock> | <capture clock> | <delay> | <slack> | <period> |
+# Clock names are C_<keyring>_<e><s>_<setup|hold>_<dir>_<launch|capture>.
+#-----------------------------------------------------------------------------
+import re
+from ..keyring import KeyRing
+from .scan import STA_VAL_RE, read_lines, write_csv
+
+STAGES = ['F', 'D', 'R', 'E', 'M', 'W']
+
+CLK_RE = r'C_main_[0-9][0-9]_\w+_\w+'
+STA_RE = re.compile(r'\|\s+({0})\s+\|\s+({0})\s+\|\s+({1})\s+\|\s+({1})\s+'.format(CLK_RE, STA_VAL_RE))
+DIR_RE = re.compile(r'_right_|_left_|_up_|_down_')
+
+def click_index(click):
+    """Returns the (e, s) indexes of <click> (C_main_<e><s>)"""
+
+    es = click.split('_')[-1]
+    return int(es[0]), int(es[1])
+
+def click_to_stage(click):
+    """Returns a formatted version of XU stages: F0 instead of C_main_00"""
+
+    e, s = click_index(click)
+    return '{}{}'.format(STAGES[s], e)
+
+def parse_sta(rpt, csv, keyring, verbose=True):
+    """Parse timing report <rpt> into <csv> for KeyRing <keyring> (E, S, D)"""
+
+    kr    = KeyRing(*keyring)
+    csv_d = {}
+
+    with read_lines(rpt) as f:
+        for line in f:
+            if '|' not in line:
+                continue
+            m = STA_RE.search(line)
+            if m is None:
+                continue
+            launch, capture, delay, slack = m.groups()
+
+            dl = DIR_RE.search(launch)
+            dc = DIR_RE.search(capture)
+            if dl is None or dc is None or dl.group() != dc.group():
+                continue
+
+            click = re.search(r'C_main_[0-9][0-9]', capture).group()
+            if dl.group() in ('_left_', '_down_'):
+                parent = kr.get_parent(click, 'left')
+            else:
+                parent = kr.get_parent(click, 'up')
+
+            entry = csv_d.setdefault(click_to_stage(click), {}).setdefault(click_to_stage(parent), {})
+            if 'setup' in launch:
+                entry['setup'] = (float(delay), float(slack))
+            if 'hold' in launch:
+                entry['hold'] = (float(delay), float(slack))
+
+    rows = ['LAUNCH,CAPTURE,SETUP DELAY,SETUP SLACK,HOLD DELAY,HOLD SLACK']
+    for capture, c in csv_d.items():
+        for launch, l in c.items():
+            if 'setup' not in l or 'hold' not in l:
+                raise ValueError("parse_sta:: incomplete timing for {} -> {} in {}".format(launch, capture, rpt))
+            rows.append('{},{},{:.2f},{:.2f},{:.2f},{:.2f}'.format(launch, capture, *(l['setup'] + l['hold'])))
+    write_csv(csv, rows, verbose)
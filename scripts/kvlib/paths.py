@@ -0,0 +1,196 @@
+#-----------------------------------------------------------------------------
+# Project : KeyV
+# File    : paths.py
+# Author  : Mickael Fiorentino <mickael.fiorentino@polymtl.ca>
+# Lab     : GRM - Polytechnique Montreal
+# Date    : <2026-10-17 Sat>
+# Brief   : Index of the timing paths of a KeyRing, by capture click
+#-----------------------------------------------------------------------------
+# Every path of <core>.timing.rpt (see parse/paths.py) is a row of compact
+# columns: start & end name ids, capture click (e, s), kind (setup or hold),
+# direction, arrival time & slack (float32). The launching click is derived
+# from the KeyRing: the left parent of the capture click launches its left &
+# down paths, the up parent its up & right paths (as in data_parse.tcl).
+#
+# Rows are sorted by capture click c = e*S + s (paths without a click last),
+# and offsets[c]:offsets[c+1] are the rows of click c: the paths of a click
+# are a slice, and per-click reductions (worst slack, histograms) are single
+# reduceat/bincount calls over all the paths.
+#
+# Indexes are cached in <dir>/.cache/<report>.paths.npz, next to the report,
+# valid as long as the report mtime & size are unchanged (see table.py).
+#-----------------------------------------------------------------------------
+import os
+import zipfile
+import numpy as np
+from . import table
+from .parse.paths import scan_paths, COLUMNS, DIRECTIONS, KINDS
+from .parse.sta import STAGES
+from .keyring import KeyRing, LEFT, UP
+
+SETUP, HOLD = 0, 1
+
+#-----------------------------------------------------------------------------
+# INDEX
+#-----------------------------------------------------------------------------
+class PathIndex:
+    """Timing paths of an E x S KeyRing, indexed by capture click"""
+
+    def __init__(self, cols, names, keyring=None):
+
+        ce, cs = cols['capture_e'].astype(int), cols['capture_s'].astype(int)
+        if keyring is not None:
+            self.E, self.S = keyring[0], keyring[1]
+        else:
+            self.E, self.S = int(ce.max()) + 1, int(cs.max()) + 1
+        if self.E <= 0 or self.S <= 0:
+            raise ValueError("PathIndex:: no path is captured by a KeyRing click")
+
+        # Paths without a capture click (or out of the KeyRing) are kept at the end
+        valid = (ce >= 0) & (ce < self.E) & (cs >= 0) & (cs < self.S)
+        click = np.where(valid, ce * self.S + cs, self.E * self.S)
+        order = np.argsort(click, kind='stable')
+
+        self.cols    = {c: cols[c][order] for c in COLUMNS}
+        self.names   = names
+        self.click   = click[order]
+        self.offsets = np.searchsorted(self.click, np.arange(self.E * self.S + 1))
+
+        # Parents of the clicks (D x E = S: D is known from E & S without a configuration)
+        if keyring is None and self.S % self.E == 0:
+            keyring = (self.E, self.S, self.S // self.E)
+        self.parents = KeyRing(*keyring).parents if keyring is not None else None
+
+    def __len__(self):
+        return len(self.click)
+
+    def __getitem__(self, name):
+        try:
+            return self.cols[name]
+        except KeyError:
+            raise KeyError("PathIndex:: column {} not found".format(name)) from None
+
+    @property
+    def labels(self):
+        """Click labels, as a (eu x stage) array"""
+
+        stages = STAGES if self.S == len(STAGES) else ['S{}'.format(s) for s in range(self.S)]
+        return np.array([['{}{}'.format(s, e) for s in stages] for e in range(self.E)])
+
+    def rows(self, e, s):
+        """Returns the slice of the paths captured by click (e, s)"""
+
+        c = e * self.S + s
+        return slice(self.offsets[c], self.offsets[c + 1])
+
+    def name(self, i):
+        """Returns the (start, end) names of path <i>"""
+
+        return self.names[self.cols['start'][i]].decode(), self.names[self.cols['end'][i]].decode()
+
+    def _slack(self, kind):
+        """Slack of the clicked paths of <kind> (setup, hold, None: both), +inf for others"""
+
+        slack = self.cols['slack'][:self.offsets[-1]].astype(float)
+        if kind is not None:
+            slack = np.where(self.cols['kind'][:self.offsets[-1]] == kind, slack, np.inf)
+        return np.where(np.isnan(slack), np.inf, slack)
+
+    def worst(self, kind=None):
+        """Returns the (eu x stage) worst slack of <kind> paths (NaN for clicks without any)"""
+
+        slack = self._slack(kind)
+        worst = np.full(self.E * self.S, np.inf)
+        full  = self.offsets[:-1] < self.offsets[1:]
+        if full.any():
+            worst[full] = np.minimum.reduceat(slack, self.offsets[:-1][full])
+        worst[np.isinf(worst)] = np.nan
+        return worst.reshape(self.E, self.S)
+
+    def histogram(self, bins=50, kind=None, range=None):
+        """Returns the (eu x stage x bin) slack histograms of <kind> paths & the bin edges"""
+
+        slack = self._slack(kind)
+        ok    = np.isfinite(slack)
+        edges = np.histogram_bin_edges(slack[ok], bins, range)
+        b     = np.clip(np.searchsorted(edges, slack[ok], side='right') - 1, 0, len(edges) - 2)
+        inb   = (slack[ok] >= edges[0]) & (slack[ok] <= edges[-1])
+        nb    = len(edges) - 1
+        count = np.bincount(self.click[:self.offsets[-1]][ok][inb] * nb + b[inb], minlength=self.E * self.S * nb)
+        return count.reshape(self.E, self.S, nb), edges
+
+    def critical(self, n=10, kind=None, e=None, s=None):
+        """Returns the indexes of the <n> paths of least slack (of click (e, s) only if given)"""
+
+        rows  = self.rows(e, s) if e is not None else slice(0, self.offsets[-1])
+        slack = self._slack(kind)[rows]
+        n     = min(n, int(np.isfinite(slack).sum()))
+        best  = np.argpartition(slack, n - 1)[:n] if n > 0 else np.array([], dtype=int)
+        return rows.start + best[np.argsort(slack[best], kind='stable')]
+
+    def launch(self, i):
+        """Returns the click number(s) launching path(s) <i> (-1 if unknown)"""
+
+        click = self.click[i]
+        dr    = self.cols['dir'][i]
+        if self.parents is None:
+            return np.full(np.shape(click), -1)
+
+        # Left/down paths from the left parent, up/right paths from the up parent
+        ok  = (click < self.E * self.S) & (dr >= 0)
+        par = np.where((dr == DIRECTIONS.index('up')) | (dr == DIRECTIONS.index('right')), UP, LEFT)
+        return np.where(ok, self.parents[np.minimum(click, self.E * self.S - 1), par], -1)
+
+    def describe(self, i):
+        """Returns path <i> as a dict (names, clicks, kind, direction, arrival & slack)"""
+
+        c = self.cols
+        start, end = self.name(i)
+        launch     = int(self.launch(i))
+        return {'start': start, 'end': end,
+                'launch': _label(self, *divmod(launch, self.S)) if launch >= 0 else '-',
+                'capture': _label(self, c['capture_e'][i], c['capture_s'][i]),
+                'kind': KINDS[c['kind'][i]] if c['kind'][i] >= 0 else '-',
+                'dir': DIRECTIONS[c['dir'][i]] if c['dir'][i] >= 0 else '-',
+                'arrival': float(c['arrival'][i]), 'slack': float(c['slack'][i])}
+
+def _label(index, e, s):
+    return index.labels[e, s] if 0 <= e < index.E and 0 <= s < index.S else '-'
+
+#-----------------------------------------------------------------------------
+# CACHE
+#-----------------------------------------------------------------------------
+def cache_path(rpt):
+    """Returns the index cache file associated with report <rpt>"""
+
+    rpt_d, rpt_n = os.path.split(os.path.abspath(rpt))
+    return os.path.join(rpt_d, table.CACHE_DIR, rpt_n + '.paths.npz')
+
+def _stamp(rpt):
+    st = os.stat(rpt)
+    return np.array([st.st_mtime_ns, st.st_size], dtype=np.int64)
+
+def _cache_read(cache_f, stamp):
+
+    try:
+        with np.load(cache_f) as npz:
+            if not np.array_equal(npz['stamp'], stamp):
+                return None
+            return {c: npz[c] for c in COLUMNS}, npz['names']
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+        return None
+
+def _cache_write(cache_f, stamp, cols, names):
+    table.cache_write(cache_f, lambda f: np.savez(f, stamp=stamp, names=names, **cols))
+
+def load_paths(rpt, keyring=None, cache=True):
+    """Load the paths of timing report <rpt> into a PathIndex, using the cache if it is up-to-date"""
+
+    stamp   = _stamp(rpt)
+    cache_f = cache_path(rpt)
+    entry   = _cache_read(cache_f, stamp) if cache else None
+    if entry is None:
+        entry = scan_paths(rpt)
+        if cache:
+            _cache_write(cache_f, stamp, *entry)
+    return PathIndex(*entry, keyring)
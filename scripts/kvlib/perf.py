@@ -0,0 +1,227 @@
+#-----------------------------------------------------------------------------
+# Project : KeyV
+# File    : perf.py
+# Author  : Mickael Fiorentino <mickael.fiorentino@polymtl.ca>
+# Lab     : GRM - Polytechnique Montreal
+# Date    : <2026-10-17 Sat>
+# Brief   : Stage timing instrumentation: wall & CPU time, peak memory
+#-----------------------------------------------------------------------------
+# Code is split into named stages with a context manager or a decorator:
+#
+#   with perf.stage('load'):          @perf.staged('save')
+#       tab = load_table(...)         def SaveFig(figname): ...
+#
+# Stages are no-ops until a Profiler is enabled (perf.enable). Then, each
+# stage records its wall time (perf_counter), CPU time (process) and peak
+# memory above the memory at its start (tracemalloc, optional as it slows
+# the code down), under the current figure (perf.figure). Start times are
+# epoch based, so that the events of several processes can be ordered. Stages may be nested and entered
+# several times per figure: the trace keeps every event, the summary adds
+# them up per (figure, stage).
+#
+# Figures rendered by worker processes are profiled by the workers (see
+# run_job) and their events merged into the Profiler of the main process.
+#-----------------------------------------------------------------------------
+import os
+import sys
+import json
+import time
+import pstats
+import cProfile
+import tracemalloc
+import contextlib
+import functools
+
+PIPELINE = '-'
+
+_active = None
+_null   = contextlib.nullcontext()
+
+class Profiler:
+    """Wall, CPU time & peak memory of named stages, per figure"""
+
+    def __init__(self, memory=True):
+
+        self.memory  = memory
+        self.events  = []
+        self.current = PIPELINE
+        self.origin  = time.time()
+        self._stack  = []
+
+    def start(self):
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def stop(self):
+        if self.memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    @contextlib.contextmanager
+    def stage(self, name, figure=None):
+        """Record stage <name> of the current figure (or <figure>)"""
+
+        figure = figure or self.current
+        if self.memory:
+            cur, peak = tracemalloc.get_traced_memory()
+            if self._stack:
+                self._stack[-1][1] = max(self._stack[-1][1], peak)
+            tracemalloc.reset_peak()
+        else:
+            cur = 0
+
+        # [start memory, peak memory seen by nested stages]
+        entry = [cur, cur]
+        self._stack.append(entry)
+        t0, w0, c0 = time.time(), time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            wall, cpu = time.perf_counter() - w0, time.process_time() - c0
+            self._stack.pop()
+            peak = max(entry[1], tracemalloc.get_traced_memory()[1]) if self.memory else 0
+            if self._stack:
+                self._stack[-1][1] = max(self._stack[-1][1], peak)
+            self.events.append({'figure': figure, 'stage': name, 'pid': os.getpid(),
+                                'start': t0 - self.origin, 'wall': wall, 'cpu': cpu,
+                                'peak': peak - entry[0], 'depth': len(self._stack)})
+
+    @contextlib.contextmanager
+    def figure(self, name):
+        """Record the stages of figure <name> (and the figure as a whole)"""
+
+        prev, self.current = self.current, name
+        try:
+            with self.stage('total'):
+                yield
+        finally:
+            self.current = prev
+
+    def merge(self, events, origin):
+        """Add the <events> of another Profiler (started at <origin>)"""
+
+        for e in events:
+            self.events.append(dict(e, start=e['start'] + origin - self.origin))
+
+    def summary(self):
+        """Returns {figure: {stage: {calls, wall, cpu, peak}}}: times are summed, peaks maxed"""
+
+        out = {}
+        for e in self.events:
+            s = out.setdefault(e['figure'], {}).setdefault(e['stage'], {'calls': 0, 'wall': 0, 'cpu': 0, 'peak': 0})
+            s['calls'] += 1
+            s['wall']  += e['wall']
+            s['cpu']   += e['cpu']
+            s['peak']   = max(s['peak'], e['peak'])
+        return out
+
+    def write(self, json_f, **info):
+        """Write the trace (summary & events) in <json_f>, with extra <info>"""
+
+        trace = dict(info, created=time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self.origin)),
+                     argv=sys.argv, memory=self.memory, summary=self.summary(),
+                     events=sorted(self.events, key=lambda e: e['start']))
+        with open(json_f, 'w') as f:
+            json.dump(trace, f, indent=1)
+
+    def report(self):
+        """Returns the summary as text lines (ms & MB)"""
+
+        lines = ['{:<18s} {:<10s} {:>6s} {:>10s} {:>10s} {:>9s}'.format(
+            'FIGURE', 'STAGE', 'CALLS', 'WALL (ms)', 'CPU (ms)', 'PEAK (MB)')]
+        for fig, stages in self.summary().items():
+            for name, s in stages.items():
+                lines.append('{:<18s} {:<10s} {:6d} {:10.1f} {:10.1f} {:>9s}'.format(
+                    fig, name, s['calls'], 1e3 * s['wall'], 1e3 * s['cpu'],
+                    '{:.2f}'.format(s['peak'] / 2**20) if self.memory else '-'))
+        return lines
+
+#-----------------------------------------------------------------------------
+# INSTRUMENTATION
+#-----------------------------------------------------------------------------
+def enable(memory=True):
+    """Enable profiling in this process, returns the Profiler"""
+
+    global _active
+    _active = Profiler(memory)
+    _active.start()
+    return _active
+
+def disable():
+    """Disable profiling in this process, returns the Profiler (if any)"""
+
+    global _active
+    prof, _active = _active, None
+    if prof is not None:
+        prof.stop()
+    return prof
+
+def active():
+    """Returns the Profiler of this process, None if profiling is disabled"""
+
+    return _active
+
+def stage(name):
+    """Context manager of stage <name> (no-op unless profiling)"""
+
+    return _active.stage(name) if _active is not None else _null
+
+def figure(name):
+    """Context manager of figure <name> (no-op unless profiling)"""
+
+    return _active.figure(name) if _active is not None else _null
+
+def staged(name):
+    """Decorator: every call of the function is stage <name>"""
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _active is None:
+                return func(*args, **kwargs)
+            with _active.stage(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+#-----------------------------------------------------------------------------
+# JOBS
+#-----------------------------------------------------------------------------
+def run_job(name, func, args, memory=True, cprof_f=None):
+    """Run figure <name> (func(*args)) under a new Profiler
+
+    Returns the result of func & (events, origin) to be merged into the
+    caller's Profiler. With <cprof_f>, the cProfile stats of the job are
+    dumped in <cprof_f>."""
+
+    prev = _active
+    prof = enable(memory)
+    cpr  = cProfile.Profile() if cprof_f else None
+    try:
+        if cpr:
+            cpr.enable()
+        with prof.figure(name):
+            res = func(*args)
+    finally:
+        if cpr:
+            cpr.disable()
+            cpr.dump_stats(cprof_f)
+        disable()
+        _restore(prev)
+    return res, (prof.events, prof.origin)
+
+def _restore(prof):
+    global _active
+    _active = prof
+    if prof is not None:
+        prof.start()
+
+def merge_cprofile(out_f, files):
+    """Merge the cProfile dumps <files> into <out_f> & remove them"""
+
+    files = [f for f in files if os.path.exists(f)]
+    if not files:
+        return
+    stats = pstats.Stats(*files)
+    stats.dump_stats(out_f)
+    for f in files:
+        os.remove(f)
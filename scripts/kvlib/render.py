@@ -0,0 +1,97 @@
+#-----------------------------------------------------------------------------
+# Project : KeyV
+# File    : render.py
+# Author  : Mickael Fiorentino <mickael.fiorentino@polymtl.ca>
+# Lab     : GRM - Polytechnique Montreal
+# Date    : <2026-10-17 Sat>
+# Brief   : Headless rendering of independent figure jobs in a process pool
+#-----------------------------------------------------------------------------
+# A job is a (name, func, args) tuple where <func> is a module-level function
+# (picklable) that builds and saves a single figure. Jobs do not share any
+# matplotlib state, so they can be distributed over worker processes. Workers
+# always use the non-interactive Agg backend.
+#
+# With a Profiler (see perf.py), each job is profiled where it runs & the
+# events of the workers are merged into it. cProfile stats are collected
+# whenever a dump file is given, with or without a Profiler.
+#
+# pool_map is the process pool of the other parallel tasks of kvlib
+# (parsing, sweeps, STA statistics, memory images): the same number of
+# workers, no pool at all for a single one.
+#-----------------------------------------------------------------------------
+import os
+import collections
+from . import perf
+
+Job = collections.namedtuple('Job', ['name', 'func', 'args'])
+
+def workers(n_jobs, n):
+    """Returns the number of processes for <n> tasks on <n_jobs> processes (0: one per cpu)"""
+
+    if n_jobs <= 0:
+        n_jobs = os.cpu_count() or 1
+    return max(1, min(n_jobs, n))
+
+def pool_map(func, items, n_jobs=0, chunksize=1, initializer=None):
+    """Yields func(item) for each of <items>, in order, on <n_jobs> processes (0: one per cpu)
+
+    Results are yielded as they come: pending tasks are cancelled if the
+    caller stops iterating."""
+
+    items  = list(items)
+    n_jobs = workers(n_jobs, len(items))
+    if n_jobs == 1:
+        yield from map(func, items)
+        return
+
+    # Imported here: serial callers do not pay for multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    pool = ProcessPoolExecutor(max_workers=n_jobs, initializer=initializer)
+    try:
+        yield from pool.map(func, items, chunksize=chunksize)
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+def use_agg():
+    """Force the non-interactive Agg backend (must run before pyplot import)"""
+
+    import matplotlib
+    matplotlib.use('Agg', force=True)
+
+def _run(job, memory=None, cprof_f=None):
+    if memory is None and not cprof_f:
+        return job.func(*job.args), None
+    return perf.run_job(job.name, job.func, job.args, bool(memory), cprof_f)
+
+def render(jobs, n_jobs=1, prof=None, cprof_f=None):
+    """Run figure <jobs> on <n_jobs> processes (0: one per cpu), in order
+
+    Jobs are profiled into Profiler <prof> if given, and their cProfile
+    stats merged into <cprof_f> if given. Returns the job results, in order."""
+
+    jobs   = [j if isinstance(j, Job) else Job(*j) for j in jobs]
+    n_jobs = workers(n_jobs, len(jobs))
+    memory = prof.memory if prof is not None else None
+    dumps  = ['{}.{}'.format(cprof_f, j.name) if cprof_f else None for j in jobs]
+
+    # Serial mode: no pool overhead
+    if n_jobs <= 1:
+        results = [_run(j, memory, d) for j, d in zip(jobs, dumps)]
+    else:
+        # Imported here: serial callers do not pay for multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=n_jobs, initializer=use_agg) as pool:
+            futures = [(j, pool.submit(_run, j, memory, d)) for j, d in zip(jobs, dumps)]
+            results = []
+            for j, f in futures:
+                try:
+                    results.append(f.result())
+                except Exception as err:
+                    raise RuntimeError("render:: job {} failed ({})".format(j.name, err)) from err
+
+    if prof is not None:
+        for _, (events, origin) in results:
+            prof.merge(events, origin)
+    if cprof_f:
+        perf.merge_cprofile(cprof_f, dumps)
+    return [res for res, _ in results]
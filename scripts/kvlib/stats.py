@@ -0,0 +1,302 @@
+#-----------------------------------------------------------------------------
+# Project : KeyV
+# File    : stats.py
+# Author  : Mickael Fiorentino <mickael.fiorentino@polymtl.ca>
+# Lab     : GRM - Polytechnique Montreal
+# Date    : <2026-10-17 Sat>
+# Brief   : Streaming statistics of STA csvs across corners & Monte-Carlo runs
+#-----------------------------------------------------------------------------
+# Any number of timing csvs (<core>.timing.csv, sta_summary.csv) are folded,
+# one file at a time, into per (stage, direction) statistics of the captured
+# clicks. The two layouts are told apart by their rows:
+#   - <core>.timing.csv (parse_sta): one row per (launch, capture) pair,
+#     holding the setup & hold timing of both directions of the launch
+#     click: the parent in the same EU launches the left (setup) & down
+#     (hold) paths, the parent in the previous EU the up (setup) & right
+#     (hold) paths,
+#   - sta_summary.csv: groups of 4 rows per captured click, one per
+#     direction (pairs are repeated), read as timing.StaSummary does.
+# As in timing.py, setup timing is kept for left/up paths, hold timing for
+# right/down ones, and unconstrained paths (no delay) are left out.
+#
+# Each (stage, direction) holds:
+#   - the count, mean & variance (M2) of the arrival time & slack, updated
+#     per file with the parallel form of Welford's algorithm (Chan et al.),
+#   - the exact min & max slack,
+#   - a log-bucket quantile sketch of the slack (DDSketch): the quantiles
+#     are within ALPHA (relative) of the exact ones, whatever the number of
+#     files, in constant memory.
+# All of them merge exactly: files can be folded by several workers, whose
+# statistics are merged at the end (see fold_files).
+#-----------------------------------------------------------------------------
+import functools
+import numpy as np
+from . import table
+from . import render
+from .parse.scan import write_csv
+from .parse.sta import STAGES
+from .timing import DIRECTIONS, SETUP, StaSummary, parse_labels
+
+QUANTILES = [1, 50, 99]
+
+#-----------------------------------------------------------------------------
+# MOMENTS
+#-----------------------------------------------------------------------------
+class Moments:
+    """Count, mean & variance of <n> keys, updated by batches"""
+
+    def __init__(self, n):
+        self.count = np.zeros(n, dtype=np.int64)
+        self.mean  = np.zeros(n)
+        self.m2    = np.zeros(n)
+
+    def _merge(self, count, mean, m2):
+        n     = self.count + count
+        delta = mean - self.mean
+        with np.errstate(invalid='ignore', divide='ignore'):
+            w = np.where(n > 0, count / n, 0)
+        self.mean  = self.mean + delta * w
+        self.m2    = self.m2 + m2 + delta ** 2 * self.count * w
+        self.count = n
+
+    def add(self, key, x):
+        """Add the values <x> of keys <key> (int arrays)"""
+
+        n     = len(self.count)
+        count = np.bincount(key, minlength=n)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.where(count > 0, np.bincount(key, x, n) / count, 0)
+        m2 = np.bincount(key, (x - mean[key]) ** 2, n)
+        self._merge(count, mean, m2)
+
+    def merge(self, other):
+        """Merge the moments of <other> (same keys)"""
+
+        self._merge(other.count, other.mean, other.m2)
+
+    def var(self):
+        """Returns the (population) variance of each key, NaN for keys without values"""
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(self.count > 0, self.m2 / self.count, np.nan)
+
+    def std(self):
+        return np.sqrt(self.var())
+
+#-----------------------------------------------------------------------------
+# QUANTILE SKETCH
+#-----------------------------------------------------------------------------
+class Sketch:
+    """Mergeable quantile sketch of <n> keys (log buckets of relative width <alpha>)
+
+    Bucket i > 0 of each sign holds the values of magnitude in
+    ]min_value.g^(i-1), min_value.g^i], g = (1 + alpha) / (1 - alpha).
+    Magnitudes below <min_value> are 0, above <max_value> are clipped."""
+
+    def __init__(self, n, alpha=0.005, min_value=1e-4, max_value=1e4):
+
+        self.alpha     = alpha
+        self.min_value = min_value
+        self.gamma     = (1 + alpha) / (1 - alpha)
+        self.B         = int(np.ceil(np.log(max_value / min_value) / np.log(self.gamma))) + 1
+
+        # Negative buckets (reversed), 0, positive buckets: the order of the values
+        self.counts = np.zeros((n, 2 * self.B + 1), dtype=np.int64)
+
+    def _bucket(self, x):
+        mag = np.abs(x)
+        with np.errstate(divide='ignore'):
+            b = np.ceil(np.log(np.maximum(mag, self.min_value) / self.min_value) / np.log(self.gamma))
+        b = np.clip(b, 1, self.B).astype(np.int64)
+        return np.where(mag < self.min_value, self.B, np.where(x > 0, self.B + b, self.B - b))
+
+    def _value(self, pos):
+        b   = np.abs(pos - self.B)
+        val = self.min_value * 2 * self.gamma ** b / (self.gamma + 1)
+        return np.where(pos == self.B, 0.0, np.sign(pos - self.B) * val)
+
+    def add(self, key, x):
+        """Add the values <x> of keys <key> (int arrays)"""
+
+        n, w = self.counts.shape
+        self.counts += np.bincount(key * w + self._bucket(x), minlength=n * w).reshape(n, w)
+
+    def merge(self, other):
+        """Merge the counts of <other> (same keys & buckets)"""
+
+        if (self.alpha, self.min_value, self.B) != (other.alpha, other.min_value, other.B):
+            raise ValueError("Sketch:: cannot merge sketches of different buckets")
+        self.counts += other.counts
+
+    def quantile(self, q):
+        """Returns the (q x key) quantiles <q> (0..1), NaN for keys without values"""
+
+        q     = np.atleast_1d(np.asarray(q, dtype=float))
+        cum   = np.cumsum(self.counts, axis=1)
+        total = cum[:, -1]
+        rank  = np.floor(q[:, None] * np.maximum(total - 1, 0))
+        pos   = (cum[None] > rank[..., None]).argmax(axis=-1)
+        return np.where(total > 0, self._value(pos), np.nan)
+
+#-----------------------------------------------------------------------------
+# STA STATISTICS
+#-----------------------------------------------------------------------------
+def is_summary(tab):
+    """Returns True if timing Table <tab> has the sta_summary.csv layout (repeated pairs)"""
+
+    pairs = np.stack([tab['LAUNCH'], tab['CAPTURE']], axis=1)
+    return len(np.unique(pairs, axis=0)) < len(pairs)
+
+class StaStats:
+    """Streaming (stage x direction) statistics of the arrival time & slack of timing csvs"""
+
+    def __init__(self, stages=STAGES, alpha=0.005):
+
+        self.stages  = list(stages)
+        self.files   = 0
+        n            = len(self.stages) * len(DIRECTIONS)
+        self.arrival = Moments(n)
+        self.slack   = Moments(n)
+        self.min     = np.full(n, np.inf)
+        self.max     = np.full(n, -np.inf)
+        self.sketch  = Sketch(n, alpha)
+
+    def _stage(self, names):
+        """Returns the index in self.stages of stage <names>"""
+
+        unknown = set(names) - set(self.stages)
+        if unknown:
+            raise ValueError("StaStats:: unknown stages {}".format(', '.join(sorted(unknown))))
+        return np.array([self.stages.index(s) for s in names])
+
+    def _add(self, key, arrival, slack):
+        self.arrival.add(key, arrival)
+        self.slack.add(key, slack)
+        np.minimum.at(self.min, key, slack)
+        np.maximum.at(self.max, key, slack)
+        self.sketch.add(key, slack)
+
+    def add(self, tab):
+        """Fold the rows of timing Table <tab> (LAUNCH, CAPTURE, SETUP/HOLD DELAY & SLACK)"""
+
+        if len(tab) == 0:
+            return
+        D = len(DIRECTIONS)
+
+        # Summary layout: the direction is the position of the row in its group
+        if is_summary(tab):
+            sta   = StaSummary(tab, stages=self.stages)
+            stage = self._stage(sta.stages)
+            key   = (stage[:, None] * D + np.arange(D))[None, :, :, None]
+            key   = np.broadcast_to(key, sta.valid.shape)[sta.valid]
+            self._add(key, sta.arrival[sta.valid], sta.slack[sta.valid])
+            self.files += 1
+            return
+
+        ce, cs, names = parse_labels(tab['CAPTURE'], self.stages)
+        le, _, _      = parse_labels(tab['LAUNCH'], self.stages)
+        stage = self._stage(names)[cs]
+
+        # Same EU parent: left (setup) & down (hold), previous EU parent: up (setup) & right (hold)
+        same  = le == ce
+        setup = np.where(same, 0, 1)
+        hold  = np.where(same, 3, 2)
+        key   = np.concatenate([stage * D + setup, stage * D + hold])
+        delay = np.concatenate([tab['SETUP DELAY'], tab['HOLD DELAY']])
+        slack = np.concatenate([tab['SETUP SLACK'], tab['HOLD SLACK']])
+
+        ok = delay > 0
+        self._add(key[ok], delay[ok] - slack[ok], slack[ok])
+        self.files += 1
+
+    def fold(self, csv_f, cache=True):
+        """Fold timing csv <csv_f>"""
+
+        self.add(table.load_table(csv_f, labels=['LAUNCH', 'CAPTURE'], cache=cache))
+
+    def merge(self, other):
+        """Merge the statistics of <other> (same stages)"""
+
+        if self.stages != other.stages:
+            raise ValueError("StaStats:: cannot merge statistics of different stages")
+        self.arrival.merge(other.arrival)
+        self.slack.merge(other.slack)
+        self.min = np.minimum(self.min, other.min)
+        self.max = np.maximum(self.max, other.max)
+        self.sketch.merge(other.sketch)
+        self.files += other.files
+
+    def _shape(self, x):
+        return np.asarray(x).reshape(x.shape[:-1] + (len(self.stages), len(DIRECTIONS)))
+
+    @property
+    def count(self):
+        """(stage x direction) number of paths"""
+        return self._shape(self.arrival.count)
+
+    def mean(self):
+        """Returns the (stage x direction) mean data arrival time & slack"""
+
+        return self._shape(self.arrival.mean), self._shape(self.slack.mean)
+
+    def std(self):
+        """Returns the (stage x direction) standard deviation of the data arrival time & slack"""
+
+        return self._shape(self.arrival.std()), self._shape(self.slack.std())
+
+    def percentile(self, q=QUANTILES):
+        """Returns the (q x stage x direction) percentiles <q> (0..100) of the slack"""
+
+        return self._shape(self.sketch.quantile(np.asarray(q, dtype=float) / 100))
+
+    def extrema(self):
+        """Returns the (stage x direction) min & max slack (NaN without paths)"""
+
+        empty = self.arrival.count == 0
+        return (self._shape(np.where(empty, np.nan, self.min)), self._shape(np.where(empty, np.nan, self.max)))
+
+def _fold(files, stages, cache):
+    stats = StaStats(stages)
+    for f in files:
+        stats.fold(f, cache)
+    return stats
+
+def fold_files(files, stages=STAGES, n_jobs=1, cache=True):
+    """Returns the StaStats of timing csvs <files>, folded on <n_jobs> processes (0: one per cpu)"""
+
+    files = list(files)
+    if not files:
+        raise ValueError("fold_files:: no timing csv")
+
+    # One part of the files per process
+    n_jobs = render.workers(n_jobs, len(files))
+    parts  = [list(p) for p in np.array_split(np.array(files, dtype=object), n_jobs)]
+    stats  = StaStats(stages)
+    for s in render.pool_map(functools.partial(_fold, stages=stages, cache=cache), parts, n_jobs):
+        stats.merge(s)
+    return stats
+
+#-----------------------------------------------------------------------------
+# TABLES
+#-----------------------------------------------------------------------------
+def write_stats(stats, csv, q=QUANTILES, verbose=False):
+    """Write the (stage, direction) statistics of <stats> into <csv>"""
+
+    arr_m, slk_m = stats.mean()
+    arr_s, slk_s = stats.std()
+    lo, hi       = stats.extrema()
+    pct          = stats.percentile(q)
+    count        = stats.count
+
+    header = (['STAGE', 'DIRECTION', 'CHECK', 'PATHS', 'ARRIVAL MEAN', 'ARRIVAL STD', 'SLACK MEAN', 'SLACK STD',
+               'SLACK MIN'] + ['SLACK P{:g}'.format(p) for p in q] + ['SLACK MAX'])
+    lines  = [','.join(header)]
+    for s, stage in enumerate(stats.stages):
+        for d, dr in enumerate(DIRECTIONS):
+            if count[s, d] == 0:
+                continue
+            vals = [arr_m[s, d], arr_s[s, d], slk_m[s, d], slk_s[s, d], lo[s, d]] + list(pct[:, s, d]) + [hi[s, d]]
+            lines.append(','.join([stage, dr, 'setup' if d in SETUP else 'hold', str(count[s, d])] +
+                                  ['{:.4f}'.format(v) for v in vals]))
+    write_csv(csv, lines, verbose)
+    return csv
@@ -0,0 +1,140 @@
+#-----------------------------------------------------------------------------
+# Project : KeyV
+# File    : sweep.py
+# Author  : Mickael Fiorentino <mickael.fiorentino@polymtl.ca>
+# Lab     : GRM - Polytechnique Montreal
+# Date    : <2026-10-17 Sat>
+# Brief   : Design-space sweep of KeyRing (E, S, D) configurations
+#-----------------------------------------------------------------------------
+# Every valid (E, S, D) configuration (D x E == S) and delay element length
+# is a sweep point. Points are evaluated with the KeyRing timing model in a
+# process pool, and each result is written to the summary csv as soon as it
+# is available. Nothing but the current row is kept in memory.
+#
+# The timing model gives the click periods. Each of the E EUs retires one
+# instruction per period, hence a throughput of E / period. Area & power are
+# not modelled: they are taken from area_summary.csv & benchmarks_summary.csv
+# for the configurations that were synthesized (processor keyv<E><S><D>, with
+# the delay element length of sdc_keyv.tcl), and left empty (NaN) otherwise.
+# Rows are named keyv<E><S><D>-l<length>. Configurations with E, S or D above
+# 9 cannot be named with single digits: they are keyv<E>_<S>_<D> (e.g.
+# keyv1_11_11 & keyv11_11_1, instead of keyv11111 for both).
+#-----------------------------------------------------------------------------
+import os
+import functools
+import collections
+import numpy as np
+
+from . import table
+from . import benchmarks
+from .render import pool_map
+from .keyring import KeyRing
+
+Point = collections.namedtuple('Point', ['E', 'S', 'D', 'length'])
+
+# Delay elements & margins, as in sdc_keyv.tcl
+DE_SIZE = 20
+DE_MIN  = 0.1
+DE_MAX  = 0.1
+LENGTH  = DE_SIZE - 5
+LENGTHS = [LENGTH]
+MARGINS = (0.1, 0.1)
+
+PROCESSOR = 'keyv{E}{S}{D}'
+WIDE      = 'keyv{E}_{S}_{D}'
+NAME      = '{}-l{}'
+HEADER    = ['PROCESSOR', 'E', 'S', 'D', 'DE-LENGTH', 'PERIOD', 'THROUGHPUT', 'AREA', 'DMIPS-MW']
+
+def processor(E, S, D):
+    """Returns the processor name of configuration (<E>, <S>, <D>)"""
+
+    fmt = PROCESSOR if max(E, S, D) < 10 else WIDE
+    return fmt.format(E=E, S=S, D=D)
+
+def configs(max_e, max_s):
+    """Returns the valid (E, S, D) KeyRing configurations up to <max_e> x <max_s>"""
+
+    return [(E, S, S // E) for S in range(1, max_s + 1) for E in range(1, min(max_e, S) + 1)
+            if S % E == 0]
+
+def points(max_e, max_s, lengths=LENGTHS):
+    """Returns the sweep points: configurations x delay element lengths"""
+
+    return [Point(E, S, D, l) for E, S, D in configs(max_e, max_s) for l in lengths]
+
+def evaluate(point, de_size=DE_SIZE, de_min=DE_MIN, de_max=DE_MAX, margins=MARGINS):
+    """Returns the (period (ns), throughput (MIPS)) of <point>"""
+
+    kr = KeyRing(point.E, point.S, point.D)
+    kr.init_delays(de_size, de_min, de_max, [point.length] * point.S, margins)
+    period = kr.period.max()
+    return period, point.E / period * 1e3
+
+def measured(data):
+    """Returns {processor: (area (um2), dhrystone DMIPS/mW)} from the csv summaries in <data>"""
+
+    res = {}
+    area_f  = os.path.join(data, 'area_summary.csv')
+    bench_f = os.path.join(data, 'benchmarks_summary.csv')
+
+    if os.path.exists(area_f):
+        tab = table.load_table(area_f, labels=['PROCESSOR'])
+        for proc, area in zip(tab['PROCESSOR'], tab['TOTAL']):
+            res[proc] = (area, np.nan)
+
+    if os.path.exists(bench_f):
+        bench = benchmarks.load_benchmarks(bench_f)
+        if 'dhrystone' in bench.benchmarks:
+            eff = bench.score_pwr()[bench.bench('dhrystone')]
+            for proc, val in zip(bench.processors, eff):
+                res[proc] = (res.get(proc, (np.nan,))[0], val)
+    return res
+
+def run(pts, csv_f, meas=None, n_jobs=0, chunksize=32, **params):
+    """Evaluate <pts> on <n_jobs> processes (0: one per cpu), streaming rows into <csv_f>"""
+
+    meas = meas or {}
+    func = functools.partial(evaluate, **params)
+
+    tmp = '{}.{}.tmp'.format(csv_f, os.getpid())
+    os.makedirs(os.path.dirname(os.path.abspath(csv_f)), exist_ok=True)
+
+    try:
+        with open(tmp, 'w') as f:
+            f.write(','.join(HEADER) + '\n')
+
+            results = pool_map(func, pts, n_jobs, chunksize)
+            try:
+                for p, (period, thr) in zip(pts, results):
+                    # Only the synthesized delay element length was measured
+                    proc = processor(p.E, p.S, p.D)
+                    area, eff = meas.get(proc, (np.nan, np.nan)) if p.length == LENGTH else (np.nan, np.nan)
+                    f.write('{},{},{},{},{},{:.6e},{:.6e},{:.6e},{:.6e}\n'.format(
+                        NAME.format(proc, p.length), p.E, p.S, p.D, p.length, period, thr, area, eff))
+            finally:
+                results.close()
+
+        os.replace(tmp, csv_f)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    return csv_f
+
+def pareto(x, y):
+    """Returns the mask of points on the front minimizing <x> & maximizing <y>
+
+    Points with a NaN coordinate are never on the front."""
+
+    x, y  = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    valid = np.flatnonzero(~(np.isnan(x) | np.isnan(y)))
+    order = valid[np.lexsort((-y[valid], x[valid]))]
+
+    # On the front: strictly better than every point with a smaller x
+    ys    = y[order]
+    best  = np.maximum.accumulate(ys)
+    front = np.ones(len(order), dtype=bool)
+    front[1:] = ys[1:] > best[:-1]
+
+    mask = np.zeros(len(x), dtype=bool)
+    mask[order[front]] = True
+    return mask
@@ -0,0 +1,239 @@
+#-----------------------------------------------------------------------------
+# Project : KeyV
+# File    : synth.py
+# Author  : Mickael Fiorentino <mickael.fiorentino@polymtl.ca>
+# Lab     : GRM - Polytechnique Montreal
+# Date    : <2026-10-17 Sat>
+# Brief   : Synthetic csv summaries & DC/PrimeTime reports of any size
+#-----------------------------------------------------------------------------
+# Scale parameters:
+#   N : processors, named after CORES in turn (synv, ..., keyv661, synv-1...)
+#       so that modules & KeyRing configurations are those of a real core
+#   M : benchmarks (dhrystone, coremark, bench2...)
+#   K : KeyRing clicks of sta_summary.csv (E = K / 6 eus of 6 stages)
+#
+# Summaries have the columns written by data_parse.tcl, missing modules are
+# 'nan'. Reports follow the layout of the DC/PrimeTime reports read by
+# kvlib/parse, with <detail> lines of filler per module or path (cell
+# lists, path points) so that they are as long as real ones. Simulation
+# reports only exist for the benchmarks of parse/bench.py (the counters
+# addresses are benchmark specific), timing reports only for KeyV cores.
+#
+# Values are drawn from a seeded generator: same parameters, same files.
+#-----------------------------------------------------------------------------
+import os
+import numpy as np
+
+from .parse.cores import CORES, MODULES, KEYRINGS, AREA_RPT, PWR_RPT, SIM_RPT, STA_RPT, core_path
+from .parse.bench import BENCHMARKS, SIM_ADDR_CYCLE, SIM_ADDR_INST
+from .parse.sta import STAGES
+from .parse.scan import write_csv
+
+# Modules of the summaries (csv column suffixes), in data_parse.tcl order
+AREA_MODULES = ['IDECODE', 'PC', 'RF', 'ALU', 'LSU', 'SYS', 'PERF', 'RST-SYNC', 'PERF-SYNC',
+                'KEYRING', 'XBS', 'XU0', 'XU1', 'XU2', 'XU3', 'XU4', 'XU5']
+AREA_GLOBALS = ['CMB', 'BUF', 'SEQ', 'TOTAL']
+PWR_GLOBALS  = ['PWR-TOT', 'PWR-SEQ', 'PWR-REG', 'PWR-CT', 'PWR-CMB', 'PWR-INT', 'PWR-SWITCH', 'PWR-LEAK']
+
+# Module of a summary column -> instance of MODULES
+INSTANCES = {'IDECODE': 'idecode', 'PC': 'pc', 'RF': 'rf', 'ALU': 'alu', 'LSU': 'lsu', 'SYS': 'sys',
+             'PERF': 'perf', 'RST-SYNC': 'clock_and_reset', 'PERF-SYNC': 'cycle_sync',
+             'KEYRING': 'keyring', 'XBS': 'xbs', 'XU0': 'xu_0', 'XU1': 'xu_1', 'XU2': 'xu_2',
+             'XU3': 'xu_3', 'XU4': 'xu_4', 'XU5': 'xu_5'}
+
+PWR_GROUPS = ['io_pad', 'memory', 'black_box', 'clock_network', 'register', 'sequential', 'combinational']
+PWR_TOTALS = ['Cell Internal Power', 'Net Switching Power', 'Total Dynamic Power', 'Cell Leakage Power',
+              'Total Power']
+CELLS      = ['DFQD1', 'ND2D1', 'NR2D1', 'INVD1', 'AO22D1', 'OAI21D1', 'XOR2D1', 'MUX2D1', 'BUFFD2']
+
+def processor_names(n):
+    """Returns <n> processor names, after CORES in turn"""
+
+    return [c if i < len(CORES) else '{}-{}'.format(c, i // len(CORES))
+            for i, c in ((i, CORES[i % len(CORES)]) for i in range(n))]
+
+def base_core(proc):
+    """Returns the core of CORES a synthetic processor is named after"""
+
+    return proc.split('-')[0]
+
+def benchmark_names(m):
+    """Returns <m> benchmark names, BENCHMARKS first"""
+
+    return [BENCHMARKS[i] if i < len(BENCHMARKS) else 'bench{}'.format(i) for i in range(m)]
+
+def _fmt(row):
+    return ','.join('{:.6e}'.format(v) for v in row)
+
+#-----------------------------------------------------------------------------
+# SUMMARIES
+#-----------------------------------------------------------------------------
+def area_summary(csv, procs, rng):
+    """Write area_summary.csv of processors <procs>"""
+
+    mods = np.array([[INSTANCES[m] in MODULES[base_core(p)] for m in AREA_MODULES] for p in procs])
+    area = np.where(mods, rng.uniform(500, 8000, mods.shape), np.nan)
+    glob = rng.uniform(1e3, 5e3, (len(procs), len(AREA_GLOBALS)))
+    glob[:, 3] = np.nansum(area, axis=1) * rng.uniform(1.05, 1.2, len(procs))
+
+    lines = [','.join(['PROCESSOR'] + AREA_GLOBALS + ['AR-' + m for m in AREA_MODULES])]
+    lines += ['{},{}'.format(p, _fmt(row)) for p, row in zip(procs, np.hstack([glob, area]))]
+    write_csv(csv, lines, verbose=False)
+
+def benchmarks_summary(csv, procs, benches, rng):
+    """Write benchmarks_summary.csv of processors <procs> x benchmarks <benches>"""
+
+    mods = np.array([[INSTANCES[m] in MODULES[base_core(p)] for m in AREA_MODULES] for p in procs])
+    lines = [','.join(['PROCESSOR', 'BENCHMARK', 'PERIOD', 'CYCLES', 'INSTS'] + PWR_GLOBALS
+                      + ['PWR-' + m for m in AREA_MODULES])]
+    for b in benches:
+        insts  = rng.uniform(2e5, 2e6) * rng.uniform(0.95, 1.05, len(procs))
+        cycles = insts * rng.uniform(1.0, 1.6, len(procs))
+        period = rng.choice([2e-9, 2.5e-9, 4e-9], len(procs))
+        pwr    = np.where(mods, rng.uniform(1e-5, 1e-4, mods.shape), np.nan)
+        glob   = rng.uniform(1e-5, 5e-4, (len(procs), len(PWR_GLOBALS)))
+        glob[:, 0] = np.nansum(pwr, axis=1) * rng.uniform(1.05, 1.3, len(procs))
+        data   = np.column_stack([period, cycles, insts, glob, pwr])
+        lines += ['{},{},{}'.format(p, b, _fmt(row)) for p, row in zip(procs, data)]
+    write_csv(csv, lines, verbose=False)
+
+def sta_summary(csv, clicks, rng, paths=1):
+    """Write sta_summary.csv of a KeyRing of <clicks> clicks (6 stages, <paths> per direction)"""
+
+    S = len(STAGES)
+    E = max(clicks // S, 1)
+    D = 1
+    lines = ['LAUNCH,CAPTURE,SETUP DELAY,SETUP SLACK,HOLD DELAY,HOLD SLACK']
+    for e in range(E):
+        for s in range(S):
+            capture = '{}{}'.format(STAGES[s], e)
+            left    = '{}{}'.format(STAGES[(s - 1) % S], e)
+            up      = '{}{}'.format(STAGES[(s + D - 1) % S], (e - 1) % E)
+
+            # One group per path, in direction order (left, up, right, down), launched as in
+            # data_parse.tcl: left/down by the left parent, up/right by the up parent
+            parents = [left, up, up, left] * paths
+            vals    = rng.uniform(0.1, 2.0, (4 * paths, 4))
+            lines  += ['{},{},{:.2f},{:.2f},{:.2f},{:.2f}'.format(p, capture, *v) for p, v in zip(parents, vals)]
+    write_csv(csv, lines, verbose=False)
+
+#-----------------------------------------------------------------------------
+# REPORTS
+#-----------------------------------------------------------------------------
+def _filler(rng, prefix, n):
+    """Returns <n> cell lines of instance <prefix> (ignored by the parsers)"""
+
+    cells = rng.choice(CELLS, n)
+    vals  = rng.uniform(0.5, 20, n)
+    return ''.join('{}/U{} {:<12s} {:12.6f}\n'.format(prefix, i, c, v)
+                   for i, (c, v) in enumerate(zip(cells, vals)))
+
+def area_report(rpt, modules, rng, detail=50):
+    """Write a DC area report (report_area -hierarchy) of <modules>"""
+
+    area = rng.uniform(100, 9000, len(modules))
+    glob = rng.uniform(1e3, 9e4, 3)
+    out  = ['****************************************\nReport : area\nDesign : core\n',
+            '****************************************\n\n']
+    out += ['{:<33s} {:.6f}\n'.format(k + ':', v) for k, v in
+            zip(['Combinational area', 'Buf/Inv area', 'Noncombinational area'], glob)]
+    out += ['{:<33s} {:.6f}\n\n'.format('Total cell area:', glob.sum() + area.sum())]
+    out += ['Hierarchical area distribution\n\n']
+    out += ['u_{:<30s} {:10.4f} {:8.1f}\n'.format(m, a, 100 * a / area.sum()) for m, a in zip(modules, area)]
+    out += ['\nCell    Reference   Library   Area  Attributes\n']
+    for m, a in zip(modules, area):
+        out.append('u_{:<12s} {:<16s} {:12.6f}  h, n\n'.format(m, m + '_XLEN32', a))
+        out.append(_filler(rng, 'u_' + m, detail))
+    _write(rpt, out)
+
+def power_report(rpt, modules, rng, detail=50):
+    """Write a DC power report (report_power -hierarchy) of <modules>"""
+
+    out = ['Power Group  Internal Switching Leakage Total\n']
+    out += ['{:<16s} {:10.4e} {:10.4e} {:10.4e} {:10.4e} ({:5.2f}%)\n'.format(g, *rng.uniform(1e-3, 1, 4), 12.5)
+            for g in PWR_GROUPS]
+    out += ['\n'] + ['  {}  = {:10.4f} mW ({}%)\n'.format(k, rng.uniform(0.01, 5), 50) for k in PWR_TOTALS]
+    out += ['\nHierarchy   Int  Sw  Leak  Total  %\n']
+    for m in modules:
+        out.append('  u_{} ({}_XLEN32) {:10.4e} {:10.4e} {:10.4e} {:10.4e} {:5.1f}\n'.format(
+            m, m, *rng.uniform(1e-4, 1e-1, 4), 3.3))
+        out.append(_filler(rng, '    u_' + m, detail))
+    _write(rpt, out)
+
+def sim_report(rpt, bench, rng, words=32):
+    """Write the scratchpad memory dump of <bench> (vsim mem save)"""
+
+    cycles = int(rng.uniform(2e5, 2e6))
+    insts  = int(cycles / rng.uniform(1.0, 1.6))
+    mem   = rng.integers(0, 1 << 24, max(words, SIM_ADDR_CYCLE[bench] + 1, SIM_ADDR_INST[bench] + 1))
+    mem[SIM_ADDR_CYCLE[bench]], mem[SIM_ADDR_INST[bench]] = cycles, insts
+    out  = ['// memory data file (do not edit the following line - required for mem load use)\n',
+            '// format=hex addressradix=h dataradix=h version=1.0 wordsperline=1\n']
+    out += ['{:2x}: {:08x}\n'.format(a, w) for a, w in enumerate(mem)]
+    _write(rpt, out)
+
+def timing_report(rpt, keyring, rng, detail=20, paths=1):
+    """Write a PrimeTime report of KeyRing <keyring> (E, S, D): summary table & <paths> paths per clock pair"""
+
+    E, S, D = keyring
+    rows = []
+    for e in range(E):
+        for s in range(S):
+            for kind, d in [('setup', 'left'), ('setup', 'up'), ('hold', 'down'), ('hold', 'right')]:
+                rows.append('C_main_{}{}_{}_{}'.format(e, s, kind, d))
+
+    vals = rng.uniform(-0.5, 3, (len(rows), 2))
+    out  = ['-' * 100 + '\n| From | To | Delay | Slack | Period |\n' + '-' * 100 + '\n']
+    out += ['| {:<35s} | {:<35s} | {:<6.3f} | {:<6.3f} | {:<10s} |\n'.format(r + '_launch', r + '_capture', *v, '4.0')
+            for r, v in zip(rows, vals)]
+    out += ['-' * 100 + '\n\n']
+
+    # The worst path of each clock pair has the slack of the table
+    for r, (delay, slack) in zip(rows, vals):
+        ptype = 'max' if '_setup_' in r else 'min'
+        slk   = slack + np.concatenate([[0], rng.exponential(0.5, paths - 1)])
+        regs  = rng.integers(0, 512, (paths, 2))
+        for (i, j), sl in zip(regs, slk):
+            out.append('  Startpoint: u_core/u_keyring/r{}_reg (rising edge-triggered flip-flop clocked by {}_launch)\n'
+                       '  Endpoint: u_core/u_keyring/r{}_reg (rising edge-triggered flip-flop clocked by {}_capture)\n'
+                       '  Path Type: {}\n'.format(i, r, j, r, ptype))
+            incr = rng.uniform(0.01, 0.2, detail)
+            out += ['  u_core/u_keyring/n{} ({}) {:8.3f} {:8.3f} r\n'.format(k, c, d, t)
+                    for k, (c, d, t) in enumerate(zip(rng.choice(CELLS, detail), incr, np.cumsum(incr)))]
+            out.append('  data arrival time {0:8.3f}\n\n  data required time {1:8.3f}\n'
+                       '  data arrival time {2:8.3f}\n  slack ({3}) {4:8.3f}\n\n'.format(
+                           delay, delay + sl, -delay, 'MET' if sl >= 0 else 'VIOLATED', sl))
+    _write(rpt, out)
+
+def _write(fname, chunks):
+
+    os.makedirs(os.path.dirname(fname), exist_ok=True)
+    with open(fname, 'w') as f:
+        f.write(''.join(chunks))
+
+#-----------------------------------------------------------------------------
+# DATA DIRECTORY
+#-----------------------------------------------------------------------------
+def generate(data, n=4, m=2, k=36, paths=1, reports=True, detail=50, seed=0):
+    """Write the summaries (& reports) of <n> processors, <m> benchmarks, <k> clicks in <data>
+
+    Returns (processors, benchmarks)."""
+
+    rng     = np.random.default_rng(seed)
+    procs   = processor_names(n)
+    benches = benchmark_names(m)
+
+    area_summary(os.path.join(data, 'area_summary.csv'), procs, rng)
+    benchmarks_summary(os.path.join(data, 'benchmarks_summary.csv'), procs, benches, rng)
+    sta_summary(os.path.join(data, 'sta_summary.csv'), k, rng, paths)
+
+    if reports:
+        for p in procs:
+            core = base_core(p)
+            area_report(core_path(data, AREA_RPT, p), MODULES[core], rng, detail)
+            for b in [b for b in benches if b in BENCHMARKS]:
+                power_report(core_path(data, PWR_RPT, p).replace('<B>', b), MODULES[core], rng, detail)
+                sim_report(core_path(data, SIM_RPT, p).replace('<B>', b), b, rng)
+            if core in KEYRINGS:
+                timing_report(core_path(data, STA_RPT, p), KEYRINGS[core], rng, detail, paths)
+    return procs, benches
@@ -0,0 +1,143 @@
+#-----------------------------------------------------------------------------
+# Project : KeyV
+# File    : table.py
+# Author  : Mickael Fiorentino <mickael.fiorentino@polymtl.ca>
+# Lab     : GRM - Polytechnique Montreal
+# Date    : <2026-10-17 Sat>
+# Brief   : Typed csv summaries with an on-disk binary cache
+#-----------------------------------------------------------------------------
+# A csv summary (area_summary.csv, benchmarks_summary.csv, sta_summary.csv)
+# is parsed once into a Table: label columns (PROCESSOR, BENCHMARK, LAUNCH...)
+# are kept as strings, all the other columns are stored in a single 2-D float
+# array (column x row) and accessed by name.
+#
+# Parsed tables are cached in <dir>/.cache/<name>.npz, next to the csv file.
+# A cache entry is valid as long as the csv file mtime & size are unchanged.
+#-----------------------------------------------------------------------------
+import os
+import zipfile
+import numpy as np
+
+CACHE_DIR = '.cache'
+
+#-----------------------------------------------------------------------------
+# TABLE
+#-----------------------------------------------------------------------------
+class Table:
+    """Csv summary with named label (str) and numeric (float) columns"""
+
+    def __init__(self, names, data, labels):
+        self.names  = list(names)
+        self.data   = data
+        self.labels = labels
+        self.index  = {n: i for i, n in enumerate(self.names)}
+
+    def __len__(self):
+        return self.data.shape[1]
+
+    def __contains__(self, name):
+        return name in self.index or name in self.labels
+
+    def __getitem__(self, name):
+        if name in self.labels:
+            return self.labels[name]
+        try:
+            return self.data[self.index[name]]
+        except KeyError:
+            raise KeyError("Table:: column {} not found".format(name)) from None
+
+    def cols(self, names):
+        """Returns the 2-D array of numeric columns <names>"""
+        return self.data[[self.index[n] for n in names]]
+
+    def select(self, mask):
+        """Returns a new table restricted to the rows selected by <mask>"""
+        return Table(self.names, self.data[:, mask],
+                     {k: v[mask] for k, v in self.labels.items()})
+
+#-----------------------------------------------------------------------------
+# CSV PARSING
+#-----------------------------------------------------------------------------
+def parse_csv(csv_f, labels=()):
+    """Parse <csv_f> in a single pass, <labels> columns are kept as strings"""
+
+    with open(csv_f) as f:
+        head = [h.strip() for h in f.readline().split(',')]
+        rows = [l.rstrip('\n').split(',') for l in f if l.strip()]
+
+    for l in labels:
+        if l not in head:
+            raise ValueError("parse_csv:: column {} not found in {}".format(l, csv_f))
+
+    if rows:
+        cols = np.char.strip(np.array(rows, dtype=str).T)
+    else:
+        cols = np.empty((len(head), 0), dtype=str)
+
+    names = [h for h in head if h not in labels]
+    data  = cols[[head.index(n) for n in names]].astype(float)
+    ids   = {l: cols[head.index(l)] for l in labels}
+
+    return Table(names, data, ids)
+
+#-----------------------------------------------------------------------------
+# CACHE
+#-----------------------------------------------------------------------------
+def cache_path(csv_f):
+    """Returns the cache file associated with <csv_f>"""
+
+    csv_d, csv_n = os.path.split(os.path.abspath(csv_f))
+    return os.path.join(csv_d, CACHE_DIR, os.path.splitext(csv_n)[0] + '.npz')
+
+def _stamp(csv_f):
+    st = os.stat(csv_f)
+    return np.array([st.st_mtime_ns, st.st_size], dtype=np.int64)
+
+def _cache_read(cache_f, stamp, labels):
+
+    try:
+        with np.load(cache_f) as npz:
+            if not np.array_equal(npz['stamp'], stamp):
+                return None
+            if list(npz['labels']) != list(labels):
+                return None
+            ids = npz['ids']
+            return Table(npz['names'].tolist(), npz['data'],
+                         {l: ids[i] for i, l in enumerate(labels)})
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+        return None
+
+def cache_write(cache_f, write):
+    """Create cache file <cache_f> atomically: <write>(f) writes its content in binary file f"""
+
+    tmp = cache_f + '.{}.tmp'.format(os.getpid())
+    try:
+        os.makedirs(os.path.dirname(cache_f), exist_ok=True)
+        with open(tmp, 'wb') as f:
+            write(f)
+        os.replace(tmp, cache_f)
+    except OSError:
+        # The cache is an optimization only: a read-only data dir is fine
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+def _cache_write(cache_f, stamp, tab, labels):
+
+    ids = np.array([tab.labels[l] for l in labels], dtype=str).reshape(len(labels), len(tab))
+    cache_write(cache_f, lambda f: np.savez(f, stamp=stamp, labels=np.array(labels, dtype=str),
+                                            names=np.array(tab.names, dtype=str), data=tab.data, ids=ids))
+
+def load_table(csv_f, labels=(), cache=True):
+    """Load <csv_f> into a Table, using the binary cache if it is up-to-date"""
+
+    labels = list(labels)
+    if not cache:
+        return parse_csv(csv_f, labels)
+
+    stamp   = _stamp(csv_f)
+    cache_f = cache_path(csv_f)
+    tab     = _cache_read(cache_f, stamp, labels)
+    if tab is None:
+        tab = parse_csv(csv_f, labels)
+        _cache_write(cache_f, stamp, tab, labels)
+    return tab
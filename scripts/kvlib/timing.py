@@ -0,0 +1,156 @@
+#-----------------------------------------------------------------------------
+# Project : KeyV
+# File    : timing.py
+# Author  : Mickael Fiorentino <mickael.fiorentino@polymtl.ca>
+# Lab     : GRM - Polytechnique Montreal
+# Date    : <2026-10-17 Sat>
+# Brief   : Aggregation of KeyRing STA summaries (sta_summary.csv)
+#-----------------------------------------------------------------------------
+# Rows of sta_summary.csv come in groups of 4, one per direction of the
+# captured click (left, up, right, down). Clicks are labelled <stage><eu>
+# (e.g. F0, W12). Setup timing is relevant for left/up paths, hold timing
+# for right/down ones.
+#
+# Left/down paths are launched by the left parent of the click (same EU),
+# up/right paths by its up parent (previous EU), as written by
+# data_parse.tcl: rows that do not follow this layout are rejected.
+#
+# The rows are reshaped into dense (eu x stage x direction x path) arrays, E
+# and S being read from the labels (or checked against a KeyRing (E, S, D)
+# configuration). There is usually one path per (click, direction), but
+# reports with several paths per click are aggregated the same way.
+#-----------------------------------------------------------------------------
+import re
+import numpy as np
+from . import table
+from .parse.sta import STAGES
+
+DIRECTIONS = ['left', 'up', 'right', 'down']
+SETUP      = [0, 1]
+HOLD       = [2, 3]
+
+LABEL_RE = re.compile(r'([A-Za-z]+)([0-9]+)$')
+
+def parse_labels(labels, stages=STAGES):
+    """Returns the (eu, stage) indexes & the stage names of click <labels>"""
+
+    uniq, inv = np.unique(labels, return_inverse=True)
+    eu, stage = np.empty(len(uniq), dtype=int), []
+    for i, lbl in enumerate(uniq):
+        m = LABEL_RE.match(lbl)
+        if m is None:
+            raise ValueError("parse_labels:: invalid click label {}".format(lbl))
+        stage.append(m.group(1))
+        eu[i] = int(m.group(2))
+
+    # Known stages first (pipeline order), then others in alphabetical order
+    names = [s for s in stages if s in stage] + sorted(set(stage) - set(stages))
+    pos   = {s: i for i, s in enumerate(names)}
+    st    = np.array([pos[s] for s in stage], dtype=int)
+    inv   = inv.reshape(-1)
+    return eu[inv], st[inv], names
+
+#-----------------------------------------------------------------------------
+# STA SUMMARY
+#-----------------------------------------------------------------------------
+class StaSummary:
+    """STA summary as (eu x stage x direction x path) arrays"""
+
+    def __init__(self, tab, keyring=None, stages=STAGES):
+
+        n = len(tab)
+        if n == 0 or n % len(DIRECTIONS):
+            raise ValueError("StaSummary:: {} rows is not a multiple of {}".format(n, len(DIRECTIONS)))
+
+        eu, st, self.stages = parse_labels(tab['CAPTURE'], stages)
+        dr = np.tile(np.arange(len(DIRECTIONS)), n // len(DIRECTIONS))
+
+        # Each group of 4 rows is one captured click
+        group = (eu * len(self.stages) + st).reshape(-1, len(DIRECTIONS))
+        bad   = np.flatnonzero((group != group[:, :1]).any(axis=1))
+        if len(bad):
+            row = bad[0] * len(DIRECTIONS)
+            raise ValueError("StaSummary:: rows {}-{} do not capture a single click ({})".format(
+                row + 1, row + len(DIRECTIONS), ', '.join(tab['CAPTURE'][row:row + len(DIRECTIONS)])))
+
+        self.E = int(eu.max()) + 1
+        self.S = len(self.stages)
+        if keyring is not None and (keyring[0], keyring[1]) != (self.E, self.S):
+            raise ValueError("StaSummary:: data is a {}x{} KeyRing, expected {}x{}".format(
+                self.E, self.S, keyring[0], keyring[1]))
+        self._check_launch(tab['LAUNCH'], eu, st, dr, keyring)
+
+        # Dense layout: every (eu, stage, direction) cell must hold the same number of paths
+        cells = (eu * self.S + st) * len(DIRECTIONS) + dr
+        count = np.bincount(cells, minlength=self.E * self.S * len(DIRECTIONS))
+        if count.min() != count.max():
+            raise ValueError("StaSummary:: missing paths (between {} and {} per click & direction)".format(
+                count.min(), count.max()))
+        self.P = int(count[0])
+
+        order = np.argsort(cells, kind='stable')
+        shape = (self.E, self.S, len(DIRECTIONS), self.P)
+
+        # Setup timing for left/up paths, hold timing for right/down paths
+        setup = (dr < 2)
+        delay = np.where(setup, tab['SETUP DELAY'], tab['HOLD DELAY'])[order].reshape(shape)
+        slack = np.where(setup, tab['SETUP SLACK'], tab['HOLD SLACK'])[order].reshape(shape)
+
+        # Unconstrained paths (no delay) are left out
+        self.valid   = delay > 0
+        self.arrival = np.where(self.valid, delay - slack, 0)
+        self.slack   = np.where(self.valid, slack, 0)
+
+    def _check_launch(self, launch, eu, st, dr, keyring):
+        """Check that rows are launched by the parents of their direction (see data_parse.tcl)
+
+        Left/down paths are launched by the left parent (same EU, previous stage),
+        up/right paths by the up parent (previous EU, stage shifted by D - 1). D
+        is read from the first up row, unless a KeyRing configuration is given."""
+
+        le, ls, names = parse_labels(launch, self.stages)
+        unknown = set(names) - set(self.stages)
+        if unknown:
+            raise ValueError("StaSummary:: unknown launch stages {}".format(', '.join(sorted(unknown))))
+        ls = np.array([self.stages.index(s) for s in names])[ls]
+
+        up = (dr == 1) | (dr == 2)
+        if keyring is not None:
+            D = keyring[2]
+        else:
+            D = int(ls[dr == 1][0] - st[dr == 1][0] + 1)
+
+        exp_e = np.where(up, (eu - 1) % self.E, eu)
+        exp_s = np.where(up, st + D - 1, st - 1) % self.S
+        bad   = np.flatnonzero((le != exp_e) | (ls != exp_s))
+        if len(bad):
+            r = bad[0]
+            raise ValueError("StaSummary:: row {} ({}) launches {} from {}, expected {}{}".format(
+                r + 1, DIRECTIONS[dr[r]], self.labels[eu[r], st[r]], launch[r],
+                self.stages[exp_s[r]], exp_e[r]))
+
+    @property
+    def labels(self):
+        """Click labels, as a (eu x stage) array"""
+
+        return np.array([['{}{}'.format(s, e) for s in self.stages] for e in range(self.E)])
+
+    def mean(self):
+        """Returns the (stage x direction) mean data arrival time & slack"""
+
+        return self.arrival.mean(axis=(0, 3)), self.slack.mean(axis=(0, 3))
+
+    def std(self):
+        """Returns the (stage x direction) standard deviation of the required time"""
+
+        return (self.arrival + self.slack).std(axis=(0, 3))
+
+    def percentile(self, q):
+        """Returns the (q x stage x direction) percentiles <q> of the required time"""
+
+        return np.percentile(self.arrival + self.slack, q, axis=(0, 3))
+
+def load_sta(csv_f, keyring=None, stages=STAGES, cache=True):
+    """Load <csv_f> (sta_summary.csv) into a StaSummary"""
+
+    return StaSummary(table.load_table(csv_f, labels=['LAUNCH', 'CAPTURE'], cache=cache), keyring, stages)
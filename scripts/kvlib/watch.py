@@ -0,0 +1,103 @@
+#-----------------------------------------------------------------------------
+# Project : KeyV
+# File    : watch.py
+# Author  : Mickael Fiorentino <mickael.fiorentino@polymtl.ca>
+# Lab     : GRM - Polytechnique Montreal
+# Date    : <2026-10-17 Sat>
+# Brief   : File watcher (debounced polling) & status file of long-running jobs
+#-----------------------------------------------------------------------------
+# Watched files are given as glob patterns, expanded at every poll so that
+# new files are seen too. A file changed if it appeared, disappeared, or if
+# its (mtime, size) changed. Polling only costs one stat per file: there are
+# a few dozen reports & summaries, and it works on NFS where inotify does not.
+#
+# Reports are written in bursts (a DC run writes area, power & timing
+# reports in a row): changes are only returned once no file changed for
+# <debounce> seconds, or after <max_delay> seconds if writes never stop.
+#
+# The status file is a small json document replaced atomically, so that a
+# dashboard polling it never reads a partial one.
+#-----------------------------------------------------------------------------
+import os
+import glob
+import json
+import time
+
+#-----------------------------------------------------------------------------
+# WATCHER
+#-----------------------------------------------------------------------------
+class Watcher:
+    """Debounced polling of the files matching glob <patterns>"""
+
+    def __init__(self, patterns, interval=1.0, debounce=2.0, max_delay=30.0):
+
+        self.patterns  = list(patterns)
+        self.interval  = interval
+        self.debounce  = debounce
+        self.max_delay = max_delay
+        self.state     = self.scan()
+
+    def scan(self):
+        """Returns {path: (mtime_ns, size)} of the watched files"""
+
+        state = {}
+        for p in self.patterns:
+            for f in glob.glob(p):
+                try:
+                    st = os.stat(f)
+                except OSError:
+                    continue
+                state[f] = (st.st_mtime_ns, st.st_size)
+        return state
+
+    def poll(self):
+        """Returns the files that changed since the last poll"""
+
+        state   = self.scan()
+        changed = {f for f in state.keys() | self.state.keys() if state.get(f) != self.state.get(f)}
+        self.state = state
+        return changed
+
+    def wait(self, timeout=None):
+        """Wait for changes, returns the set of changed files once they settle
+
+        Returns an empty set after <timeout> seconds without any change."""
+
+        changed = set()
+        start   = time.monotonic()
+        first   = last = None
+        while True:
+            time.sleep(self.interval)
+            now = time.monotonic()
+            new = self.poll()
+            if new:
+                changed |= new
+                first = first or now
+                last  = now
+            if changed and (now - last >= self.debounce or now - first >= self.max_delay):
+                return changed
+            if not changed and timeout is not None and now - start >= timeout:
+                return changed
+
+#-----------------------------------------------------------------------------
+# STATUS
+#-----------------------------------------------------------------------------
+def write_status(fname, status):
+    """Atomically replace <fname> with json <status> (pid & update time added)"""
+
+    status = dict(status, pid=os.getpid(), updated=time.time(),
+                  updated_str=time.strftime('%Y-%m-%d %H:%M:%S'))
+    tmp = fname + '.{}.tmp'.format(os.getpid())
+    os.makedirs(os.path.dirname(os.path.abspath(fname)), exist_ok=True)
+    with open(tmp, 'w') as f:
+        json.dump(status, f, indent=1)
+    os.replace(tmp, fname)
+
+def read_status(fname):
+    """Returns the status in <fname>, None if there is none"""
+
+    try:
+        with open(fname) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None